@@ -1,12 +1,16 @@
 #!/usr/bin/python3
 """Amenity model."""
 
+import sys
+
 from .base import BaseModel
 
 
 class Amenity(BaseModel):
     """Represents an amenity (e.g., Wi-Fi, Parking)."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str, **kwargs):
         super().__init__(**kwargs)
         self.name = self._validate_name(name)
@@ -15,7 +19,8 @@ class Amenity(BaseModel):
     def _validate_name(name: str) -> str:
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string")
-        return name.strip()
+        # Amenity names repeat across many places: share one string object.
+        return sys.intern(name.strip())
 
     def rename(self, new_name: str) -> None:
         self.name = self._validate_name(new_name)
@@ -1,15 +1,45 @@
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _utc_micros():
+    """Current UTC time as integer microseconds since the epoch."""
+    return time.time_ns() // 1000
+
 
 class BaseModel:
+    # Slots instead of a per-instance __dict__, and timestamps kept as ints:
+    # a datetime costs 48 bytes, a microsecond int 32 (and both timestamps
+    # share one int until the object is first saved).
+    __slots__ = ("id", "_created_us", "_updated_us")
+
     def __init__(self):
         self.id = str(uuid.uuid4())
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self._created_us = self._updated_us = _utc_micros()
+
+    @property
+    def created_at(self):
+        return _EPOCH + self._created_us * _MICROSECOND
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_us = (value - _EPOCH) // _MICROSECOND
+
+    @property
+    def updated_at(self):
+        return _EPOCH + self._updated_us * _MICROSECOND
+
+    @updated_at.setter
+    def updated_at(self, value):
+        self._updated_us = (value - _EPOCH) // _MICROSECOND
 
     def save(self):
         """Update updated_at timestamp"""
-        self.updated_at = datetime.utcnow()
+        self._updated_us = _utc_micros()
 
     def update(self, data: dict):
         """Update attributes and save"""
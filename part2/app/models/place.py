@@ -1,6 +1,11 @@
 from app.models.base import BaseModel
 
 class Place(BaseModel):
+    __slots__ = (
+        "title", "description", "price", "latitude", "longitude",
+        "owner", "reviews", "amenities",
+    )
+
     def __init__(self, title, price, latitude, longitude, owner, description=None):
         super().__init__()
 
@@ -1,6 +1,8 @@
 from app.models.base import BaseModel
 
 class Review(BaseModel):
+    __slots__ = ("text", "rating", "user", "place")
+
     def __init__(self, text, rating, user, place):
         super().__init__()
 
@@ -11,6 +11,11 @@ _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 class User(BaseModel):
     """Represents a system user."""
 
+    __slots__ = (
+        "first_name", "last_name", "email", "password_hash", "is_admin",
+        "place_ids", "review_ids",
+    )
+
     def __init__(
         self,
         first_name: str,
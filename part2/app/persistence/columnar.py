@@ -0,0 +1,209 @@
+"""Columnar side store for places: vectorised filtering and ranking.
+
+PlaceColumns keeps price, latitude, longitude and rating aggregates in
+contiguous NumPy arrays, one row per place. It subscribes to the place and
+review repositories, so it follows every add, update and delete, and
+answers range, bounding-box and top-k queries with array operations
+instead of a Python loop over Place objects.
+
+NumPy is an optional dependency; PlaceColumns raises RuntimeError without it.
+"""
+
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+_SORT_COLUMNS = ("price", "latitude", "longitude", "rating")
+
+
+class PlaceColumns:
+    """Arrays aligned to place ids, kept in sync with the repositories."""
+
+    def __init__(self, place_repo, review_repo=None, capacity=1024):
+        if np is None:
+            raise RuntimeError("PlaceColumns requires numpy (pip install numpy)")
+        self._place_repo = place_repo
+        self._review_repo = review_repo
+        self._lock = threading.Lock()
+        self._ids = []          # row -> place id (None for a free row)
+        self._rows = {}         # place id -> row
+        self._free = []
+        # review id -> (place id, rating) it contributed, also for a place
+        # not added yet: its row starts from them when it is.
+        self._contributions = {}
+        self._reviews_by_place = {}
+        self._allocate(capacity)
+
+        for place in place_repo.get_all():
+            self.on_add(place_repo, place)
+        place_repo.subscribe(self)
+        if review_repo is not None:
+            for review in review_repo.get_all():
+                self.on_add(review_repo, review)
+            review_repo.subscribe(self)
+
+    def _allocate(self, capacity):
+        self.price = np.full(capacity, np.nan)
+        self.latitude = np.full(capacity, np.nan)
+        self.longitude = np.full(capacity, np.nan)
+        self.rating_sum = np.zeros(capacity, dtype=np.int64)
+        self.rating_count = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        old = (self.price, self.latitude, self.longitude,
+               self.rating_sum, self.rating_count, self.alive)
+        self._allocate(len(self.alive) * 2)
+        for new, prev in zip((self.price, self.latitude, self.longitude,
+                              self.rating_sum, self.rating_count, self.alive), old):
+            new[:len(prev)] = prev
+
+    def __len__(self):
+        return len(self._rows)
+
+    # -------------------------
+    # Repository listener
+    # -------------------------
+    @staticmethod
+    def _as_float(value):
+        return np.nan if value is None else float(value)
+
+    def _write_place(self, row, place):
+        self.price[row] = self._as_float(getattr(place, "price", None))
+        self.latitude[row] = self._as_float(getattr(place, "latitude", None))
+        self.longitude[row] = self._as_float(getattr(place, "longitude", None))
+
+    def _add_rating(self, review_id, review):
+        place = getattr(review, "place", None)
+        rating = getattr(review, "rating", None)
+        place_id = getattr(place, "id", None)
+        if place_id is None or rating is None:
+            return
+        self._contributions[review_id] = (place_id, rating)
+        self._reviews_by_place.setdefault(place_id, set()).add(review_id)
+        row = self._rows.get(place_id)
+        if row is not None:
+            self.rating_sum[row] += rating
+            self.rating_count[row] += 1
+
+    def _remove_rating(self, review_id):
+        place_id, rating = self._contributions.pop(review_id, (None, None))
+        if place_id is not None:
+            self._reviews_by_place[place_id].discard(review_id)
+        row = self._rows.get(place_id)
+        if row is not None:
+            self.rating_sum[row] -= rating
+            self.rating_count[row] -= 1
+
+    def on_add(self, repo, obj):
+        with self._lock:
+            if repo is self._review_repo:
+                self._remove_rating(obj.id)
+                self._add_rating(obj.id, obj)
+                return
+            row = self._rows.get(obj.id)
+            if row is None:
+                if self._free:
+                    row = self._free.pop()
+                    self._ids[row] = obj.id
+                else:
+                    row = len(self._ids)
+                    if row == len(self.alive):
+                        self._grow()
+                    self._ids.append(obj.id)
+                self._rows[obj.id] = row
+                ratings = [self._contributions[review_id][1]
+                           for review_id in self._reviews_by_place.get(obj.id, ())]
+                self.rating_sum[row] = sum(ratings)
+                self.rating_count[row] = len(ratings)
+            self._write_place(row, obj)
+            self.alive[row] = True
+
+    def on_update(self, repo, obj, data):
+        with self._lock:
+            if repo is self._review_repo:
+                self._remove_rating(obj.id)
+                self._add_rating(obj.id, obj)
+            elif obj.id in self._rows:
+                self._write_place(self._rows[obj.id], obj)
+
+    def on_delete(self, repo, obj):
+        with self._lock:
+            if repo is self._review_repo:
+                self._remove_rating(obj.id)
+                return
+            row = self._rows.pop(obj.id, None)
+            if row is None:
+                return
+            self.alive[row] = False
+            self._ids[row] = None
+            self._free.append(row)
+            # Ratings of the deleted place's reviews no longer count anywhere.
+            for review_id in self._reviews_by_place.pop(obj.id, ()):
+                del self._contributions[review_id]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def _avg_rating(self, n):
+        counts = self.rating_count[:n]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, self.rating_sum[:n] / counts, np.nan)
+
+    def select(self, min_price=None, max_price=None, bbox=None, min_rating=None,
+               order_by=None, limit=None):
+        """Return matching place ids.
+
+        bbox: (min_lat, min_lon, max_lat, max_lon), inclusive.
+        order_by: "price", "latitude", "longitude" or "rating", with a
+            leading "-" for descending. Places lacking the value sort last.
+        limit: with order_by this is a top-k query (argpartition, not a
+            full sort).
+        """
+        with self._lock:
+            n = len(self._ids)
+            mask = self.alive[:n].copy()
+            price = self.price[:n]
+            if min_price is not None:
+                mask &= price >= min_price
+            if max_price is not None:
+                mask &= price <= max_price
+            if bbox is not None:
+                min_lat, min_lon, max_lat, max_lon = bbox
+                lat, lon = self.latitude[:n], self.longitude[:n]
+                mask &= (lat >= min_lat) & (lat <= max_lat)
+                mask &= (lon >= min_lon) & (lon <= max_lon)
+            avg = None
+            if min_rating is not None:
+                avg = self._avg_rating(n)
+                mask &= avg >= min_rating
+            rows = np.flatnonzero(mask)
+
+            if order_by:
+                attr = order_by.lstrip("-")
+                if attr not in _SORT_COLUMNS:
+                    raise ValueError(f"Cannot order places by '{attr}'")
+                if attr == "rating":
+                    values = (avg if avg is not None else self._avg_rating(n))[rows]
+                else:
+                    values = getattr(self, attr)[rows]
+                # Sort ascending on a key where missing values (NaN) sort last.
+                key = -values if order_by.startswith("-") else values.copy()
+                key[np.isnan(key)] = np.inf
+                if limit is not None and limit < len(rows):
+                    part = np.argpartition(key, limit)[:limit]
+                    rows = rows[part[np.argsort(key[part], kind="stable")]]
+                else:
+                    rows = rows[np.argsort(key, kind="stable")]
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._ids[row] for row in rows]
+
+    def avg_rating(self, place_id):
+        row = self._rows.get(place_id)
+        if row is None or not self.rating_count[row]:
+            return None
+        return float(self.rating_sum[row] / self.rating_count[row])
@@ -0,0 +1,72 @@
+"""Thread-safe InMemoryRepository for multi-threaded WSGI servers."""
+
+from app.persistence.locks import ReadWriteLock
+from app.persistence.query import Query
+from app.persistence.repository import InMemoryRepository
+
+
+class LockedQuery(Query):
+    """Query that runs under the repository's read lock."""
+
+    def explain(self):
+        with self._repo._lock.read_locked():
+            return super().explain()
+
+    def all(self):
+        with self._repo._lock.read_locked():
+            return super().all()
+
+
+class ConcurrentInMemoryRepository(InMemoryRepository):
+    """InMemoryRepository guarded by a reader-writer lock.
+
+    Reads (get, get_all, get_by_attribute, find/query) share the lock and
+    never block each other; add, update, delete and reindex are exclusive.
+    update applies all fields and index changes before any reader can look,
+    so readers going through the repository never see a half-updated
+    object. Code holding a reference returned by get() reads it without
+    the lock; use get_fields() for a consistent multi-attribute read.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = ReadWriteLock()
+
+    def add(self, obj):
+        with self._lock.write_locked():
+            return super().add(obj)
+
+    def get(self, obj_id):
+        with self._lock.read_locked():
+            return super().get(obj_id)
+
+    def get_fields(self, obj_id, *attr_names):
+        """Read several attributes of one object atomically, as a dict."""
+        with self._lock.read_locked():
+            obj = self._data.get(obj_id)
+            if obj is None:
+                return None
+            return {name: getattr(obj, name, None) for name in attr_names}
+
+    def get_all(self):
+        with self._lock.read_locked():
+            return super().get_all()
+
+    def update(self, obj_id, data):
+        with self._lock.write_locked():
+            return super().update(obj_id, data)
+
+    def reindex(self, obj_id):
+        with self._lock.write_locked():
+            return super().reindex(obj_id)
+
+    def delete(self, obj_id):
+        with self._lock.write_locked():
+            return super().delete(obj_id)
+
+    def get_by_attribute(self, attr_name, attr_value):
+        with self._lock.read_locked():
+            return super().get_by_attribute(attr_name, attr_value)
+
+    def query(self):
+        return LockedQuery(self)
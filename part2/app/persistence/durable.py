@@ -0,0 +1,339 @@
+"""Opt-in durability for InMemoryRepository: append-only log plus snapshots.
+
+Layout of the data directory:
+
+    wal-00000007.log       log segments, one pickled record per frame
+    snapshot-00000007.pkl  full state as of the start of wal-00000007.log
+
+Every add, update and delete on an attached repository is appended to the
+current log segment. Objects changed in place (place.add_review(), edits
+after get()) are only logged once repo.reindex(obj_id) reports them. Segments are rotated once they grow past
+segment_bytes. A background thread folds closed segments into a new
+snapshot by replaying them on top of the previous snapshot, off to the
+side, so it never pickles live objects that request threads are mutating.
+
+On open() the latest snapshot is loaded through a memory map and only the
+segments written after it are replayed.
+
+Records reference other repository objects (place.owner, review.user, ...)
+by id, so replay re-links them to the same instances the snapshot holds.
+Files are pickles: only point DurableStore at a directory you trust.
+"""
+
+import io
+import mmap
+import os
+import pickle
+import re
+import struct
+import threading
+import zlib
+
+_FRAME = struct.Struct("<II")  # payload length, crc32
+_SEGMENT_RE = re.compile(r"^(wal|snapshot)-(\d{8})\.(log|pkl)$")
+
+
+class CorruptLogError(Exception):
+    """A log segment other than the last one has a damaged frame."""
+
+
+class _RecordPickler(pickle.Pickler):
+    """Pickles a record, writing repository objects other than root as refs."""
+
+    def __init__(self, file, store, root=None):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store = store
+        self._root = root
+
+    def persistent_id(self, obj):
+        if obj is self._root:
+            return None
+        obj_id = getattr(obj, "id", None)
+        if isinstance(obj_id, str) and self._store._is_stored(obj_id, obj):
+            return obj_id
+        return None
+
+
+class _RecordUnpickler(pickle.Unpickler):
+    def __init__(self, file, objects):
+        super().__init__(file)
+        self._objects = objects
+
+    def persistent_load(self, obj_id):
+        # A reference to an object deleted since the record was written
+        # resolves to None, the same as a dangling reference would in memory.
+        return self._objects.get(obj_id)
+
+
+def _segment_path(directory, kind, number):
+    ext = "log" if kind == "wal" else "pkl"
+    return os.path.join(directory, f"{kind}-{number:08d}.{ext}")
+
+
+def _fsync_dir(directory):
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _assign_state(dst, src):
+    """Copy src's attributes onto dst, for dict-based and slotted objects."""
+    if hasattr(src, "__dict__"):
+        vars(dst).update(vars(src))
+    for cls in type(src).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(src, name):
+                setattr(dst, name, getattr(src, name))
+
+
+class _State:
+    """Replay target: {repo_name: {obj_id: obj}} plus a global id map."""
+
+    def __init__(self, repos=None):
+        self.repos = repos or {}
+        self.objects = {}
+        for data in self.repos.values():
+            self.objects.update(data)
+
+    def apply(self, op, repo_name, payload):
+        data = self.repos.setdefault(repo_name, {})
+        if op == "add":
+            existing = self.objects.get(payload.id)
+            if existing is not None and type(existing) is type(payload):
+                # Re-adding an object must not orphan references to it.
+                _assign_state(existing, payload)
+                payload = existing
+            data[payload.id] = payload
+            self.objects[payload.id] = payload
+        elif op == "update":
+            obj_id, changes = payload
+            obj = data.get(obj_id)
+            if obj is not None:
+                for k, v in changes.items():
+                    setattr(obj, k, v)
+        elif op == "delete":
+            data.pop(payload, None)
+            self.objects.pop(payload, None)
+
+
+class DurableStore:
+    """Persists a set of named repositories to a directory.
+
+        store = DurableStore("data/")
+        store.attach("users", user_repo)
+        store.open()       # loads previous state into the repositories
+        ...
+        store.close()
+
+    fsync: fsync every record (survives power loss) instead of only
+        flushing it to the OS (survives a process crash).
+    segment_bytes: size after which the current log segment is closed.
+    compact_interval: seconds between background compaction checks; None
+        disables the thread (call compact() yourself).
+    """
+
+    def __init__(self, directory, fsync=False, segment_bytes=64 * 1024 * 1024,
+                 compact_interval=60.0):
+        self.directory = directory
+        self.fsync = fsync
+        self.segment_bytes = segment_bytes
+        self.compact_interval = compact_interval
+        self._repos = {}
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._log = None
+        self._segment = None
+
+    # -------------------------
+    # Setup / teardown
+    # -------------------------
+    def attach(self, name, repo):
+        if self._log is not None:
+            raise RuntimeError("attach repositories before open()")
+        self._repos[name] = repo
+
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot, segments = self._scan()
+        state = self._load(snapshot, segments, truncate_tail=True)
+        for name, repo in self._repos.items():
+            for obj in state.repos.get(name, {}).values():
+                repo.add(obj)
+        last = max([snapshot or 0] + segments)
+        self._start_segment(last + 1)
+        for repo in self._repos.values():
+            repo.subscribe(self)
+        if self.compact_interval:
+            self._thread = threading.Thread(
+                target=self._compact_loop, name="durable-store-compactor", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for repo in self._repos.values():
+            repo.unsubscribe(self)
+        with self._lock:
+            if self._log is not None:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._log.close()
+                self._log = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------
+    # Repository listener
+    # -------------------------
+    def _name_of(self, repo):
+        for name, attached in self._repos.items():
+            if attached is repo:
+                return name
+        raise KeyError("repository is not attached to this store")
+
+    def _is_stored(self, obj_id, obj):
+        return any(repo._data.get(obj_id) is obj for repo in self._repos.values())
+
+    def on_add(self, repo, obj):
+        self._append("add", self._name_of(repo), obj, root=obj)
+
+    def on_update(self, repo, obj, data):
+        self._append("update", self._name_of(repo), (obj.id, dict(data)))
+
+    def on_delete(self, repo, obj):
+        self._append("delete", self._name_of(repo), obj.id)
+
+    def _append(self, op, repo_name, payload, root=None):
+        buf = io.BytesIO()
+        _RecordPickler(buf, self, root=root).dump((op, repo_name, payload))
+        body = buf.getvalue()
+        frame = _FRAME.pack(len(body), zlib.crc32(body)) + body
+        with self._lock:
+            self._log.write(frame)
+            self._log.flush()
+            if self.fsync:
+                os.fsync(self._log.fileno())
+            if self._log.tell() >= self.segment_bytes:
+                self._rotate()
+
+    # -------------------------
+    # Segments
+    # -------------------------
+    def _scan(self):
+        """Return (latest snapshot number or None, wal numbers after it)."""
+        snapshots, wals = [], []
+        for entry in os.listdir(self.directory):
+            match = _SEGMENT_RE.match(entry)
+            if match:
+                (snapshots if match.group(1) == "snapshot" else wals).append(int(match.group(2)))
+        snapshot = max(snapshots) if snapshots else None
+        floor = snapshot or 0
+        return snapshot, sorted(n for n in wals if n >= floor)
+
+    def _start_segment(self, number):
+        self._segment = number
+        self._log = open(_segment_path(self.directory, "wal", number), "ab")
+        _fsync_dir(self.directory)
+
+    def _rotate(self):
+        """Close the current segment and start the next one (holds _lock)."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._log.close()
+        self._start_segment(self._segment + 1)
+
+    # -------------------------
+    # Loading / replay
+    # -------------------------
+    def _load(self, snapshot, segments, truncate_tail=False):
+        state = _State(self._read_snapshot(snapshot) if snapshot else {})
+        for i, number in enumerate(segments):
+            last = truncate_tail and i == len(segments) - 1
+            self._replay(_segment_path(self.directory, "wal", number), state, last)
+        return state
+
+    def _read_snapshot(self, number):
+        path = _segment_path(self.directory, "snapshot", number)
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return {}
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)["repos"]
+
+    def _replay(self, path, state, is_last):
+        with open(path, "rb") as fh:
+            data = fh.read()
+        offset = 0
+        view = memoryview(data)
+        while offset < len(data):
+            header_end = offset + _FRAME.size
+            if header_end <= len(data):
+                length, crc = _FRAME.unpack_from(data, offset)
+                body = view[header_end:header_end + length]
+                if len(body) == length and zlib.crc32(body) == crc:
+                    op, repo_name, payload = _RecordUnpickler(
+                        io.BytesIO(body), state.objects
+                    ).load()
+                    state.apply(op, repo_name, payload)
+                    offset = header_end + length
+                    continue
+            if not is_last:
+                raise CorruptLogError(f"{path}: damaged record at byte {offset}")
+            # A torn write at the end of the newest segment: drop it.
+            with open(path, "r+b") as fh:
+                fh.truncate(offset)
+            break
+
+    # -------------------------
+    # Compaction
+    # -------------------------
+    def compact(self):
+        """Close the current segment and fold all closed ones into a snapshot."""
+        with self._lock:
+            if self._log is not None and self._log.tell():
+                self._rotate()
+        self._compact_closed()
+
+    def _compact_closed(self):
+        with self._compact_lock:
+            with self._lock:
+                current = self._segment
+            snapshot, segments = self._scan()
+            closed = [n for n in segments if current is None or n < current]
+            if not closed:
+                return False
+            state = self._load(snapshot, closed)
+            target = closed[-1] + 1
+            path = _segment_path(self.directory, "snapshot", target)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as fh:
+                pickle.dump({"segment": target, "repos": state.repos}, fh,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, path)
+            _fsync_dir(self.directory)
+            if snapshot is not None:
+                os.remove(_segment_path(self.directory, "snapshot", snapshot))
+            for number in closed:
+                os.remove(_segment_path(self.directory, "wal", number))
+            return True
+
+    def _compact_loop(self):
+        while not self._stop.wait(self.compact_interval):
+            self._compact_closed()
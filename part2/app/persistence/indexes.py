@@ -0,0 +1,240 @@
+"""Secondary indexes used by InMemoryRepository.
+
+Every index exposes the same small protocol so the repository can keep
+them in sync without knowing their type:
+
+    key_for(obj)          value(s) the object is indexed under
+    check(obj_id, key)    raise ValueError if the key is not allowed
+    add(obj_id, key)      / remove(obj_id, key)
+    plan(conditions)      candidate ids for a query, or None (see query.py)
+"""
+
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+_RANGE_OPS = ("eq", "lt", "lte", "gt", "gte", "between")
+
+# Sorted entries are (value is None, value, obj_id) so None values never get
+# compared with real ones and collect at the end of the index.
+_value_key = itemgetter(0, 1)
+
+
+class IndexPlan:
+    """Candidate ids an index can produce for a query.
+
+    order_attr is set when iter_ids() yields ids sorted by that attribute.
+    """
+
+    def __init__(self, index, kind, iter_ids, count, order_attr=None):
+        self.index = index
+        self.kind = kind
+        self.iter_ids = iter_ids
+        self.count = count
+        self.order_attr = order_attr
+
+
+class HashIndex:
+    """Maps an attribute value to the ids of the objects holding it.
+
+    Buckets are dicts used as ordered sets so lookups return objects in
+    insertion order, the same order a full scan of the repository would.
+    """
+
+    def __init__(self, attr_name, unique=False):
+        self.attr_name = attr_name
+        self.name = attr_name
+        self.unique = unique
+        self._buckets = {}
+
+    def key_for(self, obj):
+        return getattr(obj, self.attr_name, None)
+
+    def check(self, obj_id, key):
+        """Raise ValueError if adding key for obj_id would break uniqueness."""
+        if not self.unique or key is None:
+            return
+        bucket = self._buckets.get(key)
+        if bucket and obj_id not in bucket:
+            raise ValueError(f"{self.attr_name} '{key}' already exists")
+
+    def add(self, obj_id, key):
+        self._buckets.setdefault(key, {})[obj_id] = None
+
+    def remove(self, obj_id, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        bucket.pop(obj_id, None)
+        if not bucket:
+            del self._buckets[key]
+
+    def first(self, key):
+        """Return the first id stored under key, or None."""
+        bucket = self._buckets.get(key)
+        if not bucket:
+            return None
+        return next(iter(bucket))
+
+    def lookup(self, key):
+        """Return the ids stored under key, in insertion order."""
+        return list(self._buckets.get(key, ()))
+
+    def plan(self, conditions, order_attr=None):
+        for op, value in conditions.get(self.attr_name, ()):
+            if op == "eq":
+                ids = self.lookup(value)
+            elif op == "in":
+                ids = list(dict.fromkeys(i for v in value for i in self._buckets.get(v, ())))
+            else:
+                continue
+            kind = "unique" if self.unique else "hash"
+            return IndexPlan(self, kind, lambda reverse=False, ids=ids: iter(ids), len(ids))
+        return None
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class SortedIndex:
+    """Keeps (value, id) pairs ordered by value for range scans and ordering.
+
+    Only meant for attributes with mutually comparable values (numbers).
+    """
+
+    def __init__(self, attr_name):
+        self.attr_name = attr_name
+        self.name = attr_name
+        self._entries = []
+
+    def key_for(self, obj):
+        return getattr(obj, self.attr_name, None)
+
+    def check(self, obj_id, key):
+        return None
+
+    def add(self, obj_id, key):
+        entry = (key is None, key, obj_id)
+        self._entries.insert(bisect_left(self._entries, entry), entry)
+
+    def remove(self, obj_id, key):
+        entry = (key is None, key, obj_id)
+        i = bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def _bounds(self, ops):
+        """Slice of _entries matching every range condition in ops.
+
+        Raises TypeError for a value that cannot be compared with the
+        indexed ones (None included); plan() then leaves the query to a
+        scan. The scan applies Python semantics: an ordering comparison
+        that raises or involves None matches nothing, while eq compares
+        by equality, so price=None finds the objects whose price is None
+        (as a HashIndex lookup of None does).
+        """
+        expanded = []
+        for op, value in ops:
+            if op == "between":
+                expanded += [("gte", value[0]), ("lte", value[1])]
+            else:
+                expanded.append((op, value))
+        lo, hi = 0, bisect_left(self._entries, (True,))
+        for op, value in expanded:
+            if value is None:
+                raise TypeError("None is not comparable with indexed values")
+            probe = (False, value)
+            if op in ("eq", "gte"):
+                lo = max(lo, bisect_left(self._entries, probe, key=_value_key))
+            if op == "gt":
+                lo = max(lo, bisect_right(self._entries, probe, key=_value_key))
+            if op in ("eq", "lte"):
+                hi = min(hi, bisect_right(self._entries, probe, key=_value_key))
+            if op == "lt":
+                hi = min(hi, bisect_left(self._entries, probe, key=_value_key))
+        return lo, max(lo, hi)
+
+    def iter_ids(self, lo, hi, reverse=False):
+        entries = self._entries
+        indices = range(hi - 1, lo - 1, -1) if reverse else range(lo, hi)
+        for i in indices:
+            yield entries[i][2]
+
+    def plan(self, conditions, order_attr=None):
+        ops = [c for c in conditions.get(self.attr_name, ()) if c[0] in _RANGE_OPS]
+        if ops:
+            try:
+                lo, hi = self._bounds(ops)
+            except TypeError:
+                return None
+        elif order_attr == self.attr_name:
+            lo, hi = 0, len(self._entries)
+        else:
+            return None
+        return IndexPlan(
+            self, "sorted",
+            lambda reverse=False: self.iter_ids(lo, hi, reverse),
+            hi - lo, order_attr=self.attr_name,
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CompoundIndex:
+    """Equality on leading attributes, sorted on the last one.
+
+    CompoundIndex(("owner", "price")) answers owner == x, optionally with a
+    range or ordering on price, without touching other owners' objects.
+    """
+
+    def __init__(self, attr_names):
+        if len(attr_names) < 2:
+            raise ValueError("a compound index needs at least two attributes")
+        self.attr_names = tuple(attr_names)
+        self.name = "+".join(self.attr_names)
+        self._prefix = self.attr_names[:-1]
+        self._groups = {}
+
+    def key_for(self, obj):
+        return tuple(getattr(obj, name, None) for name in self.attr_names)
+
+    def check(self, obj_id, key):
+        return None
+
+    def add(self, obj_id, key):
+        group = self._groups.get(key[:-1])
+        if group is None:
+            group = self._groups[key[:-1]] = SortedIndex(self.attr_names[-1])
+        group.add(obj_id, key[-1])
+
+    def remove(self, obj_id, key):
+        group = self._groups.get(key[:-1])
+        if group is None:
+            return
+        group.remove(obj_id, key[-1])
+        if not len(group):
+            del self._groups[key[:-1]]
+
+    def plan(self, conditions, order_attr=None):
+        prefix = []
+        for name in self._prefix:
+            values = [v for op, v in conditions.get(name, ()) if op == "eq"]
+            if not values:
+                return None
+            prefix.append(values[0])
+        group = self._groups.get(tuple(prefix))
+        if group is None:
+            return IndexPlan(self, "compound", lambda reverse=False: iter(()), 0)
+        ops = [c for c in conditions.get(group.attr_name, ()) if c[0] in _RANGE_OPS]
+        try:
+            lo, hi = group._bounds(ops) if ops else (0, len(group))
+        except TypeError:
+            return None
+        return IndexPlan(
+            self, "compound",
+            lambda reverse=False: group.iter_ids(lo, hi, reverse),
+            hi - lo, order_attr=group.attr_name,
+        )
+
+    def __len__(self):
+        return len(self._groups)
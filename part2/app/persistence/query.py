@@ -0,0 +1,184 @@
+"""Multi-predicate queries over an InMemoryRepository.
+
+Predicates use Django-style keyword names: ``price=10`` is equality and
+``price__gte=10`` a range. Supported operators are eq, ne, lt, lte, gt,
+gte, in and between (an inclusive ``(low, high)`` pair).
+
+The planner asks every index of the repository for the candidate ids it
+can produce, keeps the cheapest one (falling back to a full scan) and
+re-checks all predicates on the candidates. The chosen plan is attached to
+the result so tests can assert which index served a query.
+"""
+
+OPERATORS = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "lt": lambda a, b: a is not None and a < b,
+    "lte": lambda a, b: a is not None and a <= b,
+    "gt": lambda a, b: a is not None and a > b,
+    "gte": lambda a, b: a is not None and a >= b,
+    "in": lambda a, b: a in b,
+    "between": lambda a, b: a is not None and b[0] <= a <= b[1],
+}
+
+_MISSING = object()
+
+
+def parse_predicates(predicates):
+    """Turn {"price__gte": 10} into {"price": [("gte", 10)]}."""
+    conditions = {}
+    for key, value in predicates.items():
+        attr, _, op = key.partition("__")
+        op = op or "eq"
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}' in '{key}'")
+        if op == "between" and len(value) != 2:
+            raise ValueError(f"'{key}' expects a (low, high) pair")
+        conditions.setdefault(attr, []).append((op, value))
+    return conditions
+
+
+def _sort_key(attr):
+    def key(obj):
+        value = getattr(obj, attr, None)
+        return (value is None, value)
+    return key
+
+
+class QueryPlan:
+    """Describes how a query was (or would be) answered."""
+
+    def __init__(self, index, kind, candidates, ordered):
+        self.index = index
+        self.kind = kind
+        self.candidates = candidates
+        self.ordered = ordered
+
+    def to_dict(self):
+        return {
+            "index": self.index,
+            "kind": self.kind,
+            "candidates": self.candidates,
+            "ordered": self.ordered,
+        }
+
+    def __repr__(self):
+        return (f"QueryPlan(index={self.index!r}, kind={self.kind!r}, "
+                f"candidates={self.candidates}, ordered={self.ordered})")
+
+
+class QueryResult(list):
+    """List of matching objects carrying the QueryPlan that produced it."""
+
+    def __init__(self, items, plan):
+        super().__init__(items)
+        self.plan = plan
+
+
+class Query:
+    """Chainable query builder returned by InMemoryRepository.query()."""
+
+    def __init__(self, repo):
+        self._repo = repo
+        self._conditions = {}
+        self._order_attr = None
+        self._descending = False
+        self._limit = None
+        self._offset = 0
+
+    def filter(self, **predicates):
+        for attr, ops in parse_predicates(predicates).items():
+            self._conditions.setdefault(attr, []).extend(ops)
+        return self
+
+    def order_by(self, attr):
+        """Order by attr ascending, or descending with a leading '-'."""
+        self._descending = attr.startswith("-")
+        self._order_attr = attr.lstrip("-")
+        return self
+
+    def limit(self, n):
+        if n is not None and n < 0:
+            raise ValueError("limit must be >= 0")
+        self._limit = n
+        return self
+
+    def offset(self, n):
+        if n < 0:
+            raise ValueError("offset must be >= 0")
+        self._offset = n
+        return self
+
+    def _matches(self, obj):
+        for attr, ops in self._conditions.items():
+            value = getattr(obj, attr, _MISSING)
+            if value is _MISSING:
+                return False
+            for op, expected in ops:
+                try:
+                    if not OPERATORS[op](value, expected):
+                        return False
+                except TypeError:
+                    return False
+        return True
+
+    def _choose(self):
+        best = None
+        for index in self._repo._indexes.values():
+            candidate = index.plan(self._conditions, self._order_attr)
+            if candidate is None:
+                continue
+            if best is None or candidate.count < best.count or (
+                candidate.count == best.count
+                and candidate.order_attr == self._order_attr
+                and best.order_attr != self._order_attr
+            ):
+                best = candidate
+        return best
+
+    def explain(self):
+        """Return the QueryPlan without running the query."""
+        chosen = self._choose()
+        if chosen is None:
+            return QueryPlan(None, "scan", len(self._repo._data), False)
+        ordered = self._order_attr is not None and chosen.order_attr == self._order_attr
+        return QueryPlan(chosen.index.name, chosen.kind, chosen.count, ordered)
+
+    def all(self):
+        chosen = self._choose()
+        data = self._repo._data
+        if chosen is None:
+            plan = QueryPlan(None, "scan", len(data), False)
+            candidates = iter(data.values())
+        else:
+            ordered = self._order_attr is not None and chosen.order_attr == self._order_attr
+            plan = QueryPlan(chosen.index.name, chosen.kind, chosen.count, ordered)
+            ids = chosen.iter_ids(reverse=ordered and self._descending)
+            candidates = (data[obj_id] for obj_id in ids)
+
+        matches = (obj for obj in candidates if self._matches(obj))
+        end = None if self._limit is None else self._offset + self._limit
+
+        if self._order_attr is None or plan.ordered:
+            items = []
+            for obj in matches:
+                if end is not None and len(items) >= end:
+                    break
+                items.append(obj)
+        else:
+            items = sorted(matches, key=_sort_key(self._order_attr), reverse=self._descending)
+        return QueryResult(items[self._offset:end], plan)
+
+    def _copy(self):
+        query = Query(self._repo)
+        query.__dict__.update(self.__dict__)
+        query._conditions = {attr: list(ops) for attr, ops in self._conditions.items()}
+        return query
+
+    def first(self):
+        result = self._copy().limit(1).all()
+        return result[0] if result else None
+
+    def count(self):
+        """Number of matches, ignoring limit and offset (which are kept)."""
+        return len(self._copy().limit(None).offset(0).all())
@@ -1,5 +1,22 @@
 from abc import ABC, abstractmethod
 
+from app.persistence.indexes import CompoundIndex, HashIndex, SortedIndex
+from app.persistence.query import Query
+
+_MISSING = object()
+
+
+def _state_of(obj):
+    """Attribute values of obj, for dict-based and slotted objects."""
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                state[name] = getattr(obj, name)
+    return state
+
+
 class Repository(ABC):
     @abstractmethod
     def add(self, obj): ...
@@ -13,14 +30,106 @@ class Repository(ABC):
     def delete(self, obj_id): ...
     @abstractmethod
     def get_by_attribute(self, attr_name, attr_value): ...
+    @abstractmethod
+    def find(self, order_by=None, limit=None, **predicates): ...
 
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    """Dict-backed repository with optional secondary hash indexes.
+
+    indexed: attribute names to index for get_by_attribute lookups.
+    unique: attribute names that are indexed and must be unique; add and
+        update raise ValueError on a duplicate value (None is never a dup).
+    sorted_by: numeric attribute names kept ordered for range queries and
+        order_by (e.g. price, latitude, longitude).
+    compound: tuples of attribute names; equality on the leading ones and
+        range/order on the last one, e.g. ("owner", "price").
+
+    Indexes are maintained by add, update and delete. If an object is
+    mutated without going through update, call reindex(obj_id): it also
+    reports the change to listeners (the durable log).
+
+    Listeners registered with subscribe() are told about every successful
+    add, update and delete (see DurableStore for one).
+    """
+
+    def __init__(self, indexed=(), unique=(), sorted_by=(), compound=()):
         self._data = {}
+        self._indexes = {}
+        # obj_id -> {attr_name: key currently stored in that index}
+        self._keys = {}
+        self._listeners = []
+        for name in unique:
+            self._indexes[name] = HashIndex(name, unique=True)
+        for name in indexed:
+            self._indexes.setdefault(name, HashIndex(name))
+        for name in sorted_by:
+            self._indexes[f"{name}:sorted"] = SortedIndex(name)
+        for names in compound:
+            index = CompoundIndex(names)
+            self._indexes[index.name] = index
+
+    # -------------------------
+    # Index maintenance
+    # -------------------------
+    def _index_keys(self, obj):
+        return {name: index.key_for(obj) for name, index in self._indexes.items()}
+
+    def _check_keys(self, obj_id, keys):
+        for name, key in keys.items():
+            self._indexes[name].check(obj_id, key)
+
+    def _link(self, obj_id, keys):
+        for name, key in keys.items():
+            self._indexes[name].add(obj_id, key)
+        self._keys[obj_id] = keys
 
+    def _unlink(self, obj_id):
+        for name, key in self._keys.pop(obj_id, {}).items():
+            self._indexes[name].remove(obj_id, key)
+
+    def reindex(self, obj_id):
+        """Refresh index entries for an object mutated outside update().
+
+        Listeners get an update carrying every attribute of the object, so
+        in-place changes (place.add_review(), attribute edits after get())
+        also reach the durable log and the columnar store.
+        """
+        obj = self._data.get(obj_id)
+        if obj is None:
+            return None
+        keys = self._index_keys(obj)
+        self._check_keys(obj_id, keys)
+        self._unlink(obj_id)
+        self._link(obj_id, keys)
+        self._notify("on_update", obj, _state_of(obj))
+        return obj
+
+    # -------------------------
+    # Change listeners
+    # -------------------------
+    def subscribe(self, listener):
+        """Call listener.on_add/on_update/on_delete(repo, obj, ...) on writes."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event, *args):
+        for listener in self._listeners:
+            getattr(listener, event)(self, *args)
+
+    # -------------------------
+    # Repository interface
+    # -------------------------
     def add(self, obj):
+        keys = self._index_keys(obj)
+        self._check_keys(obj.id, keys)
+        self._unlink(obj.id)
         self._data[obj.id] = obj
+        self._link(obj.id, keys)
+        self._notify("on_add", obj)
         return obj
 
     def get(self, obj_id):
@@ -30,17 +139,64 @@ class InMemoryRepository(Repository):
         return list(self._data.values())
 
     def update(self, obj_id, data):
-        obj = self.get(obj_id)
+        obj = self._data.get(obj_id)
         if not obj:
             return None
-        for k, v in data.items():
-            setattr(obj, k, v)
+        previous = {k: getattr(obj, k, _MISSING) for k in data}
+        try:
+            for k, v in data.items():
+                setattr(obj, k, v)
+        except Exception:
+            # e.g. AttributeError for a field a slotted model does not have
+            self._restore(obj, previous)
+            raise
+        if self._indexes:
+            keys = self._index_keys(obj)
+            try:
+                self._check_keys(obj_id, keys)
+            except ValueError:
+                self._restore(obj, previous)
+                raise
+            self._unlink(obj_id)
+            self._link(obj_id, keys)
+        self._notify("on_update", obj, data)
         return obj
 
+    @staticmethod
+    def _restore(obj, previous):
+        for k, v in previous.items():
+            if v is _MISSING:
+                if hasattr(obj, k):
+                    delattr(obj, k)
+            else:
+                setattr(obj, k, v)
+
     def delete(self, obj_id):
-        return self._data.pop(obj_id, None)
+        self._unlink(obj_id)
+        obj = self._data.pop(obj_id, None)
+        if obj is not None:
+            self._notify("on_delete", obj)
+        return obj
+
+    def query(self):
+        """Return a chainable Query over this repository."""
+        return Query(self)
+
+    def find(self, order_by=None, limit=None, **predicates):
+        """Return objects matching all predicates as a QueryResult list.
+
+        find(price__lte=100, order_by="-price", limit=10)
+        """
+        query = self.query().filter(**predicates).limit(limit)
+        if order_by:
+            query.order_by(order_by)
+        return query.all()
 
     def get_by_attribute(self, attr_name, attr_value):
+        index = self._indexes.get(attr_name)
+        if isinstance(index, HashIndex):
+            obj_id = index.first(attr_value)
+            return self._data[obj_id] if obj_id is not None else None
         for obj in self._data.values():
             if getattr(obj, attr_name, None) == attr_value:
                 return obj
@@ -1,8 +1,90 @@
+from app.persistence.columnar import PlaceColumns
+from app.persistence.concurrent import ConcurrentInMemoryRepository
+from app.persistence.durable import DurableStore
 from app.persistence.repository import InMemoryRepository
 
 class HBnBFacade:
-    def __init__(self):
-        self.user_repo = InMemoryRepository()
-        self.place_repo = InMemoryRepository()
-        self.review_repo = InMemoryRepository()
-        self.amenity_repo = InMemoryRepository()
+    def __init__(self, concurrent=False, data_dir=None, columnar=False, **store_options):
+        """concurrent=True makes every repository safe to share between
+        the threads of a multi-threaded WSGI server.
+
+        data_dir enables persistence: repositories are restored from it on
+        start-up and every write is logged there (see DurableStore for
+        store_options). Call close() on shutdown.
+
+        columnar=True keeps a NumPy copy of place prices, coordinates and
+        ratings so search_places() runs vectorised (requires numpy).
+        """
+        repo_cls = ConcurrentInMemoryRepository if concurrent else InMemoryRepository
+        self.user_repo = repo_cls(unique=("email",))
+        self.place_repo = repo_cls(
+            sorted_by=("price", "latitude", "longitude"),
+            compound=(("owner", "price"),),
+        )
+        self.review_repo = repo_cls(indexed=("place", "user"))
+        self.amenity_repo = repo_cls()
+
+        self.store = None
+        if data_dir is not None:
+            self.store = DurableStore(data_dir, **store_options)
+            self.store.attach("users", self.user_repo)
+            self.store.attach("places", self.place_repo)
+            self.store.attach("reviews", self.review_repo)
+            self.store.attach("amenities", self.amenity_repo)
+            self.store.open()
+
+        self.place_columns = None
+        if columnar:
+            self.place_columns = PlaceColumns(self.place_repo, self.review_repo)
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
+
+    def add_review(self, review):
+        """Store review and attach it to its place (review.place)."""
+        if self.review_repo.get(review.id) is None:
+            self.review_repo.add(review)
+        review.place.add_review(review)
+        self.place_repo.reindex(review.place.id)  # log the in-place change
+        return review
+
+    def add_amenity(self, place_id, amenity):
+        """Store amenity if new and attach it to the place; None if no place."""
+        place = self.place_repo.get(place_id)
+        if place is None:
+            return None
+        if self.amenity_repo.get(amenity.id) is None:
+            self.amenity_repo.add(amenity)
+        place.add_amenity(amenity)
+        self.place_repo.reindex(place_id)
+        return amenity
+
+    def find_places(self, order_by=None, limit=None, **predicates):
+        """Filter places, e.g. find_places(price__lte=120, order_by="price")."""
+        return self.place_repo.find(order_by=order_by, limit=limit, **predicates)
+
+    def search_places(self, min_price=None, max_price=None, bbox=None,
+                      min_rating=None, order_by=None, limit=None):
+        """Range / bounding-box / top-k search over places.
+
+        bbox is (min_lat, min_lon, max_lat, max_lon); order_by accepts
+        price, latitude, longitude or rating, "-" prefixed for descending.
+        Uses the columnar store when enabled, the repository indexes
+        otherwise (rating filters and ordering need the columnar store).
+        """
+        if self.place_columns is not None:
+            ids = self.place_columns.select(min_price, max_price, bbox, min_rating,
+                                            order_by, limit)
+            return [self.place_repo.get(place_id) for place_id in ids]
+        if min_rating is not None or (order_by or "").lstrip("-") == "rating":
+            raise ValueError("rating search requires HBnBFacade(columnar=True)")
+        predicates = {}
+        if min_price is not None:
+            predicates["price__gte"] = min_price
+        if max_price is not None:
+            predicates["price__lte"] = max_price
+        if bbox is not None:
+            predicates["latitude__between"] = (bbox[0], bbox[2])
+            predicates["longitude__between"] = (bbox[1], bbox[3])
+        return self.place_repo.find(order_by=order_by, limit=limit, **predicates)
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""Columnar place store versus scanning Place objects.
+
+Runs the same price-range, bounding-box and top-k queries over plain
+Python objects (the InMemoryRepository.get_all() path) and through
+PlaceColumns.
+
+Usage: python -m benchmarks.bench_columnar [sizes...]
+Run from the part2 directory.
+"""
+
+import heapq
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from app.persistence.columnar import PlaceColumns
+from app.persistence.repository import InMemoryRepository
+
+REPEAT = 5
+
+
+def build(n):
+    rng = random.Random(42)
+    repo = InMemoryRepository()
+    for i in range(n):
+        repo.add(SimpleNamespace(
+            id=f"place-{i}",
+            price=rng.uniform(20, 500),
+            latitude=rng.uniform(-60, 70),
+            longitude=rng.uniform(-180, 180),
+        ))
+    return repo
+
+
+def scan_range(repo):
+    return [p.id for p in repo.get_all() if 100 <= p.price <= 120]
+
+
+def scan_bbox(repo):
+    return [p.id for p in repo.get_all()
+            if 20 <= p.latitude <= 30 and 40 <= p.longitude <= 50]
+
+
+def scan_top_k(repo):
+    return [p.id for p in heapq.nsmallest(10, repo.get_all(), key=lambda p: p.price)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn()
+    return (time.perf_counter() - start) / REPEAT * 1000, result
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1:]] or [100_000, 1_000_000]
+    print(f"{'places':>10} {'query':>8} {'scan (ms)':>10} {'columnar (ms)':>14} {'speedup':>8}")
+    for n in sizes:
+        repo = build(n)
+        columns = PlaceColumns(repo)
+        queries = (
+            ("range", scan_range, lambda: columns.select(min_price=100, max_price=120)),
+            ("bbox", scan_bbox, lambda: columns.select(bbox=(20, 40, 30, 50))),
+            ("top-10", scan_top_k, lambda: columns.select(order_by="price", limit=10)),
+        )
+        for name, scan, vectorised in queries:
+            t_scan, expected = timed(lambda: scan(repo))
+            t_col, got = timed(vectorised)
+            assert sorted(expected) == sorted(got)
+            print(f"{n:>10} {name:>8} {t_scan:>10.1f} {t_col:>14.2f} {t_scan / t_col:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
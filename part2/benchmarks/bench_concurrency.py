@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+"""Stress and throughput harness for the in-memory repositories.
+
+Each thread runs a 90% read / 10% update mix. Updates always write the
+same value to two fields, so a reader that sees them differ observed a
+half-applied update ("torn read").
+
+Usage: python -m benchmarks.bench_concurrency [seconds_per_run]
+Run from the part2 directory.
+"""
+
+import random
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from app.persistence.concurrent import ConcurrentInMemoryRepository
+from app.persistence.repository import InMemoryRepository
+
+OBJECTS = 10_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+WRITE_RATIO = 0.1
+
+
+def populate(repo):
+    ids = []
+    for i in range(OBJECTS):
+        obj = SimpleNamespace(id=f"id-{i}", low=0, high=0, price=float(i))
+        repo.add(obj)
+        ids.append(obj.id)
+    return ids
+
+
+def read_pair(repo, obj_id):
+    if isinstance(repo, ConcurrentInMemoryRepository):
+        fields = repo.get_fields(obj_id, "low", "high")
+        return fields["low"], fields["high"]
+    obj = repo.get(obj_id)
+    return obj.low, obj.high
+
+
+def worker(repo, ids, deadline, counters, seed):
+    rng = random.Random(seed)
+    ops = torn = 0
+    while time.perf_counter() < deadline:
+        obj_id = rng.choice(ids)
+        if rng.random() < WRITE_RATIO:
+            value = rng.randint(1, 1_000_000)
+            repo.update(obj_id, {"low": value, "high": value})
+        else:
+            low, high = read_pair(repo, obj_id)
+            if low != high:
+                torn += 1
+        ops += 1
+    counters.append((ops, torn))
+
+
+def run(repo_cls, threads, seconds):
+    repo = repo_cls(sorted_by=("price",))
+    ids = populate(repo)
+    counters = []
+    deadline = time.perf_counter() + seconds
+    pool = [
+        threading.Thread(target=worker, args=(repo, ids, deadline, counters, seed))
+        for seed in range(threads)
+    ]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    ops = sum(c[0] for c in counters)
+    torn = sum(c[1] for c in counters)
+    return ops / seconds, torn
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    # Switch threads far more often than the 5ms default so interleavings
+    # that are rare in a short run (but real under load) actually show up.
+    sys.setswitchinterval(1e-5)
+    print(f"{'threads':>8} {'repository':>30} {'ops/s':>12} {'torn reads':>11}")
+    for threads in THREAD_COUNTS:
+        for repo_cls in (InMemoryRepository, ConcurrentInMemoryRepository):
+            throughput, torn = run(repo_cls, threads, seconds)
+            print(f"{threads:>8} {repo_cls.__name__:>30} {throughput:>12,.0f} {torn:>11}")
+
+
+if __name__ == "__main__":
+    main()
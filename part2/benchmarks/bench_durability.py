@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""Measure logging overhead and restart time of the durable store.
+
+Writes N objects through a durable repository, then times a restart that
+replays the whole log, a compaction, and a restart from the snapshot plus
+a small log tail.
+
+Usage: python -m benchmarks.bench_durability [objects]
+Run from the part2 directory.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from app.persistence.durable import DurableStore
+from app.persistence.repository import InMemoryRepository
+
+TAIL = 10_000
+
+
+def open_store(data_dir):
+    repo = InMemoryRepository(unique=("email",))
+    store = DurableStore(data_dir, compact_interval=None)
+    store.attach("users", repo)
+    start = time.perf_counter()
+    store.open()
+    return repo, store, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data_dir = tempfile.mkdtemp()
+    try:
+        repo, store, _ = open_store(data_dir)
+        start = time.perf_counter()
+        for i in range(n):
+            repo.add(SimpleNamespace(id=f"id-{i}", email=f"user{i}@example.com", price=float(i)))
+        elapsed = time.perf_counter() - start
+        print(f"logged {n:,} adds: {elapsed:.2f}s ({n / elapsed:,.0f}/s)")
+        store.close()
+
+        repo, store, elapsed = open_store(data_dir)
+        print(f"restart replaying full log: {elapsed:.2f}s")
+
+        start = time.perf_counter()
+        store.compact()
+        print(f"compaction: {time.perf_counter() - start:.2f}s")
+        for i in range(TAIL):
+            repo.update(f"id-{i}", {"price": -1.0})
+        store.close()
+
+        repo, store, elapsed = open_store(data_dir)
+        assert len(repo.get_all()) == n
+        print(f"restart from snapshot + {TAIL:,} record tail: {elapsed:.2f}s")
+        store.close()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""Bytes per object for the slotted models versus the previous layout.
+
+The "before" classes below reproduce the original dict-backed models
+(datetime timestamps, no __slots__) so both layouts can be measured in
+the same run.
+
+Usage: python -m benchmarks.bench_model_memory [objects]
+Run from the part2 directory.
+"""
+
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+AMENITY_NAMES = ("Wi-Fi", "Parking", "Pool", "Kitchen", "Air conditioning")
+
+
+class LegacyBase:
+    def __init__(self):
+        self.id = str(uuid.uuid4())
+        self.created_at = datetime.utcnow()
+        self.updated_at = datetime.utcnow()
+
+
+class LegacyPlace(LegacyBase):
+    def __init__(self, title, price, latitude, longitude, owner, description=None):
+        super().__init__()
+        self.title = title
+        self.description = description
+        self.price = float(price)
+        self.latitude = latitude
+        self.longitude = float(longitude)
+        self.owner = owner
+        self.reviews = []
+        self.amenities = []
+
+
+class LegacyReview(LegacyBase):
+    def __init__(self, text, rating, user, place):
+        super().__init__()
+        self.text = text
+        self.rating = rating
+        self.user = user
+        self.place = place
+
+
+class LegacyAmenity(LegacyBase):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name.strip()
+
+
+def measure(factory, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # subtract the list holding the objects
+    return (after - before - sys.getsizeof(objects)) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    owner = User("Bench", "Owner", "owner@example.com", "password")
+    place = Place("Bench place", 100.0, 24.7, 46.7, owner)
+    # Text fields are built from shared constants so only the object layout
+    # (and the interning of amenity names) differs between the two runs.
+    cases = (
+        ("Place",
+         lambda i: LegacyPlace("Cozy loft", 80 + i % 50, 24.7, 46.7, owner),
+         lambda i: Place("Cozy loft", 80 + i % 50, 24.7, 46.7, owner)),
+        ("Review",
+         lambda i: LegacyReview("Great stay", 1 + i % 5, owner, place),
+         lambda i: Review("Great stay", 1 + i % 5, owner, place)),
+        ("Amenity",
+         lambda i: LegacyAmenity(" " + AMENITY_NAMES[i % 5] + " "),
+         lambda i: Amenity(" " + AMENITY_NAMES[i % 5] + " ")),
+    )
+    print(f"{'model':>8} {'before (B/obj)':>15} {'after (B/obj)':>14} {'saved':>7}")
+    for name, legacy, compact in cases:
+        old = measure(legacy, n)
+        new = measure(compact, n)
+        print(f"{name:>8} {old:>15.0f} {new:>14.0f} {1 - new / old:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""Compare indexed and scanning get_by_attribute lookups.
+
+Usage: python -m benchmarks.bench_repository_index [max_objects]
+Run from the part2 directory.
+"""
+
+import sys
+import time
+from types import SimpleNamespace
+
+from app.persistence.repository import InMemoryRepository
+
+LOOKUPS = 1000
+SCAN_LOOKUPS = 20
+
+
+def build(repo, n):
+    for i in range(n):
+        repo.add(SimpleNamespace(id=f"id-{i}", email=f"user{i}@example.com"))
+
+
+def time_lookups(repo, n, lookups):
+    step = max(n // lookups, 1)
+    emails = [f"user{i}@example.com" for i in range(0, n, step)][:lookups]
+    start = time.perf_counter()
+    for email in emails:
+        assert repo.get_by_attribute("email", email) is not None
+    return (time.perf_counter() - start) / len(emails)
+
+
+def main():
+    max_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= max_objects]
+    print(f"{'objects':>10} {'indexed (us)':>14} {'scan (us)':>14}")
+    for n in sizes:
+        indexed = InMemoryRepository(unique=("email",))
+        build(indexed, n)
+        plain = InMemoryRepository()
+        plain._data = indexed._data
+        t_index = time_lookups(indexed, n, LOOKUPS)
+        t_scan = time_lookups(plain, n, SCAN_LOOKUPS)
+        print(f"{n:>10} {t_index * 1e6:>14.2f} {t_scan * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
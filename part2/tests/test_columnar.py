@@ -0,0 +1,69 @@
+import unittest
+
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
+
+
+class TestPlaceColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.facade = HBnBFacade(columnar=True)
+        self.owner = self.facade.user_repo.add(User("Owner", "One", "owner@test.com", "secret1"))
+        self.guest = self.facade.user_repo.add(User("Guest", "Two", "guest@test.com", "secret2"))
+        self.places = [
+            self.facade.place_repo.add(Place(f"Place {i}", 50 + i * 10, 10.0 + i, 20.0 + i, self.owner))
+            for i in range(10)
+        ]
+
+    def review(self, place, rating):
+        return self.facade.review_repo.add(Review("Nice", rating, self.guest, place))
+
+    def test_price_range_and_bbox(self):
+        result = self.facade.search_places(min_price=70, max_price=100)
+        self.assertEqual([p.price for p in result], [70.0, 80.0, 90.0, 100.0])
+        result = self.facade.search_places(bbox=(12.0, 0.0, 13.5, 90.0), order_by="-price")
+        self.assertEqual(result, [self.places[3], self.places[2]])
+
+    def test_top_k_by_rating_follows_review_writes(self):
+        self.review(self.places[4], 5)
+        low = self.review(self.places[7], 2)
+        self.review(self.places[7], 4)
+        result = self.facade.search_places(order_by="-rating", limit=2)
+        self.assertEqual(result, [self.places[4], self.places[7]])
+
+        self.facade.review_repo.update(low.id, {"rating": 5})
+        self.assertEqual(self.facade.place_columns.avg_rating(self.places[7].id), 4.5)
+        self.facade.review_repo.delete(low.id)
+        self.assertEqual(self.facade.search_places(min_rating=4.5), [self.places[4]])
+
+    def test_updates_and_deletes_are_reflected(self):
+        self.facade.place_repo.update(self.places[0].id, {"price": 999.0})
+        self.assertEqual(self.facade.search_places(min_price=500), [self.places[0]])
+        self.facade.place_repo.delete(self.places[0].id)
+        self.assertEqual(self.facade.search_places(min_price=500), [])
+        extra = self.facade.place_repo.add(Place("New", 1000, 0.0, 0.0, self.owner))
+        self.assertEqual(self.facade.search_places(min_price=500), [extra])
+
+    def test_review_added_before_its_place(self):
+        late = Place("Late", 70, 0.0, 0.0, self.owner)
+        first = self.review(late, 4)
+        self.review(late, 2)
+        self.facade.review_repo.delete(first.id)
+        self.review(late, 5)
+        self.assertIsNone(self.facade.place_columns.avg_rating(late.id))
+        self.facade.place_repo.add(late)
+        self.assertEqual(self.facade.place_columns.avg_rating(late.id), 3.5)
+        self.assertEqual(self.facade.search_places(min_rating=3.5), [late])
+
+    def test_matches_repository_path(self):
+        plain = HBnBFacade()
+        for place in self.places:
+            plain.place_repo.add(place)
+        kwargs = dict(min_price=60, max_price=120, bbox=(11.0, 21.0, 18.0, 28.0), order_by="-price", limit=3)
+        self.assertEqual(self.facade.search_places(**kwargs), list(plain.search_places(**kwargs)))
+
+
+if __name__ == "__main__":
+    unittest.main()
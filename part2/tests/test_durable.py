@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
+
+
+class TestDurableStore(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def open_facade(self):
+        return HBnBFacade(data_dir=self.data_dir, compact_interval=None)
+
+    def seed(self, facade):
+        user = facade.user_repo.add(User("Alice", "Smith", "alice@test.com", "secret1"))
+        place = facade.place_repo.add(Place("Loft", 120.0, 24.7, 46.7, user))
+        return user, place
+
+    def test_restart_replays_log(self):
+        facade = self.open_facade()
+        user, place = self.seed(facade)
+        facade.place_repo.update(place.id, {"price": 150.0})
+        facade.close()
+
+        facade = self.open_facade()
+        restored = facade.place_repo.get(place.id)
+        self.assertEqual(restored.price, 150.0)
+        self.assertIs(restored.owner, facade.user_repo.get(user.id))
+        self.assertEqual(facade.find_places(price__gte=140), [restored])
+        self.assertIs(facade.user_repo.get_by_attribute("email", "alice@test.com"), restored.owner)
+        facade.close()
+
+    def test_compaction_then_tail_replay(self):
+        facade = self.open_facade()
+        user, place = self.seed(facade)
+        facade.store.compact()
+        facade.user_repo.delete(user.id)
+        facade.place_repo.update(place.id, {"title": "Penthouse"})
+        facade.close()
+
+        files = sorted(os.listdir(self.data_dir))
+        self.assertEqual(len([f for f in files if f.startswith("snapshot-")]), 1)
+
+        facade = self.open_facade()
+        self.assertIsNone(facade.user_repo.get(user.id))
+        self.assertEqual(facade.place_repo.get(place.id).title, "Penthouse")
+        facade.close()
+
+    def test_in_place_changes_survive_restart(self):
+        facade = self.open_facade()
+        user, place = self.seed(facade)
+        guest = facade.user_repo.add(User("Bob", "Jones", "bob@test.com", "secret2"))
+        review = facade.add_review(Review("Great", 5, guest, place))
+        wifi = facade.add_amenity(place.id, Amenity("Wi-Fi"))
+        facade.store.compact()
+        facade.add_amenity(place.id, Amenity("Pool"))
+        place.description = "Top floor"
+        facade.place_repo.reindex(place.id)
+        facade.close()
+
+        facade = self.open_facade()
+        restored = facade.place_repo.get(place.id)
+        self.assertEqual([r.id for r in restored.reviews], [review.id])
+        self.assertIs(restored.reviews[0], facade.review_repo.get(review.id))
+        self.assertIs(restored.reviews[0].place, restored)
+        self.assertEqual([a.name for a in restored.amenities], ["Wi-Fi", "Pool"])
+        self.assertIs(restored.amenities[0], facade.amenity_repo.get(wifi.id))
+        self.assertEqual(restored.description, "Top floor")
+        facade.close()
+
+    def test_torn_tail_record_is_dropped(self):
+        facade = self.open_facade()
+        user, _ = self.seed(facade)
+        segment = os.path.join(self.data_dir, facade.store._log.name)
+        facade.close()
+        with open(segment, "ab") as fh:
+            fh.write(b"\x40\x00\x00\x00partial")
+
+        facade = self.open_facade()
+        self.assertIsNotNone(facade.user_repo.get(user.id))
+        self.assertEqual(len(facade.place_repo.get_all()), 1)
+        facade.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
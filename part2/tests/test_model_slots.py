@@ -0,0 +1,56 @@
+import pickle
+import unittest
+from datetime import datetime
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+class TestCompactModels(unittest.TestCase):
+
+    def setUp(self):
+        self.user = User("Raneem", "Test", "r@test.com", "StrongPass123")
+        self.place = Place("Test Place", 100.0, 24.7, 46.7, self.user)
+
+    def test_models_have_no_instance_dict(self):
+        review = Review("Great place", 5, self.user, self.place)
+        for obj in (self.user, self.place, review, Amenity("WiFi")):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_timestamps_round_trip_as_datetimes(self):
+        self.assertIsInstance(self.place.created_at, datetime)
+        self.assertEqual(self.place.created_at, self.place.updated_at)
+        stamp = datetime(2024, 5, 17, 8, 30, 12, 123456)
+        self.place.updated_at = stamp
+        self.assertEqual(self.place.updated_at, stamp)
+        self.place.save()
+        self.assertGreater(self.place.updated_at, stamp)
+
+    def test_amenity_names_are_interned_and_serialized_unchanged(self):
+        a, b = Amenity(" Wi-Fi "), Amenity("".join(["Wi", "-Fi"]))
+        self.assertIs(a.name, b.name)
+        self.assertEqual(a.to_dict(), {"name": "Wi-Fi"})
+
+    def test_validation_is_unchanged(self):
+        with self.assertRaises(ValueError):
+            Place("", 100.0, 24.7, 46.7, self.user)
+        with self.assertRaises(ValueError):
+            User("A", "B", "not-an-email", "StrongPass123")
+        with self.assertRaises(ValueError):
+            Review("Nice", 6, self.user, self.place)
+
+    def test_unknown_attributes_are_rejected(self):
+        with self.assertRaises(AttributeError):
+            self.place.nickname = "x"
+
+    def test_pickle_round_trip(self):
+        copy = pickle.loads(pickle.dumps(self.place))
+        self.assertEqual(copy.id, self.place.id)
+        self.assertEqual(copy.created_at, self.place.created_at)
+        self.assertEqual(copy.owner.email, "r@test.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
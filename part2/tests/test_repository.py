@@ -0,0 +1,170 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from app.models.place import Place
+from app.models.user import User
+from app.persistence.concurrent import ConcurrentInMemoryRepository
+from app.persistence.repository import InMemoryRepository
+
+
+class TestRepositoryIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = InMemoryRepository(unique=("email",), indexed=("last_name",))
+        self.alice = self.repo.add(User("Alice", "Smith", "alice@test.com", "secret1"))
+        self.bob = self.repo.add(User("Bob", "Smith", "bob@test.com", "secret2"))
+
+    def test_lookup_uses_index(self):
+        self.assertIs(self.repo.get_by_attribute("email", "bob@test.com"), self.bob)
+        self.assertIs(self.repo.get_by_attribute("last_name", "Smith"), self.alice)
+        self.assertIsNone(self.repo.get_by_attribute("email", "nobody@test.com"))
+
+    def test_unindexed_attribute_falls_back_to_scan(self):
+        self.assertIs(self.repo.get_by_attribute("first_name", "Bob"), self.bob)
+
+    def test_unique_index_rejects_duplicates(self):
+        with self.assertRaises(ValueError):
+            self.repo.add(User("Eve", "Doe", "alice@test.com", "secret3"))
+        self.assertEqual(len(self.repo.get_all()), 2)
+
+    def test_update_moves_index_entry(self):
+        self.repo.update(self.alice.id, {"email": "alice@new.com"})
+        self.assertIsNone(self.repo.get_by_attribute("email", "alice@test.com"))
+        self.assertIs(self.repo.get_by_attribute("email", "alice@new.com"), self.alice)
+
+    def test_update_to_duplicate_is_rejected_and_rolled_back(self):
+        with self.assertRaises(ValueError):
+            self.repo.update(self.alice.id, {"email": "bob@test.com", "first_name": "Al"})
+        self.assertEqual(self.alice.email, "alice@test.com")
+        self.assertEqual(self.alice.first_name, "Alice")
+        self.assertIs(self.repo.get_by_attribute("email", "bob@test.com"), self.bob)
+
+    def test_delete_removes_index_entry(self):
+        self.repo.delete(self.bob.id)
+        self.assertIsNone(self.repo.get_by_attribute("email", "bob@test.com"))
+        self.repo.add(User("Bob", "Jones", "bob@test.com", "secret4"))
+
+    def test_reindex_after_direct_mutation(self):
+        self.alice.update_profile(email="alice@other.com")
+        self.repo.reindex(self.alice.id)
+        self.assertIs(self.repo.get_by_attribute("email", "alice@other.com"), self.alice)
+
+
+class TestRepositoryQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = InMemoryRepository(
+            sorted_by=("price", "latitude"),
+            compound=(("owner", "price"),),
+        )
+        self.alice = User("Alice", "Smith", "alice@test.com", "secret1")
+        self.bob = User("Bob", "Smith", "bob@test.com", "secret2")
+        self.places = []
+        for i in range(20):
+            owner = self.alice if i % 2 else self.bob
+            place = Place(f"Place {i}", 10 + i * 5, 20.0 + i, 40.0, owner)
+            self.places.append(self.repo.add(place))
+
+    def test_range_uses_sorted_index(self):
+        result = self.repo.find(price__gte=50, price__lt=70)
+        self.assertEqual([p.price for p in result], [50.0, 55.0, 60.0, 65.0])
+        self.assertEqual(result.plan.index, "price")
+        self.assertEqual(result.plan.kind, "sorted")
+        self.assertEqual(result.plan.candidates, 4)
+
+    def test_planner_picks_most_selective_index(self):
+        result = self.repo.find(price__gte=10, latitude__between=(30.0, 31.0))
+        self.assertEqual(result.plan.index, "latitude")
+        self.assertEqual([p.latitude for p in result], [30.0, 31.0])
+
+    def test_compound_index_with_order_and_limit(self):
+        result = self.repo.find(owner=self.alice, price__gt=20, order_by="-price", limit=3)
+        self.assertEqual(result.plan.index, "owner+price")
+        self.assertTrue(result.plan.ordered)
+        self.assertEqual([p.price for p in result], [105.0, 95.0, 85.0])
+
+    def test_order_without_filter_streams_from_index(self):
+        query = self.repo.query().order_by("price").limit(2)
+        self.assertEqual(query.explain().index, "price")
+        self.assertEqual([p.price for p in query.all()], [10.0, 15.0])
+
+    def test_unindexed_predicate_scans(self):
+        result = self.repo.find(title="Place 3")
+        self.assertEqual(result.plan.kind, "scan")
+        self.assertEqual(result, [self.places[3]])
+
+    def test_indexes_follow_updates_and_deletes(self):
+        place = self.places[0]
+        self.repo.update(place.id, {"price": 1000.0})
+        self.assertEqual(self.repo.find(price__gte=500), [place])
+        self.repo.delete(place.id)
+        self.assertEqual(self.repo.find(price__gte=500), [])
+        self.assertEqual(self.repo.find(owner=self.bob, price__gte=500), [])
+
+    def test_incomparable_operands_match_nothing_like_a_scan(self):
+        for conditions in ({"price": None}, {"price__lte": "abc"},
+                           {"price__between": (10, None)},
+                           {"owner": self.alice, "price__gt": "abc"}):
+            result = self.repo.find(**conditions)
+            self.assertEqual(result, [], conditions)
+            self.assertEqual(result.plan.kind, "scan", conditions)
+        # Another index can still serve the query.
+        result = self.repo.find(price__lt=None, latitude__between=(30.0, 31.0))
+        self.assertEqual(result.plan.index, "latitude")
+        self.assertEqual(result, [])
+
+    def test_none_operand_matches_by_equality(self):
+        place = self.places[3]
+        place.price = None
+        self.repo.reindex(place)
+        result = self.repo.find(price=None)
+        self.assertEqual(result.plan.kind, "scan")
+        self.assertEqual(result, [place])
+        self.assertEqual(self.repo.find(price__lt=None), [])
+        self.assertEqual(len(self.repo.find(price__gte=10)), 19)
+
+    def test_count_and_first_keep_limit_and_offset(self):
+        query = self.repo.query().filter(price__gte=50).order_by("price").limit(2).offset(1)
+        self.assertEqual(query.count(), 12)
+        self.assertEqual(query.first().price, 55.0)
+        self.assertEqual([p.price for p in query.all()], [55.0, 60.0])
+
+    def test_unknown_operator_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.repo.find(price__near=10)
+
+
+class TestConcurrentRepository(unittest.TestCase):
+
+    def test_updates_are_atomic_for_readers(self):
+        repo = ConcurrentInMemoryRepository(sorted_by=("low",))
+        for i in range(50):
+            repo.add(SimpleNamespace(id=str(i), low=0, high=0))
+        torn = []
+
+        def writer(seed):
+            for n in range(300):
+                value = seed * 1000 + n
+                repo.update(str(n % 50), {"low": value, "high": value})
+
+        def reader():
+            for n in range(300):
+                fields = repo.get_fields(str(n % 50), "low", "high")
+                if fields["low"] != fields["high"]:
+                    torn.append(fields)
+                repo.find(low__gte=0, limit=5)
+
+        threads = [threading.Thread(target=writer, args=(s,)) for s in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(torn, [])
+        self.assertEqual(len(repo.find(low__gte=0)), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 from flask import request
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
 
+from app.api.v1.bulk import bulk_create
+from app.api.v1.http_cache import conditional_get
+from app.api.v1.pagination import page_args, page_response, wants_count
+from app.api.v1.streaming import ndjson_response, stream_args, wants_stream
 from app.services.hbnb_facade import HBnBFacade
 
 amenities_api = Namespace("amenities", description="Amenities operations")
@@ -13,9 +17,30 @@ amenity_model = amenities_api.model("Amenity", {
 
 @amenities_api.route("/")
 class AmenityList(Resource):
-    @amenities_api.marshal_list_with(amenity_model)
+    @amenities_api.doc(params={
+        "limit": "Page size",
+        "cursor": "Opaque cursor from the X-Next-Cursor header of the previous page",
+        "count": "Set to 1 to receive X-Total-Count",
+        "stream": "Set to 1 (or send Accept: application/x-ndjson) to stream every amenity as NDJSON",
+    })
+    @amenities_api.response(200, "Success", [amenity_model])
+    @conditional_get("amenities")
     def get(self):
-        return facade.get_amenities()
+        if wants_stream():
+            limit, after = stream_args(amenities_api)
+            try:
+                amenities = facade.iter_amenities(limit=limit, after=after)
+            except ValueError as e:
+                amenities_api.abort(400, str(e))
+            return ndjson_response(amenities, amenity_model)
+        limit, after = page_args(amenities_api)
+        try:
+            amenities = facade.get_amenities(limit=limit + 1, after=after)
+        except ValueError as e:
+            amenities_api.abort(400, str(e))
+        count = facade.count_amenities() if wants_count() else None
+        amenities, headers = page_response(amenities, limit, lambda a: [a.id], count)
+        return marshal(amenities, amenity_model), 200, headers
 
     @amenities_api.expect(amenity_model, validate=True)
     @amenities_api.marshal_with(amenity_model, code=201)
@@ -24,6 +49,14 @@ class AmenityList(Resource):
         amenity = facade.create_amenity(name=data.get("name"))
         return amenity, 201
 
+@amenities_api.route("/bulk")
+class AmenityBulk(Resource):
+    @amenities_api.expect([amenity_model])
+    @amenities_api.response(201, "Created", [amenity_model])
+    def post(self):
+        """Create many amenities in one transaction."""
+        return bulk_create(amenities_api, facade.bulk_create_amenities, amenity_model)
+
 @amenities_api.route("/<string:amenity_id>")
 class AmenityItem(Resource):
     @amenities_api.marshal_with(amenity_model)
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token
+from app.extensions import db
 from app.models.user import User
+from hbnb_common.password_hasher import PasswordHasherBusy
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -14,8 +16,14 @@ def login():
         return {"error": "email and password required"}, 400
 
     user = User.query.filter_by(email=email).first()
-    if not user or not user.check_password(password):
+    try:
+        valid = user is not None and user.check_password(password)
+    except PasswordHasherBusy:
+        return {"error": "server busy, retry shortly"}, 503, {"Retry-After": "1"}
+    if not valid:
         return {"error": "invalid credentials"}, 401
+    if db.session.is_modified(user):
+        db.session.commit()  # password rehashed with the current cost
 
     token = create_access_token(
         identity=user.id,
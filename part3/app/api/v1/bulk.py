@@ -0,0 +1,49 @@
+"""Shared handling for the POST .../bulk endpoints.
+
+The body is a JSON array of items shaped like the single-item POST. The
+whole batch is validated and inserted in one transaction: either every
+item is created (201, results in input order) or none is (400, with an
+"errors" list of {"index", "error"} for the offending items).
+
+Endpoints that create rows on behalf of a user name the field (owner_id,
+user_id) in owner_field: it defaults to the caller, and only admins may
+set it to someone else (403 otherwise).
+"""
+
+from flask import current_app, request
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from flask_restx import marshal
+
+from app.services.hbnb_facade import BulkValidationError
+
+
+def _check_owner(namespace, items, owner_field):
+    """Abort 403 if a non-admin caller sets owner_field to another user."""
+    if get_jwt().get("is_admin", False):
+        return
+    caller = get_jwt_identity()
+    errors = [
+        {"index": index, "error": f"{owner_field} must be the caller's id"}
+        for index, item in enumerate(items)
+        if isinstance(item, dict) and item.get(owner_field, caller) != caller
+    ]
+    if errors:
+        namespace.abort(403, f"only admins may set {owner_field} to another user",
+                        errors=errors)
+
+
+def bulk_create(namespace, create, model, owner_field=None):
+    """Run create(items) on the request body and marshal the rows with model."""
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        namespace.abort(400, "body must be a non-empty JSON array")
+    maximum = current_app.config.get("BULK_MAX_ITEMS", 1000)
+    if len(items) > maximum:
+        namespace.abort(413, f"at most {maximum} items per request")
+    if owner_field is not None:
+        _check_owner(namespace, items, owner_field)
+    try:
+        rows = create(items)
+    except BulkValidationError as e:
+        namespace.abort(400, str(e), errors=e.errors)
+    return marshal(rows, model), 201
@@ -0,0 +1,117 @@
+"""Conditional GET and response caching for the list endpoints.
+
+@conditional_get("places", "reviews") tags a response with a strong ETag
+derived from the request (path, query string, Accept) and the versions of
+the collections it is built from (app.services.versions):
+
+- a request whose If-None-Match holds the current ETag gets an empty 304
+  without the handler, and so the database, being touched;
+- otherwise a 200 response is looked up in, or stored into, a bounded LRU
+  keyed the same way, so repeated reads of an unchanged list are served
+  from memory. Streamed (NDJSON) responses are tagged but not stored.
+
+Responses carry "Cache-Control: no-cache": clients may keep them but must
+revalidate, which costs a 304.
+
+Config: HTTP_CACHE (on/off, off unless enabled), HTTP_CACHE_SIZE (max
+cached responses). Only enable it when a single process serves and writes
+the database; see app.services.versions.
+"""
+
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request
+from flask_restx.utils import unpack
+
+from app.services import versions
+
+
+class ResponseCache:
+    """Thread-safe LRU of (body, status, headers) tuples."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        # Distinguishes this app's ETags from those of a previous process.
+        self.salt = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def init_app(app):
+    if app.config.get("HTTP_CACHE", False):
+        app.extensions["http_cache"] = ResponseCache(app.config.get("HTTP_CACHE_SIZE", 256))
+
+
+def _etag(cache, key):
+    return hashlib.sha1(repr((cache.salt, key)).encode("utf-8")).hexdigest()
+
+
+def _finish(response, etag):
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def conditional_get(*collections):
+    """Decorate a Resource.get built only from the given collections."""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(resource, *args, **kwargs):
+            cache = current_app.extensions.get("http_cache")
+            if cache is None:
+                return method(resource, *args, **kwargs)
+
+            # Read the versions before the data: a write racing with this
+            # request can only make the cached body newer than its tag.
+            key = (
+                request.path,
+                tuple(sorted(request.args.items(multi=True))),
+                request.headers.get("Accept", ""),
+                versions.current(*collections),
+            )
+            etag = _etag(cache, key)
+            if request.if_none_match.contains(etag):
+                return _finish(current_app.response_class(status=304), etag)
+
+            entry = cache.get(key)
+            if entry is not None:
+                body, status, headers = entry
+                return _finish(current_app.response_class(body, status, headers), etag)
+
+            result = method(resource, *args, **kwargs)
+            if isinstance(result, current_app.response_class) and result.is_streamed:
+                return _finish(result, etag)  # never buffer a streamed body
+            data, status, headers = unpack(result)
+            response = resource.api.make_response(data, status, headers=headers)
+            if response.status_code == 200:
+                cache.put(key, (response.get_data(), 200, list(response.headers.items())))
+            return _finish(response, etag)
+        return wrapper
+    return decorator
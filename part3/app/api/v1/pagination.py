@@ -0,0 +1,85 @@
+"""Keyset (cursor) pagination helpers shared by the list endpoints.
+
+A page is requested with ?limit=N&cursor=<opaque>. The cursor encodes the
+sort key of the last row already returned, so the next page is a range
+scan on an index ("WHERE key > last ORDER BY key LIMIT N") whose cost
+does not grow with the page number or the table size.
+
+The JSON body stays a plain list; paging metadata goes in headers:
+    X-Next-Cursor   cursor for the next page (absent on the last page)
+    Link            same, as an RFC 8288 rel="next" URL
+    X-Total-Count   row count, only when the request passes ?count=1
+"""
+
+import base64
+import json
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+
+def encode_cursor(values):
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("invalid cursor")
+    if not isinstance(values, list) or not values:
+        raise ValueError("invalid cursor")
+    # Only sort-key values; the length is checked against the sort key by
+    # the facade (_keyset_query).
+    if not all(v is None or (isinstance(v, (str, int, float)) and not isinstance(v, bool))
+               for v in values):
+        raise ValueError("invalid cursor")
+    return values
+
+
+def limit_arg(namespace):
+    """?limit=, defaulting to API_PAGE_SIZE and capped at API_MAX_PAGE_SIZE."""
+    default = current_app.config.get("API_PAGE_SIZE", 100)
+    maximum = current_app.config.get("API_MAX_PAGE_SIZE", 1000)
+    limit = request.args.get("limit", default, type=int)
+    if limit < 1:
+        namespace.abort(400, "limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def page_args(namespace):
+    """Return (limit, after) from the query string, aborting 400 when bad."""
+    limit = limit_arg(namespace)
+    cursor = request.args.get("cursor")
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            namespace.abort(400, str(e))
+    return limit, after
+
+
+def wants_count():
+    return request.args.get("count", "").lower() in ("1", "true", "yes")
+
+
+def page_response(items, limit, key, count=None):
+    """Trim items (fetched with limit + 1) and build the paging headers.
+
+    key(item) returns the list of sort-key values stored in the cursor.
+    """
+    headers = {}
+    if len(items) > limit:
+        items = items[:limit]
+        cursor = encode_cursor(key(items[-1]))
+        args = request.args.to_dict()
+        args.update(cursor=cursor, limit=str(limit))
+        args.pop("count", None)
+        headers["X-Next-Cursor"] = cursor
+        headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    if count is not None:
+        headers["X-Total-Count"] = str(count)
+    return items, headers
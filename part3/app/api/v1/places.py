@@ -1,6 +1,10 @@
 from flask import request
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required
+from flask_restx import Namespace, Resource, fields, marshal
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from app.api.v1.bulk import bulk_create
+from app.api.v1.http_cache import conditional_get
+from app.api.v1.pagination import limit_arg, page_args, page_response, wants_count
+from app.api.v1.streaming import ndjson_response, stream_args, wants_stream
 from app.services.hbnb_facade import HBnBFacade
 
 places_api = Namespace("places", description="Places operations")
@@ -27,16 +31,135 @@ place_model = places_api.model("Place", {
     "latitude": fields.Float,
     "longitude": fields.Float,
     "owner_id": fields.String,
+    "review_count": fields.Integer(readonly=True),
+    "avg_rating": fields.Float(readonly=True),
     "amenities": fields.List(fields.Nested(amenity_model)),
     "reviews": fields.List(fields.Nested(review_model)),
 })
 
+# A freshly inserted place, as returned by the bulk endpoint
+place_row_model = places_api.model("PlaceRow", {
+    name: field for name, field in place_model.items() if name not in ("amenities", "reviews")
+})
+
+# Relationships place_model serialises; loaded eagerly to avoid N+1 queries.
+PLACE_INCLUDE = ("amenities", "reviews")
+
+place_near_model = places_api.inherit("PlaceNear", place_model, {
+    "distance_km": fields.Float,
+})
+
+place_search_model = places_api.inherit("PlaceSearchResult", place_row_model, {
+    "score": fields.Float(description="Relevance, higher is better"),
+    "snippet": fields.String(description="HTML-escaped excerpt, matches in <mark>"),
+})
+
+
+def _float_arg(name):
+    raw = request.args.get(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        places_api.abort(400, f"{name} must be a number")
+
+
+def _id_list_arg(name):
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    return [value.strip() for value in raw.split(",") if value.strip()] or None
+
+
+def _place_filters():
+    filters = {
+        "min_price": _float_arg("min_price"),
+        "max_price": _float_arg("max_price"),
+        "min_rating": _float_arg("min_rating"),
+        "amenities": _id_list_arg("amenities"),
+    }
+    return {k: v for k, v in filters.items() if v is not None}
+
+
+def _spatial_search(filters):
+    """Run a bbox / radius search if the request asks for one, else None."""
+    lat, lon = _float_arg("lat"), _float_arg("lon")
+    radius_km = _float_arg("radius_km")
+    bbox = request.args.get("bbox")
+    if bbox is None and radius_km is None:
+        return None
+    limit = limit_arg(places_api)
+    try:
+        if bbox is not None:
+            try:
+                min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+            except ValueError:
+                places_api.abort(400, "bbox must be min_lon,min_lat,max_lon,max_lat")
+            return facade.find_places_in_bbox(min_lat, min_lon, max_lat, max_lon,
+                                              lat=lat, lon=lon, limit=limit,
+                                              include=PLACE_INCLUDE, **filters)
+        if lat is None or lon is None:
+            places_api.abort(400, "radius_km requires lat and lon")
+        return facade.find_places_near(lat, lon, radius_km, limit=limit,
+                                       include=PLACE_INCLUDE, **filters)
+    except ValueError as e:
+        places_api.abort(400, str(e))
+
+
 @places_api.route("/")
 class PlaceList(Resource):
 
-    @places_api.marshal_list_with(place_model)
+    @places_api.doc(params={
+        "lat": "Latitude of the search point",
+        "lon": "Longitude of the search point",
+        "radius_km": "Return places within this distance of lat/lon",
+        "bbox": "min_lon,min_lat,max_lon,max_lat (GeoJSON order)",
+        "min_price": "Only places costing at least this much",
+        "max_price": "Only places costing at most this much",
+        "min_rating": "Only places with at least this average rating",
+        "amenities": "Comma-separated amenity ids; only places having all of them",
+        "sort": "id (default), price, -price, rating or -rating; ignored by spatial searches",
+        "limit": "Page size (maximum number of results for a spatial search)",
+        "cursor": "Opaque cursor from the X-Next-Cursor header of the previous page",
+        "count": "Set to 1 to receive X-Total-Count",
+        "stream": "Set to 1 (or send Accept: application/x-ndjson) to stream every match as NDJSON",
+    })
+    @places_api.response(200, "Success", [place_near_model])
+    @conditional_get("places", "reviews", "amenities")
     def get(self):
-        return facade.get_places()
+        filters = _place_filters()
+        results = _spatial_search(filters)
+        if results is None and wants_stream():
+            limit, after = stream_args(places_api)
+            try:
+                places = facade.iter_places(limit=limit, after=after,
+                                            sort=request.args.get("sort", "id"),
+                                            include=PLACE_INCLUDE, **filters)
+            except ValueError as e:
+                places_api.abort(400, str(e))
+            return ndjson_response(places, place_model)
+        if results is None:
+            limit, after = page_args(places_api)
+            sort = request.args.get("sort", "id")
+            try:
+                places = facade.get_places(limit=limit + 1, after=after, sort=sort,
+                                           include=PLACE_INCLUDE, **filters)
+            except ValueError as e:
+                places_api.abort(400, str(e))
+            count = facade.count_places(**filters) if wants_count() else None
+            places, headers = page_response(
+                places, limit, lambda p: facade.place_sort_key(p, sort), count
+            )
+            return marshal(places, place_model), 200, headers
+        data = []
+        for place, distance in results:
+            item = marshal(place, place_model)
+            item["distance_km"] = round(distance, 3)
+            data.append(item)
+        if wants_stream():
+            return ndjson_response(data)
+        return data, 200
 
     @jwt_required()  # ✅ MUST be first
     @places_api.expect(place_model, validate=True)
@@ -56,12 +179,57 @@ class PlaceList(Resource):
         return place, 201
 
 
+@places_api.route("/bulk")
+class PlaceBulk(Resource):
+
+    @jwt_required()
+    @places_api.expect([place_model])
+    @places_api.response(201, "Created", [place_row_model])
+    def post(self):
+        """Create many places in one transaction (owner_id defaults to the
+        caller; only admins may set another owner)."""
+        return bulk_create(
+            places_api,
+            lambda items: facade.bulk_create_places(items, owner_id=get_jwt_identity()),
+            place_row_model,
+            owner_field="owner_id",
+        )
+
+
+@places_api.route("/search")
+class PlaceSearch(Resource):
+
+    @places_api.doc(params={
+        "q": "Words to find in place titles, descriptions and reviews (all must match; "
+             "a trailing * matches a prefix)",
+        "limit": "Maximum number of results (default 20)",
+    })
+    @places_api.response(200, "Success", [place_search_model])
+    @conditional_get("places", "reviews")
+    def get(self):
+        limit = request.args.get("limit", 20, type=int)
+        if limit < 1:
+            places_api.abort(400, "limit must be a positive integer")
+        try:
+            results = facade.search_places(request.args.get("q", ""),
+                                           limit=min(limit, facade.SEARCH_CANDIDATES))
+        except ValueError as e:
+            places_api.abort(400, str(e))
+        data = []
+        for place, score, snippet in results:
+            item = marshal(place, place_search_model)
+            item["score"] = round(score, 4)
+            item["snippet"] = snippet
+            data.append(item)
+        return data, 200
+
+
 @places_api.route("/<string:place_id>")
 class PlaceItem(Resource):
 
     @places_api.marshal_with(place_model)
     def get(self, place_id):
-        place = facade.get_place(place_id)
+        place = facade.get_place(place_id, include=PLACE_INCLUDE)
         if place is None:
             places_api.abort(404, "Place not found")
 
@@ -1,7 +1,11 @@
 from flask import request
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
+from app.api.v1.bulk import bulk_create
+from app.api.v1.http_cache import conditional_get
+from app.api.v1.pagination import page_args, page_response, wants_count
+from app.api.v1.streaming import ndjson_response, stream_args, wants_stream
 from app.services.hbnb_facade import HBnBFacade
 
 reviews_api = Namespace("reviews", description="Reviews operations")
@@ -17,12 +21,35 @@ review_model = reviews_api.model("Review", {
 
 @reviews_api.route("/")
 class ReviewList(Resource):
-    @reviews_api.marshal_list_with(review_model)
+    @reviews_api.doc(params={
+        "place_id": "Only reviews of this place",
+        "limit": "Page size",
+        "cursor": "Opaque cursor from the X-Next-Cursor header of the previous page",
+        "count": "Set to 1 to receive X-Total-Count",
+        "stream": "Set to 1 (or send Accept: application/x-ndjson) to stream every review as NDJSON",
+    })
+    @reviews_api.response(200, "Success", [review_model])
+    @conditional_get("reviews")
     def get(self):
         place_id = request.args.get("place_id")
-        if place_id:
-            return facade.get_reviews_by_place(place_id)
-        return facade.get_reviews()
+        if wants_stream():
+            limit, after = stream_args(reviews_api)
+            try:
+                reviews = facade.iter_reviews(limit=limit, after=after, place_id=place_id or None)
+            except ValueError as e:
+                reviews_api.abort(400, str(e))
+            return ndjson_response(reviews, review_model)
+        limit, after = page_args(reviews_api)
+        try:
+            if place_id:
+                reviews = facade.get_reviews_by_place(place_id, limit=limit + 1, after=after)
+            else:
+                reviews = facade.get_reviews(limit=limit + 1, after=after)
+        except ValueError as e:
+            reviews_api.abort(400, str(e))
+        count = facade.count_reviews(place_id or None) if wants_count() else None
+        reviews, headers = page_response(reviews, limit, lambda r: [r.id], count)
+        return marshal(reviews, review_model), 200, headers
 
     @reviews_api.expect(review_model, validate=True)
     @reviews_api.marshal_with(review_model, code=201)
@@ -38,6 +65,21 @@ class ReviewList(Resource):
         )
         return review, 201
 
+@reviews_api.route("/bulk")
+class ReviewBulk(Resource):
+    @reviews_api.expect([review_model])
+    @reviews_api.response(201, "Created", [review_model])
+    @jwt_required()
+    def post(self):
+        """Create many reviews in one transaction (user_id defaults to the
+        caller; only admins may review as another user)."""
+        return bulk_create(
+            reviews_api,
+            lambda items: facade.bulk_create_reviews(items, user_id=get_jwt_identity()),
+            review_model,
+            owner_field="user_id",
+        )
+
 @reviews_api.route("/<string:review_id>")
 class ReviewItem(Resource):
     @reviews_api.marshal_with(review_model)
@@ -0,0 +1,67 @@
+"""NDJSON streaming mode for the list endpoints.
+
+A list request with ?stream=1, or whose Accept header prefers
+application/x-ndjson, gets one JSON object per line instead of a JSON
+array:
+
+    {"id": "...", "name": "Wifi"}
+    {"id": "...", "name": "Pool"}
+
+Rows come from the facade's iter_* methods, which fetch them in yield_per
+batches from a streaming cursor, and each one is marshalled and written as
+it arrives. Nothing holds the whole result, so memory stays flat however
+many rows are exported.
+
+In stream mode limit is optional (no limit streams everything, no
+API_MAX_PAGE_SIZE cap) and cursor resumes after a row as for pages. No
+paging headers are sent, and X-DB-Queries is left out because the queries
+run after the headers have gone.
+"""
+
+import json
+
+from flask import current_app, request, stream_with_context
+from flask_restx import marshal
+
+from app.api.v1.pagination import decode_cursor
+
+NDJSON = "application/x-ndjson"
+
+# Lines joined into one chunk handed to the WSGI server.
+LINES_PER_CHUNK = 100
+
+
+def wants_stream():
+    if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    return request.accept_mimetypes.best_match(["application/json", NDJSON]) == NDJSON
+
+
+def stream_args(namespace):
+    """Return (limit or None, after) from the query string, aborting 400 when bad."""
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit < 1:
+        namespace.abort(400, "limit must be a positive integer")
+    cursor = request.args.get("cursor")
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            namespace.abort(400, str(e))
+    return limit, after
+
+
+def ndjson_response(rows, model=None):
+    """Stream rows (marshalled with model, or already dicts) as NDJSON."""
+    def generate():
+        lines = []
+        for row in rows:
+            lines.append(json.dumps(marshal(row, model) if model is not None else row))
+            if len(lines) >= LINES_PER_CHUNK:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    return current_app.response_class(stream_with_context(generate()), mimetype=NDJSON)
@@ -1,9 +1,13 @@
 from flask import request
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
+from app.api.v1.pagination import page_args, page_response, wants_count
+from app.api.v1.streaming import ndjson_response, stream_args, wants_stream
 from app.extensions import db
 from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
 
 users_api = Namespace("users", description="User endpoints")
+facade = HBnBFacade()
 
 user_create = users_api.model("UserCreate", {
     "email": fields.String(required=True),
@@ -18,9 +22,29 @@ user_out = users_api.model("UserOut", {
 
 @users_api.route("/")
 class UsersCollection(Resource):
-    @users_api.marshal_list_with(user_out)
+    @users_api.doc(params={
+        "limit": "Page size",
+        "cursor": "Opaque cursor from the X-Next-Cursor header of the previous page",
+        "count": "Set to 1 to receive X-Total-Count",
+        "stream": "Set to 1 (or send Accept: application/x-ndjson) to stream every user as NDJSON",
+    })
+    @users_api.response(200, "Success", [user_out])
     def get(self):
-        return User.query.all(), 200
+        if wants_stream():
+            limit, after = stream_args(users_api)
+            try:
+                users = facade.iter_users(limit=limit, after=after)
+            except ValueError as e:
+                users_api.abort(400, str(e))
+            return ndjson_response(users, user_out)
+        limit, after = page_args(users_api)
+        try:
+            users = facade.get_users(limit=limit + 1, after=after)
+        except ValueError as e:
+            users_api.abort(400, str(e))
+        count = facade.count_users() if wants_count() else None
+        users, headers = page_response(users, limit, lambda u: [u.id], count)
+        return marshal(users, user_out), 200, headers
 
     @users_api.expect(user_create, validate=True)
     @users_api.marshal_with(user_out, code=201)
@@ -1,5 +1,10 @@
 from flask import Flask
-from app.extensions import db, jwt, bcrypt
+from app.extensions import db, jwt, bcrypt, password_hasher
+from app import instrumentation
+from app.persistence import routing
+from app.api.v1 import http_cache
+from app.services import entity_cache
+from hbnb_common import sqlite_profile
 from app.api.v1.routes import blueprint as api_v1_blueprint
 from config import config as config_map
 
@@ -10,8 +15,14 @@ def create_app(config_name="default"):
     app.config.from_object(cfg)
 
     db.init_app(app)
+    sqlite_profile.init_app(app, db)
+    routing.init_app(app, db)  # before instrumentation, which hooks both engines
     jwt.init_app(app)
     bcrypt.init_app(app)
+    instrumentation.init_app(app)
+    http_cache.init_app(app)
+    entity_cache.init_app(app)
+    password_hasher.init_app(app)
 
     from app.models.user import User
     from app.models.place import Place
@@ -24,6 +35,9 @@ def create_app(config_name="default"):
         response.headers["Access-Control-Allow-Origin"] = "*"
         response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
         response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
+        response.headers["Access-Control-Expose-Headers"] = (
+            "X-Next-Cursor, X-Total-Count, Link, ETag, X-DB-Queries, Server-Timing"
+        )
         return response
 
     # ✅ FORCE JWT ERRORS TO RETURN 401
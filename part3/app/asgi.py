@@ -0,0 +1,298 @@
+"""Async (ASGI) serving mode for the read endpoints.
+
+AsyncReadApp answers GET and HEAD on
+
+    /api/v1/places/            /api/v1/places/<id>
+    /api/v1/reviews/           /api/v1/reviews/<id>
+    /api/v1/amenities/         /api/v1/amenities/<id>
+
+with the same JSON bodies and paging headers as the Flask API, using an
+async SQLAlchemy engine (aiosqlite) so one process keeps many slow reads
+in flight without a thread per request. It reuses the Flask app's models,
+the facade's SELECT builders (select_places() etc.) and the flask-restx
+marshal models; only the HTTP plumbing is separate.
+
+Writes, auth, spatial search, amenity filters and ETag handling stay on the
+WSGI app: put both behind the proxy and send GETs of these paths here, e.g.
+
+    uvicorn asgi:application        # part3/asgi.py
+
+The async engine opens the SQLite file read-only (mode=ro). Set
+ASYNC_DATABASE_URI to read elsewhere (a replica) instead.
+"""
+
+import json
+from urllib.parse import parse_qs, urlencode
+
+from flask_restx import marshal
+from sqlalchemy import func, make_url, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.amenities import amenity_model
+from app.api.v1.pagination import decode_cursor, encode_cursor
+from app.api.v1.places import PLACE_INCLUDE, place_model
+from app.api.v1.reviews import review_model
+from app.extensions import db
+from app.persistence.routing import readonly_sqlite_uri
+from hbnb_common.sqlite_profile import apply_pragmas
+from app.services.hbnb_facade import HBnBFacade
+
+PREFIX = "/api/v1"
+SPATIAL_ARGS = ("bbox", "radius_km", "lat", "lon")
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-expose-headers", b"X-Next-Cursor, X-Total-Count, Link"),
+]
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def async_database_uri(url):
+    """aiosqlite URI opening the SQLite database at url read-only."""
+    return make_url(readonly_sqlite_uri(url)).set(drivername="sqlite+aiosqlite")
+
+
+class Request:
+    """The parts of an ASGI HTTP scope the handlers need."""
+
+    def __init__(self, scope):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.query_string = scope.get("query_string", b"").decode("latin-1")
+        self.args = {k: v[0] for k, v in parse_qs(self.query_string,
+                                                  keep_blank_values=True).items()}
+        headers = dict(scope.get("headers") or [])
+        host = headers.get(b"host", b"").decode("latin-1")
+        if not host and scope.get("server"):
+            host = "%s:%s" % tuple(scope["server"])
+        self.base_url = f"{scope.get('scheme', 'http')}://{host}{scope.get('root_path', '')}{self.path}"
+
+    def float_arg(self, name):
+        raw = self.args.get(name)
+        if raw is None or raw == "":
+            return None
+        try:
+            return float(raw)
+        except ValueError:
+            raise HTTPError(400, f"{name} must be a number")
+
+    def wants_count(self):
+        return self.args.get("count", "").lower() in ("1", "true", "yes")
+
+
+class AsyncReadApp:
+    """ASGI application serving the list and item GETs of the API."""
+
+    def __init__(self, flask_app):
+        self.config = flask_app.config
+        self.facade = HBnBFacade()
+        uri = self.config.get("ASYNC_DATABASE_URI")
+        if uri is None:
+            with flask_app.app_context():
+                uri = async_database_uri(db.engine.url)
+        self.engine = create_async_engine(uri, **self.config.get("ASYNC_ENGINE_OPTIONS", {}))
+        pragmas = dict(self.config.get("SQLITE_PRAGMAS") or {})
+        pragmas.pop("journal_mode", None)  # set by the primary
+        apply_pragmas(self.engine.sync_engine, pragmas)
+        self.session = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.routes = {
+            "places": (self.list_places, self.get_place),
+            "reviews": (self.list_reviews, self.get_review),
+            "amenities": (self.list_amenities, self.get_amenity),
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        request = Request(scope)
+        headers = []
+        try:
+            handler, args = self._route(request)
+            if request.method not in ("GET", "HEAD"):
+                headers.append((b"allow", b"GET, HEAD"))
+                raise HTTPError(405, "The method is not allowed for the requested URL.")
+            async with self.session() as session:
+                data, extra = await handler(session, request, *args)
+            status = 200
+            headers.extend((k.lower().encode("latin-1"), v.encode("latin-1"))
+                           for k, v in extra.items())
+        except HTTPError as e:
+            status, data = e.status, {"message": e.message}
+        body = json.dumps(data).encode("utf-8") + b"\n"
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ] + CORS_HEADERS
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body",
+                    "body": b"" if request.method == "HEAD" else body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _route(self, request):
+        parts = request.path[len(PREFIX):].strip("/").split("/")
+        if request.path.startswith(PREFIX + "/") and parts[0] in self.routes:
+            list_handler, item_handler = self.routes[parts[0]]
+            if len(parts) == 1:
+                return list_handler, ()
+            if len(parts) == 2 and parts[1]:
+                return item_handler, (parts[1],)
+        raise HTTPError(404, "The requested URL was not found on the server.")
+
+    # -------------------------
+    # Paging (mirrors app/api/v1/pagination.py)
+    # -------------------------
+    def _page_args(self, request):
+        limit = self.config.get("API_PAGE_SIZE", 100)
+        try:
+            limit = int(request.args.get("limit", limit))
+        except ValueError:
+            pass
+        if limit < 1:
+            raise HTTPError(400, "limit must be a positive integer")
+        limit = min(limit, self.config.get("API_MAX_PAGE_SIZE", 1000))
+        after = None
+        if request.args.get("cursor"):
+            try:
+                after = decode_cursor(request.args["cursor"])
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+        return limit, after
+
+    @staticmethod
+    async def _page(session, request, stmt, limit, key, count_stmt=None):
+        """Run stmt (built with limit + 1) and return (rows, paging headers)."""
+        items = list(await session.scalars(stmt))
+        headers = {}
+        if len(items) > limit:
+            items = items[:limit]
+            cursor = encode_cursor(key(items[-1]))
+            args = dict(request.args, cursor=cursor, limit=str(limit))
+            args.pop("count", None)
+            headers["X-Next-Cursor"] = cursor
+            headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+        if count_stmt is not None and request.wants_count():
+            count = await session.scalar(
+                select(func.count()).select_from(count_stmt.order_by(None).subquery())
+            )
+            headers["X-Total-Count"] = str(count)
+        return items, headers
+
+    # -------------------------
+    # Handlers
+    # -------------------------
+    async def list_places(self, session, request):
+        if any(name in request.args for name in SPATIAL_ARGS):
+            raise HTTPError(400, "spatial search is not served by the async read path")
+        if request.args.get("amenities"):
+            # The amenity filter plans with a query of its own (sync session).
+            raise HTTPError(400, "amenity filters are not served by the async read path")
+        filters = {name: request.float_arg(name)
+                   for name in ("min_price", "max_price", "min_rating")}
+        filters = {k: v for k, v in filters.items() if v is not None}
+        sort = request.args.get("sort", "id")
+        limit, after = self._page_args(request)
+        try:
+            stmt = self.facade.select_places(limit + 1, after, sort=sort,
+                                             include=PLACE_INCLUDE, **filters)
+            count_stmt = self.facade.select_places(**filters)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        places, headers = await self._page(session, request, stmt, limit,
+                                           lambda p: self.facade.place_sort_key(p, sort),
+                                           count_stmt)
+        return marshal(places, place_model), headers
+
+    async def get_place(self, session, request, place_id):
+        from app.models.place import Place
+        stmt = self.facade._join_amenities(select(Place).filter_by(id=place_id).options(
+            *self.facade._place_load_options(PLACE_INCLUDE, single=True)))
+        place = (await session.scalars(stmt)).unique().one_or_none()
+        if place is None:
+            raise HTTPError(404, "Place not found")
+        return marshal(place, place_model), {}
+
+    async def list_reviews(self, session, request):
+        place_id = request.args.get("place_id") or None
+        limit, after = self._page_args(request)
+        try:
+            stmt = self.facade.select_reviews(limit + 1, after, place_id)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        reviews, headers = await self._page(session, request, stmt, limit, lambda r: [r.id],
+                                            self.facade.select_reviews(place_id=place_id))
+        return marshal(reviews, review_model), headers
+
+    async def get_review(self, session, request, review_id):
+        from app.models.review import Review
+        review = await session.get(Review, review_id)
+        if review is None:
+            raise HTTPError(404, "Review not found")
+        return marshal(review, review_model), {}
+
+    async def list_amenities(self, session, request):
+        limit, after = self._page_args(request)
+        try:
+            stmt = self.facade.select_amenities(limit + 1, after)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        amenities, headers = await self._page(session, request, stmt, limit, lambda a: [a.id],
+                                              self.facade.select_amenities())
+        return marshal(amenities, amenity_model), headers
+
+    async def get_amenity(self, session, request, amenity_id):
+        from app.models.amenity import Amenity
+        amenity = await session.get(Amenity, amenity_id)
+        if amenity is None:
+            raise HTTPError(404, "Amenity not found")
+        return marshal(amenity, amenity_model), {}
+
+
+def create_asgi_app(config_name="default"):
+    """Build the Flask app for config_name (tables, config) and wrap its
+    database in an AsyncReadApp."""
+    from app.app import create_app
+    return AsyncReadApp(create_app(config_name))
+
+
+async def call(app, path, query_string="", method="GET", headers=()):
+    """Send one request to an ASGI app in process, like Flask's test
+    client; returns (status, headers dict, body bytes)."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": method, "scheme": "http", "path": path, "root_path": "",
+        "query_string": query_string.encode("latin-1"),
+        "headers": [(b"host", b"localhost")] + [(k.lower().encode(), v.encode())
+                                                for k, v in headers],
+        "server": ("localhost", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    response_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, body
@@ -2,7 +2,11 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 
-db = SQLAlchemy()
+from app.persistence.routing import RoutingSession
+from hbnb_common.password_hasher import PasswordHasher
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 jwt = JWTManager()
 bcrypt = Bcrypt()
+password_hasher = PasswordHasher()
 
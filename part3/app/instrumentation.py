@@ -0,0 +1,136 @@
+"""Per-request SQL instrumentation.
+
+SQLAlchemy engine events time every statement. While a request is being
+handled the timings are collected on flask.g, and after_request turns them
+into response headers:
+
+    X-DB-Queries: 3
+    Server-Timing: db;dur=1.84;desc="3 queries", app;dur=7.02
+
+The same numbers are folded into a QueryAggregator kept in
+app.extensions["sql_stats"], which summarises statement counts and DB time
+per endpoint for the life of the process.
+"""
+
+import threading
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from app.extensions import db
+
+
+class RequestQueryStats:
+    """Statements run while handling one request."""
+
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement = None
+
+    def record(self, statement, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+
+class QueryAggregator:
+    """Thread-safe per-endpoint totals of RequestQueryStats."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, stats):
+        with self._lock:
+            entry = self._endpoints.get(endpoint)
+            if entry is None:
+                entry = self._endpoints[endpoint] = {
+                    "requests": 0,
+                    "queries": 0,
+                    "max_queries": 0,
+                    "db_ms": 0.0,
+                    "slowest_ms": 0.0,
+                    "slowest_statement": None,
+                }
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            entry["db_ms"] += stats.total_ms
+            if stats.slowest_statement is not None and stats.slowest_ms >= entry["slowest_ms"]:
+                entry["slowest_ms"] = stats.slowest_ms
+                entry["slowest_statement"] = stats.slowest_statement
+
+    def snapshot(self):
+        """Return {endpoint: totals} with per-request averages added."""
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._endpoints.items():
+                summary = dict(entry)
+                summary["avg_queries"] = entry["queries"] / entry["requests"]
+                summary["avg_db_ms"] = entry["db_ms"] / entry["requests"]
+                result[endpoint] = summary
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    if has_request_context():
+        stats = g.get("query_stats")
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+
+
+def init_app(app):
+    """Hook the app's engine and request cycle; no-op if SQL_INSTRUMENTATION is off."""
+    if not app.config.get("SQL_INSTRUMENTATION", True):
+        return None
+
+    aggregator = QueryAggregator()
+    app.extensions["sql_stats"] = aggregator
+
+    with app.app_context():
+        engines = [db.engine]
+    if app.extensions.get("read_engine") is not None:
+        engines.append(app.extensions["read_engine"])
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    @app.before_request
+    def start_query_stats():
+        g.query_stats = RequestQueryStats()
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def add_query_headers(response):
+        stats = g.get("query_stats")
+        if stats is None or response.is_streamed:
+            # A streamed body runs its queries after the headers are sent.
+            return response
+        app_ms = (time.perf_counter() - g.request_started) * 1000
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries", app;dur={app_ms:.2f}'
+        )
+        aggregator.record(request.endpoint, stats)
+        return response
+
+    return aggregator
@@ -4,4 +4,7 @@ place_amenity = db.Table(
     "place_amenity",
     db.Column("place_id", db.String(36), db.ForeignKey("places.id", ondelete="CASCADE"), primary_key=True),
     db.Column("amenity_id", db.String(36), db.ForeignKey("amenities.id", ondelete="CASCADE"), primary_key=True),
+    # places having an amenity (the ?amenities= filter); the primary key
+    # serves the other direction, the amenities of a place
+    db.Index("ix_place_amenity_amenity_id_place_id", "amenity_id", "place_id"),
 )
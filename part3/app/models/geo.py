@@ -0,0 +1,81 @@
+"""Grid-based spatial indexing helpers for places.
+
+The globe is cut into CELL_DEGREES x CELL_DEGREES cells numbered row by row
+(row = latitude band, column = longitude band). Each place stores the
+number of the cell it falls in (places.geo_cell, a plain B-tree index), so
+a bounding box becomes one contiguous geo_cell range per latitude band
+instead of a scan of the whole table.
+"""
+
+import math
+
+CELL_DEGREES = 0.5
+_ROWS = int(180 / CELL_DEGREES)
+_COLS = int(360 / CELL_DEGREES)
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _row(lat):
+    return min(max(int((lat + 90.0) // CELL_DEGREES), 0), _ROWS - 1)
+
+
+def _col(lon):
+    return min(max(int((lon + 180.0) // CELL_DEGREES), 0), _COLS - 1)
+
+
+def cell_for(lat, lon):
+    """Return the grid cell of a coordinate, or None if either is missing."""
+    if lat is None or lon is None:
+        return None
+    return _row(lat) * _COLS + _col(lon)
+
+
+def cell_ranges(min_lat, min_lon, max_lat, max_lon):
+    """Inclusive (first, last) geo_cell ranges covering a bounding box.
+
+    min_lon > max_lon means the box crosses the antimeridian.
+    """
+    if min_lon <= max_lon:
+        col_spans = [(_col(min_lon), _col(max_lon))]
+    else:
+        col_spans = [(_col(min_lon), _COLS - 1), (0, _col(max_lon))]
+    ranges = []
+    for row in range(_row(min_lat), _row(max_lat) + 1):
+        base = row * _COLS
+        for first, last in col_spans:
+            ranges.append((base + first, base + last))
+    return ranges
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two coordinates in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bbox_around(lat, lon, radius_km):
+    """Smallest (min_lat, min_lon, max_lat, max_lon) box containing the circle.
+
+    The longitude span may wrap (min_lon > max_lon) and covers every
+    longitude when the circle reaches a pole.
+    """
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - dlat, lat + dlat
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+    dlon = math.degrees(
+        math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat))))
+    )
+    if dlon >= 180.0:
+        return min_lat, -180.0, max_lat, 180.0
+    min_lon, max_lon = lon - dlon, lon + dlon
+    if min_lon < -180.0:
+        min_lon += 360.0
+    if max_lon > 180.0:
+        max_lon -= 360.0
+    return min_lat, min_lon, max_lat, max_lon
+
@@ -1,19 +1,37 @@
 from app.extensions import db
-from sqlalchemy import Column, String, Float, ForeignKey
+from app.models.geo import cell_for
+from sqlalchemy import Column, String, Float, Integer, ForeignKey, event, func, select, update
 from sqlalchemy.orm import relationship
 import uuid
 
 class Place(db.Model):
     __tablename__ = "places"
+    __table_args__ = (
+        # price range filters and price-ordered pages (keyset on price, id)
+        db.Index("ix_places_price_id", "price", "id"),
+        # rating-ordered pages and min_rating filters
+        db.Index("ix_places_avg_rating_id", "avg_rating", "id"),
+    )
 
     id = Column(String(60), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(100), nullable=False)
     description = Column(String(1024), nullable=True)
     price = Column(Float, nullable=False)
-    latitude = Column(Float, nullable=True)
+    latitude = Column(Float, nullable=True, index=True)
     longitude = Column(Float, nullable=True)
     owner_id = Column(String(60), ForeignKey("users.id"), nullable=False)
 
+    # Spatial grid cell derived from latitude/longitude (see app.models.geo)
+    geo_cell = Column(Integer, nullable=True, index=True)
+
+    # Review aggregates, maintained by HBnBFacade on every review write
+    # (recompute_place_ratings() rebuilds them). rating_count only counts
+    # reviews with a rating; avg_rating is 0 until the first one.
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    avg_rating = Column(Float, nullable=False, default=0.0, server_default="0")
+
     owner = relationship("User", back_populates="places")
     reviews = relationship("Review", back_populates="place", cascade="all, delete-orphan")
     amenities = relationship("Amenity", secondary="place_amenity", back_populates="places")
@@ -26,6 +44,34 @@ class Place(db.Model):
             "price": self.price,
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "owner_id": self.owner_id
+            "owner_id": self.owner_id,
+            "review_count": self.review_count,
+            "avg_rating": self.avg_rating,
         }
 
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _sync_geo_cell(mapper, connection, target):
+    """Keep geo_cell in step with the coordinates on every ORM write."""
+    target.geo_cell = cell_for(target.latitude, target.longitude)
+
+
+def ratings_update(place_id=None):
+    """UPDATE rebuilding the review aggregates of one place, or of every
+    place, from the reviews table."""
+    from app.models.review import Review
+
+    def per_place(expr):
+        return (select(expr).where(Review.place_id == Place.id)
+                .correlate(Place).scalar_subquery())
+
+    stmt = update(Place).values(
+        review_count=per_place(func.count()),
+        rating_count=per_place(func.count(Review.rating)),
+        rating_sum=per_place(func.coalesce(func.sum(Review.rating), 0)),
+        avg_rating=per_place(func.coalesce(func.avg(Review.rating), 0.0)),
+    )
+    if place_id is not None:
+        stmt = stmt.where(Place.id == place_id)
+    return stmt
@@ -3,6 +3,10 @@ from app.extensions import db
 
 class Review(db.Model):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # serves "reviews of a place" pages in id order
+        db.Index("ix_reviews_place_id_id", "place_id", "id"),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     text = db.Column(db.Text, nullable=False)
@@ -1,5 +1,5 @@
 import uuid
-from app.extensions import db, bcrypt
+from app.extensions import db, password_hasher
 
 class User(db.Model):
     __tablename__ = "users"
@@ -23,10 +23,15 @@ class User(db.Model):
     )
 
     def set_password(self, password):
-        self.password_hash = bcrypt.generate_password_hash(password).decode()
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return bcrypt.check_password_hash(self.password_hash, password)
+        """Verify password, upgrading the stored hash if its cost is outdated
+        (the caller commits the change)."""
+        ok, new_hash = password_hasher.verify_and_update(password, self.password_hash)
+        if new_hash is not None:
+            self.password_hash = new_hash
+        return ok
 
     def to_dict(self) -> dict:
         return {
@@ -0,0 +1,89 @@
+"""Additive schema upgrades for databases created before a column existed.
+
+db.create_all() creates missing tables but never alters existing ones, so
+a column added to a model leaves older databases failing every SELECT of
+that table with "no such column". upgrade() brings them up to date:
+
+- add_missing_columns() issues ALTER TABLE ... ADD COLUMN for each model
+  column missing from an existing table, then creates the indexes that
+  cover it;
+- the BACKFILLS hook of a newly added column fills it from existing data.
+
+Run by `python create_db.py` (every command) and recompute_ratings.py.
+Only nullable columns and columns with a server default can be added.
+"""
+
+from sqlalchemy import bindparam, inspect, select, update
+
+from app.extensions import db
+from app.models.geo import cell_for
+
+BACKFILL_ROWS = 10_000
+
+
+def add_missing_columns(conn, metadata):
+    """Add the columns of metadata missing from tables that already exist.
+
+    Returns {table name: [added column names]}.
+    """
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    compiler = conn.dialect.ddl_compiler(conn.dialect, None)
+    added = {}
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column for column in table.columns if column.name not in present]
+        for column in missing:
+            if not column.nullable and column.server_default is None:
+                raise ValueError(f"cannot add {table.name}.{column.name}: "
+                                 "NOT NULL without a server default")
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN "
+                                 f"{compiler.get_column_specification(column)}")
+        if missing:
+            names = {column.name for column in missing}
+            for index in table.indexes:
+                if names & {column.name for column in index.columns}:
+                    index.create(conn, checkfirst=True)
+            added[table.name] = [column.name for column in missing]
+    return added
+
+
+def _backfill_geo_cell(conn):
+    places = db.metadata.tables["places"]
+    rows = conn.execute(select(places.c.id, places.c.latitude, places.c.longitude)
+                        .where(places.c.latitude.is_not(None),
+                               places.c.longitude.is_not(None))).all()
+    stmt = (update(places).where(places.c.id == bindparam("place_id"))
+            .values(geo_cell=bindparam("cell")))
+    for start in range(0, len(rows), BACKFILL_ROWS):
+        conn.execute(stmt, [{"place_id": place_id, "cell": cell_for(lat, lon)}
+                            for place_id, lat, lon in rows[start:start + BACKFILL_ROWS]])
+
+
+def _backfill_ratings(conn):
+    from app.models.place import ratings_update
+    conn.execute(ratings_update())
+
+
+# (table, column) -> fn(conn) run once the column has been added; a function
+# shared by several columns runs once.
+BACKFILLS = {
+    ("places", "geo_cell"): _backfill_geo_cell,
+    ("places", "review_count"): _backfill_ratings,
+    ("places", "rating_count"): _backfill_ratings,
+    ("places", "rating_sum"): _backfill_ratings,
+    ("places", "avg_rating"): _backfill_ratings,
+}
+
+
+def upgrade(conn):
+    """Add and backfill the app's missing columns; returns add_missing_columns()."""
+    added = add_missing_columns(conn, db.metadata)
+    done = set()
+    for (table, column), backfill in BACKFILLS.items():
+        if column in added.get(table, ()) and backfill not in done:
+            backfill(conn)
+            done.add(backfill)
+    return added
@@ -0,0 +1,81 @@
+"""Route reads to a read-only engine and writes to the primary.
+
+RoutingSession is the session class of app.extensions.db. While handling
+a GET, HEAD or OPTIONS request it sends plain SELECTs (including the
+facade's get_* lookups) to app.extensions["read_engine"]: a replica, or a
+second SQLite pool opened with mode=ro. Everything else uses the primary:
+
+- any flush or INSERT/UPDATE/DELETE, after which the session is pinned to
+  the primary for the rest of the request, so it reads its own writes;
+- SELECT ... FOR UPDATE;
+- every statement of a POST/PUT/PATCH/DELETE request, so read-modify-write
+  sequences (get_place() then update_place()) see current data;
+- work outside a request (CLI scripts, tests without a client).
+
+Configure with SQLALCHEMY_READ_URI: a database URI, or "readonly" to open
+the primary SQLite file again with mode=ro. Unset means no routing.
+"""
+
+from urllib.parse import quote
+
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine
+from sqlalchemy.sql import Select
+
+from hbnb_common.sqlite_profile import apply_pragmas
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that can send reads to a read engine."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._is_read(clause):
+                engine = self._read_engine()
+                if engine is not None:
+                    return engine
+            elif self._flushing or clause is not None:
+                self.info["pinned_to_primary"] = True
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _is_read(self, clause):
+        return (
+            isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not self._flushing
+            and not self.info.get("pinned_to_primary")
+            and has_request_context()
+            and request.method in READ_METHODS
+        )
+
+    @staticmethod
+    def _read_engine():
+        return current_app.extensions.get("read_engine")
+
+
+def readonly_sqlite_uri(url):
+    """URI opening the same SQLite file as url in read-only mode."""
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        raise ValueError("a read-only connection needs a file-backed SQLite database")
+    return f"sqlite:///file:{quote(url.database)}?mode=ro&uri=true"
+
+
+def init_app(app, db):
+    """Create the read engine named by SQLALCHEMY_READ_URI, if any."""
+    uri = app.config.get("SQLALCHEMY_READ_URI")
+    if not uri:
+        return None
+    with app.app_context():
+        primary = db.engine
+    if uri == "readonly":
+        uri = readonly_sqlite_uri(primary.url)
+    engine = create_engine(uri, **app.config.get("SQLALCHEMY_READ_ENGINE_OPTIONS", {}))
+    # journal_mode is a property of the database file, set by the primary.
+    pragmas = dict(app.config.get("SQLITE_PRAGMAS") or {})
+    pragmas.pop("journal_mode", None)
+    apply_pragmas(engine, pragmas)
+    app.extensions["read_engine"] = engine
+    return engine
@@ -0,0 +1,182 @@
+"""SQLite FTS5 full-text index over place and review text.
+
+Two external-content FTS5 tables index the text where it already lives,
+without keeping a second copy of it:
+
+    places_fts(title, description)   content=places_fts_source
+    reviews_fts(text)                content=reviews_fts_source
+
+places and reviews have text primary keys, and their implicit rowid may
+be renumbered by VACUUM, so index rows are not keyed on it. Each row gets
+a stable integer key instead, in {fts}_keys(key INTEGER PRIMARY KEY, id);
+the {fts}_source view joins keys to rows and is what FTS5 reads.
+
+Triggers on places and reviews keep keys and index in step with every
+write, through the ORM or raw SQL (bulk endpoints). bulk_io drops the
+triggers of a table while importing it and rebuilds its index once at
+the end, as it does for the secondary indexes.
+
+The tables, view and triggers are created by db.create_all() and dropped
+by db.drop_all() (SQLite only). A database created before they existed,
+or with the older rowid-keyed index, gets them, built from its current
+rows, on the next create_all(). rebuild() re-reads the content tables:
+`python create_db.py reindex`.
+
+Text is tokenized by unicode61 (any script, diacritics folded) with the
+porter stemmer on top, so "clean" also matches "cleaning". Ranking is
+bm25 with a place's title weighted over its description.
+"""
+
+import html
+import re
+
+from sqlalchemy import event, text
+
+from app.extensions import db
+
+TOKENIZE = "porter unicode61 remove_diacritics 2"
+
+# content table -> (FTS table, indexed columns, bm25 column weights)
+INDEXES = {
+    "places": ("places_fts", ("title", "description"), (10.0, 1.0)),
+    "reviews": ("reviews_fts", ("text",), (1.0,)),
+}
+
+MAX_TERMS = 16
+
+# Placeholders for snippet() highlights, replaced after HTML escaping.
+_OPEN, _CLOSE = "\x02", "\x03"
+HIGHLIGHT = ("<mark>", "</mark>")
+
+_TERM = re.compile(r"\w+\*?")
+
+
+def keys_table(table):
+    """Name of the table mapping table's ids to index keys."""
+    return f"{INDEXES[table][0]}_keys"
+
+
+def _source(table):
+    return f"{INDEXES[table][0]}_source"
+
+
+def _triggers(table):
+    fts, columns, _ = INDEXES[table]
+    keys = keys_table(table)
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    add_key = f"INSERT OR IGNORE INTO {keys}(id) VALUES (new.id);"
+    drop_key = f"DELETE FROM {keys} WHERE id = old.id;"
+    insert_new = (f"INSERT INTO {fts}(rowid, {names}) "
+                  f"SELECT key, {new} FROM {keys} WHERE id = new.id;")
+    delete_old = (f"INSERT INTO {fts}({fts}, rowid, {names}) "
+                  f"SELECT 'delete', key, {old} FROM {keys} WHERE id = old.id;")
+    return {
+        f"{fts}_ai": f"AFTER INSERT ON {table} BEGIN {add_key} {insert_new} END",
+        f"{fts}_ad": f"AFTER DELETE ON {table} BEGIN {delete_old} {drop_key} END",
+        # Only the indexed columns: rating aggregate updates skip the index.
+        f"{fts}_au": f"AFTER UPDATE OF {names} ON {table} BEGIN {delete_old} {insert_new} END",
+    }
+
+
+def create_triggers(conn, table):
+    for name, body in _triggers(table).items():
+        conn.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def drop_triggers(conn, table):
+    for name in _triggers(table):
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def rebuild(conn, tables=tuple(INDEXES)):
+    """Re-read the whole content table(s) into the index."""
+    for table in tables:
+        fts, keys = INDEXES[table][0], keys_table(table)
+        conn.exec_driver_sql(f"DELETE FROM {keys} WHERE id NOT IN (SELECT id FROM {table})")
+        conn.exec_driver_sql(f"INSERT OR IGNORE INTO {keys}(id) "
+                             f"SELECT id FROM {table} ORDER BY rowid")
+        conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _exists(conn, name):
+    return conn.scalar(text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+                       {"name": name}) is not None
+
+
+def _drop_index(conn, table):
+    fts = INDEXES[table][0]
+    drop_triggers(conn, table)
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {fts}")
+    conn.exec_driver_sql(f"DROP VIEW IF EXISTS {_source(table)}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {keys_table(table)}")
+
+
+def create(conn):
+    """Create missing FTS tables and triggers; index rows already present."""
+    for table, (fts, columns, weights) in INDEXES.items():
+        if not _exists(conn, table):
+            continue
+        keys, source = keys_table(table), _source(table)
+        if not _exists(conn, keys):
+            _drop_index(conn, table)  # absent, or the older rowid-keyed one
+            conn.exec_driver_sql(f"CREATE TABLE {keys} "
+                                 f"(key INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE)")
+            conn.exec_driver_sql(
+                f"CREATE VIEW {source} AS SELECT {keys}.key, "
+                f"{', '.join(f'{table}.{c}' for c in columns)} "
+                f"FROM {keys} JOIN {table} ON {table}.id = {keys}.id"
+            )
+            conn.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({', '.join(columns)}, "
+                f"content='{source}', content_rowid='key', tokenize='{TOKENIZE}')"
+            )
+            conn.exec_driver_sql(f"INSERT INTO {fts}({fts}, rank) "
+                                 f"VALUES ('rank', 'bm25({', '.join(map(str, weights))})')")
+            rebuild(conn, [table])
+        create_triggers(conn, table)
+
+
+def drop(conn):
+    for table in INDEXES:
+        _drop_index(conn, table)
+
+
+@event.listens_for(db.metadata, "after_create")
+def _after_create(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        create(connection)
+
+
+@event.listens_for(db.metadata, "before_drop")
+def _before_drop(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        drop(connection)
+
+
+def match_query(q):
+    """FTS5 query for the words of q, all required (implicit AND).
+
+    Each word is quoted, so user input cannot use (or break) the FTS5
+    query syntax; a trailing * keeps its prefix-match meaning.
+    """
+    terms = _TERM.findall(q or "")
+    if not terms:
+        raise ValueError("q must contain at least one word")
+    if len(terms) > MAX_TERMS:
+        raise ValueError(f"q must not contain more than {MAX_TERMS} words")
+    return " ".join(f'"{term.rstrip("*")}"' + ("*" if term.endswith("*") else "")
+                    for term in terms)
+
+
+def snippet_sql(fts, tokens=12):
+    """snippet() of the best matching column, highlighted with placeholders."""
+    return f"snippet({fts}, -1, '{_OPEN}', '{_CLOSE}', '…', {tokens})"
+
+
+def highlight(raw):
+    """HTML-escape a snippet, then mark its matches with HIGHLIGHT."""
+    if raw is None:
+        return None
+    return html.escape(raw).replace(_OPEN, HIGHLIGHT[0]).replace(_CLOSE, HIGHLIGHT[1])
@@ -0,0 +1,298 @@
+"""Bulk import and export of whole tables as CSV or NDJSON.
+
+Driven by create_db.py:
+
+    python create_db.py export dump/ --format ndjson
+    python create_db.py import dump/
+
+A dump is a directory with one file per table (users.csv,
+places.ndjson, ...). Tables are imported parents first (TABLES order), so
+foreign keys always point at rows that are already there.
+
+Import speed comes from:
+- rows parsed lazily and inserted CHUNK_ROWS at a time, one DBAPI
+  executemany per chunk;
+- TRANSACTION_ROWS rows per transaction instead of one commit per row;
+- the table's secondary indexes dropped first and built once at the end,
+  instead of updated on every insert; likewise its full-text index
+  triggers (app/persistence/search.py), the index being rebuilt at the end.
+
+Each commit also records how many rows of the file are in, in the
+import_checkpoints table and in the same transaction. An interrupted import
+therefore resumes after its last commit: run the same command again. The
+indexes and triggers are restored whether or not the import finishes.
+
+The review aggregates of places (review_count, avg_rating, ...) and
+geo_cell are derived data. They are not exported; on import geo_cell is
+computed per row and the aggregates are recomputed once at the end.
+
+An import writes around the facade: a server running with the HTTP or
+entity cache on (see config.py) does not see its rows until restarted.
+"""
+
+import csv
+import json
+import os
+import time
+import uuid
+from itertools import islice
+
+from sqlalchemy import (Column, Integer, MetaData, String, Table, bindparam, delete, insert,
+                        select)
+
+from app.extensions import db
+from app.models.geo import cell_for
+from app.persistence import search
+
+# Parents before children.
+TABLES = ("users", "amenities", "places", "reviews", "place_amenity")
+FORMATS = ("csv", "ndjson")
+
+CHUNK_ROWS = 10_000
+TRANSACTION_ROWS = 500_000
+
+DERIVED = {
+    "places": ("geo_cell", "review_count", "rating_count", "rating_sum", "avg_rating"),
+}
+
+_checkpoints = Table(
+    "import_checkpoints", MetaData(),
+    Column("source", String(1024), primary_key=True),
+    Column("rows", Integer, nullable=False),
+)
+
+
+def format_of(path):
+    fmt = os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"{path}: expected a .csv or .ndjson file")
+    return fmt
+
+
+def _table(name):
+    if name not in TABLES:
+        raise ValueError(f"unknown table '{name}'; expected one of: {', '.join(TABLES)}")
+    return db.metadata.tables[name]
+
+
+def _columns(table):
+    derived = DERIVED.get(table.name, ())
+    return [c for c in table.columns if c.name not in derived]
+
+
+def _converter(column):
+    """str -> column value for CSV cells; JSON values pass through it unchanged."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        python_type = str
+    if python_type is bool:
+        return lambda v: v if isinstance(v, bool) else str(v).lower() in ("1", "true", "t", "yes")
+    if python_type in (int, float):
+        return python_type
+    return str
+
+
+def _read(fp, fmt, names, path):
+    """Raw values of each record, in names order (None where absent)."""
+    if fmt == "csv":
+        reader = csv.reader(fp)
+        header = next(reader, [])
+        positions = [header.index(name) if name in header else None for name in names]
+        for record in reader:
+            if len(record) != len(header):
+                raise ValueError(f"{path}:{reader.line_num}: expected {len(header)} "
+                                 f"columns, got {len(record)}")
+            yield [None if i is None else record[i] for i in positions]
+    else:
+        for line in fp:
+            if line.strip():
+                record = json.loads(line)
+                yield [record.get(name) for name in names]
+
+
+def _prepare(table, names, records):
+    """Typed rows of names + DERIVED columns: "" becomes None, a missing
+    id a fresh uuid; places get their geo_cell and zeroed aggregates."""
+    converters = [_converter(table.c[name]) for name in names]
+    id_index = names.index("id") if "id" in names else None
+    geo = (names.index("latitude"), names.index("longitude")) if table.name == "places" else None
+    zeros = [table.c[name].default.arg for name in DERIVED.get(table.name, ())
+             if name != "geo_cell"]
+    for record in records:
+        row = [None if v is None or v == "" else convert(v)
+               for convert, v in zip(converters, record)]
+        if id_index is not None and row[id_index] is None:
+            row[id_index] = str(uuid.uuid4())
+        if geo:
+            row.append(cell_for(row[geo[0]], row[geo[1]]))
+            row.extend(zeros)
+        yield row
+
+
+def _inserter(conn, table, names):
+    """Return insert(rows) for rows in names order.
+
+    The INSERT is compiled once and rows go straight to the DBAPI's
+    executemany, skipping SQLAlchemy's per-row parameter processing
+    (values are already plain str/int/float/bool/None).
+    """
+    compiled = insert(table).values({name: bindparam(name) for name in names}).compile(
+        dialect=conn.dialect)
+    sql = str(compiled)
+    if not compiled.positional:
+        return lambda rows: conn.exec_driver_sql(sql, [dict(zip(names, row)) for row in rows])
+    order = [names.index(name) for name in compiled.positiontup]
+    if order == list(range(len(names))):
+        return lambda rows: conn.exec_driver_sql(sql, [tuple(row) for row in rows])
+    return lambda rows: conn.exec_driver_sql(sql, [tuple(row[i] for i in order) for row in rows])
+
+
+def _chunks(rows, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _secondary_indexes(table):
+    """Indexes that can be dropped and rebuilt (not the primary key or
+    UNIQUE constraints, which enforce integrity during the load)."""
+    return [index for index in table.indexes if not index.unique]
+
+
+def _save_checkpoint(conn, source, rows):
+    conn.execute(delete(_checkpoints).where(_checkpoints.c.source == source))
+    conn.execute(insert(_checkpoints).values(source=source, rows=rows))
+
+
+def import_table(name, path, chunk_rows=CHUNK_ROWS, transaction_rows=TRANSACTION_ROWS,
+                 progress=None):
+    """Append the rows of path (CSV or NDJSON) to table name.
+
+    Resumes after the last committed transaction of an earlier run on the
+    same file. progress(name, rows, seconds) is called after each commit.
+    Returns the number of rows this call inserted.
+    """
+    table = _table(name)
+    fmt = format_of(path)
+    names = [c.name for c in _columns(table)]
+    source = f"{name}:{os.path.abspath(path)}"
+    indexes = _secondary_indexes(table)
+    full_text = name in search.INDEXES and db.engine.dialect.name == "sqlite"
+    started = time.perf_counter()
+    inserted = 0
+
+    with db.engine.connect() as conn, open(path, newline="", encoding="utf-8") as fp:
+        with conn.begin():
+            _checkpoints.create(conn, checkfirst=True)
+            done = conn.scalar(select(_checkpoints.c.rows)
+                               .where(_checkpoints.c.source == source)) or 0
+            for index in indexes:
+                index.drop(conn, checkfirst=True)
+            if full_text:
+                search.drop_triggers(conn, name)
+
+        insert_rows = _inserter(conn, table, names + list(DERIVED.get(name, ())))
+        trans = conn.begin()
+        try:
+            records = _read(fp, fmt, names, path)
+            for _ in islice(records, done):
+                pass  # committed by an earlier run
+            pending = 0
+            for chunk in _chunks(_prepare(table, names, records), chunk_rows):
+                insert_rows(chunk)
+                pending += len(chunk)
+                if pending >= transaction_rows:
+                    inserted += pending
+                    pending = 0
+                    _save_checkpoint(conn, source, done + inserted)
+                    trans.commit()
+                    trans = conn.begin()
+                    if progress:
+                        progress(name, done + inserted, time.perf_counter() - started)
+            inserted += pending
+            conn.execute(delete(_checkpoints).where(_checkpoints.c.source == source))
+        except BaseException:
+            trans.rollback()
+            trans = conn.begin()
+            raise
+        finally:
+            # Also after a failure: the committed rows must not be left
+            # without their indexes and search triggers until a resume.
+            for index in indexes:
+                index.create(conn, checkfirst=True)
+            if full_text:
+                search.rebuild(conn, [name])
+                search.create_triggers(conn, name)
+            trans.commit()
+
+    if progress:
+        progress(name, done + inserted, time.perf_counter() - started)
+    return inserted
+
+
+def export_table(name, path, chunk_rows=CHUNK_ROWS, progress=None):
+    """Write table name to path (CSV or NDJSON by extension) in primary key
+    order, streaming chunk_rows rows at a time. Returns the row count."""
+    table = _table(name)
+    fmt = format_of(path)
+    columns = _columns(table)
+    names = [c.name for c in columns]
+    started = time.perf_counter()
+    written = 0
+
+    with db.engine.connect() as conn, open(path, "w", newline="", encoding="utf-8") as fp:
+        result = conn.execution_options(yield_per=chunk_rows).execute(
+            select(*columns).order_by(*table.primary_key.columns)
+        )
+        writer = csv.writer(fp) if fmt == "csv" else None
+        if writer:
+            writer.writerow(names)
+        for rows in result.partitions():
+            if writer:
+                writer.writerows(rows)
+            else:
+                fp.writelines(json.dumps(dict(zip(names, row))) + "\n" for row in rows)
+            written += len(rows)
+            if progress and written % TRANSACTION_ROWS < len(rows):
+                progress(name, written, time.perf_counter() - started)
+    if progress:
+        progress(name, written, time.perf_counter() - started)
+    return written
+
+
+def _dump_file(directory, name):
+    for fmt in FORMATS:
+        path = os.path.join(directory, f"{name}.{fmt}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def import_dump(directory, tables=TABLES, progress=None, **options):
+    """Import every <table>.csv / <table>.ndjson found in directory, parents
+    first, then rebuild the place review aggregates. Returns {table: rows}."""
+    from app.services.hbnb_facade import HBnBFacade
+
+    counts = {}
+    for name in TABLES:
+        path = _dump_file(directory, name) if name in tables else None
+        if path is not None:
+            counts[name] = import_table(name, path, progress=progress, **options)
+    if "places" in counts or "reviews" in counts:
+        HBnBFacade().recompute_place_ratings()
+    return counts
+
+
+def export_dump(directory, fmt="csv", tables=TABLES, progress=None, **options):
+    """Export tables to directory/<table>.<fmt>. Returns {table: rows}."""
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(FORMATS)}")
+    os.makedirs(directory, exist_ok=True)
+    return {
+        name: export_table(name, os.path.join(directory, f"{name}.{fmt}"),
+                           progress=progress, **options)
+        for name in TABLES if name in tables
+    }
@@ -0,0 +1,138 @@
+"""Per-process cache of entity column values for HBnBFacade lookups.
+
+Each entity kind ("user", "place", "review", "amenity") has its own LRU
+with a size bound and a TTL. Entries are plain dicts of column values, not
+ORM instances, so nothing bound to one request's session leaks into
+another; the facade rebuilds a detached instance from them and merges it
+into the current session without a SELECT.
+
+Writes go through the facade, which invalidates what it changed after the
+commit. A reader that loaded a row before an invalidation cannot put its
+stale copy back: put() is ignored when the kind was invalidated after the
+reader's token() was taken.
+
+Like app.services.versions this is per process: writes by other workers,
+the hbnb app or create_db.py import are only seen once the TTL expires.
+It is therefore opt-in (ENTITY_CACHE) and only safe with a single worker.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_POLICY = {"max_entries": 1024, "ttl": 30.0}
+
+
+class _Region:
+    __slots__ = ("max_entries", "ttl", "entries", "generation",
+                 "hits", "misses", "evictions")
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()  # id -> (expires_at, values)
+        self.generation = 0
+        self.hits = self.misses = self.evictions = 0
+
+
+class EntityCache:
+    """LRU + TTL cache of column dicts, one region per entity kind.
+
+    policies maps a kind to {"max_entries": n, "ttl": seconds}; missing
+    keys fall back to the defaults, and max_entries=0 disables a kind.
+    """
+
+    def __init__(self, max_entries=DEFAULT_POLICY["max_entries"],
+                 ttl=DEFAULT_POLICY["ttl"], policies=None):
+        self._lock = threading.Lock()
+        self.configure(max_entries, ttl, policies)
+
+    def configure(self, max_entries=DEFAULT_POLICY["max_entries"],
+                  ttl=DEFAULT_POLICY["ttl"], policies=None):
+        """Reset the cache with new limits (drops every entry and counter)."""
+        with self._lock:
+            self._default = {"max_entries": max_entries, "ttl": ttl}
+            self._policies = dict(policies or {})
+            self._regions = {}
+
+    def _region(self, kind):
+        region = self._regions.get(kind)
+        if region is None:
+            policy = {**self._default, **self._policies.get(kind, {})}
+            region = self._regions[kind] = _Region(policy["max_entries"], policy["ttl"])
+        return region
+
+    def token(self, kind):
+        """Call before reading from the database; pass the result to put()."""
+        with self._lock:
+            return self._region(kind).generation
+
+    def get(self, kind, obj_id):
+        with self._lock:
+            region = self._region(kind)
+            entry = region.entries.get(obj_id)
+            if entry is not None and entry[0] < time.monotonic():
+                del region.entries[obj_id]
+                entry = None
+            if entry is None:
+                region.misses += 1
+                return None
+            region.entries.move_to_end(obj_id)
+            region.hits += 1
+            return entry[1]
+
+    def put(self, kind, obj_id, values, token):
+        with self._lock:
+            region = self._region(kind)
+            if region.max_entries <= 0 or region.generation != token:
+                return
+            region.entries[obj_id] = (time.monotonic() + region.ttl, values)
+            region.entries.move_to_end(obj_id)
+            while len(region.entries) > region.max_entries:
+                region.entries.popitem(last=False)
+                region.evictions += 1
+
+    def invalidate(self, kind, obj_id=None):
+        """Drop one entry, or every entry of kind when obj_id is None."""
+        with self._lock:
+            region = self._region(kind)
+            region.generation += 1
+            if obj_id is None:
+                region.entries.clear()
+            else:
+                region.entries.pop(obj_id, None)
+
+    def clear(self):
+        with self._lock:
+            for region in self._regions.values():
+                region.generation += 1
+                region.entries.clear()
+
+    def stats(self):
+        """{kind: {"hits", "misses", "evictions", "size"}}"""
+        with self._lock:
+            return {
+                kind: {
+                    "hits": region.hits,
+                    "misses": region.misses,
+                    "evictions": region.evictions,
+                    "size": len(region.entries),
+                }
+                for kind, region in self._regions.items()
+            }
+
+
+entity_cache = EntityCache()
+
+
+def init_app(app):
+    """Configure the shared cache from ENTITY_CACHE_* settings."""
+    if not app.config.get("ENTITY_CACHE", False):
+        entity_cache.configure(max_entries=0)
+        return
+    entity_cache.configure(
+        max_entries=app.config.get("ENTITY_CACHE_SIZE", DEFAULT_POLICY["max_entries"]),
+        ttl=app.config.get("ENTITY_CACHE_TTL", DEFAULT_POLICY["ttl"]),
+        policies=app.config.get("ENTITY_CACHE_POLICIES"),
+    )
+    app.extensions["entity_cache"] = entity_cache
@@ -1,6 +1,28 @@
 # app/services/hbnb_facade.py
 
+import uuid
+from contextlib import contextmanager
+from numbers import Real
+
+from sqlalchemy import and_, case, func, insert, or_, select, text, tuple_, update
+from sqlalchemy.orm import (contains_eager, joinedload, make_transient_to_detached,
+                            selectinload)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
 from app.extensions import db
+from app.persistence import search
+from app.services import versions
+from app.services.entity_cache import entity_cache
+from app.models.geo import bbox_around, cell_for, cell_ranges, haversine_km
+
+
+class BulkValidationError(ValueError):
+    """A bulk create was rejected; errors lists {"index", "error"} per bad item."""
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} invalid item(s)")
+        self.errors = errors
 
 
 class HBnBFacade:
@@ -9,15 +31,149 @@ class HBnBFacade:
     IMPORTANT: Models must NOT import this file (avoid circular imports).
     """
 
+    # Above this many geo_cell ranges a box is too large for the grid to
+    # help; fall back to the latitude index.
+    MAX_CELL_RANGES = 64
+
+    # Rows fetched per round trip by the iter_* methods.
+    STREAM_BATCH_SIZE = 500
+
+    # Largest amenity filter result applied as a list of place ids; see
+    # _amenity_condition.
+    AMENITY_IDS_MAX = 2_000
+
+    # Best matches search_places() takes from each full-text index before
+    # merging them, out of at most SEARCH_WINDOW matches ranked per index.
+    SEARCH_CANDIDATES = 200
+    SEARCH_WINDOW = 10_000
+    # bm25 weight of a match in a review relative to one in the place itself.
+    SEARCH_REVIEW_WEIGHT = 0.5
+
     # -------------------------
     # Helpers
     # -------------------------
-    def _commit(self):
+    @contextmanager
+    def unit_of_work(self):
+        """Run several facade writes as one transaction.
+
+            with facade.unit_of_work():
+                place = facade.create_place(...)
+                for amenity_id in amenity_ids:
+                    facade.add_amenity_to_place(place.id, amenity_id)
+
+        Inside the block writes only flush; leaving it commits once, or
+        rolls back if it raised. Nested blocks join the outermost one. An
+        exception that escapes a nested block dooms the whole unit: if an
+        outer block swallows it, the outermost exit rolls back and raises
+        RuntimeError instead of committing half the work.
+        """
+        info = db.session.info
+        uow = info.get("unit_of_work")
+        if uow is not None:
+            try:
+                yield self
+            except BaseException:
+                uow["rollback_only"] = True
+                raise
+            return
+
+        uow = info["unit_of_work"] = {"rollback_only": False, "changed": set(), "evict": []}
+        try:
+            yield self
+            if uow["rollback_only"]:
+                raise RuntimeError("unit of work rolled back: a nested unit of work failed")
+        except BaseException:
+            del info["unit_of_work"]
+            db.session.rollback()
+            raise
+        del info["unit_of_work"]
+        self._commit(*uow["changed"], evict=uow["evict"])
+
+    def _commit(self, *changed, evict=()):
+        """Commit, then bump the versions of the collections in changed and
+        drop the (kind, id) pairs in evict from the entity cache (id None
+        drops the whole kind). Inside unit_of_work() only flush, and defer
+        both to the unit's commit."""
+        uow = db.session.info.get("unit_of_work")
+        if uow is not None:
+            db.session.flush()
+            uow["changed"].update(changed)
+            uow["evict"].extend(evict)
+            return
         try:
             db.session.commit()
         except Exception:
             db.session.rollback()
             raise
+        versions.bump(*changed)
+        for kind, obj_id in evict:
+            entity_cache.invalidate(kind, obj_id)
+
+    @staticmethod
+    def _get_cached(kind, model, obj_id):
+        """Primary-key lookup through the session identity map, then the
+        entity cache, then the database."""
+        if obj_id is None:
+            return None
+        if "unit_of_work" in db.session.info:
+            # The transaction may hold uncommitted changes the cache must
+            # neither hide nor capture.
+            return db.session.get(model, obj_id)
+        obj = db.session.identity_map.get(identity_key(model, obj_id))
+        if obj is not None:
+            return obj
+        values = entity_cache.get(kind, obj_id)
+        if values is not None:
+            obj = model.__mapper__.class_manager.new_instance()
+            for name, value in values.items():
+                set_committed_value(obj, name, value)
+            make_transient_to_detached(obj)
+            return db.session.merge(obj, load=False)
+        token = entity_cache.token(kind)
+        obj = db.session.get(model, obj_id)
+        if obj is not None:
+            values = {attr.key: getattr(obj, attr.key) for attr in model.__mapper__.column_attrs}
+            entity_cache.put(kind, obj_id, values, token)
+        return obj
+
+    @staticmethod
+    def _keyset_query(query, columns, limit=None, after=None, descending=False):
+        """Order query (a Query or a Select) by columns and keep the rows
+        after the key `after`.
+
+        columns must form a unique, indexed key (they end with the primary
+        key) so pages are stable and each one is an index range scan.
+        """
+        if after is not None:
+            if len(after) != len(columns):
+                raise ValueError("invalid cursor")
+            key = tuple_(*columns)
+            query = query.filter(key < tuple_(*after) if descending else key > tuple_(*after))
+        query = query.order_by(*(c.desc() if descending else c for c in columns))
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    @classmethod
+    def _keyset(cls, query, columns, limit=None, after=None, descending=False):
+        return cls._keyset_query(query, columns, limit, after, descending).all()
+
+    @classmethod
+    def _stream(cls, stmt):
+        """Yield the rows of stmt, fetched STREAM_BATCH_SIZE at a time
+        (yield_per), so neither the driver nor the session holds the whole
+        result at once.
+
+        The statement is built (and validated) by the caller, but only runs
+        on the first next(), on the session current at that point: a
+        streamed response body iterates after the view's session has been
+        removed.
+        """
+        yield from db.session.scalars(stmt.execution_options(yield_per=cls.STREAM_BATCH_SIZE))
+
+    @staticmethod
+    def _count(model):
+        return db.session.query(func.count()).select_from(model).scalar()
 
     # -------------------------
     # Users
@@ -26,20 +182,31 @@ class HBnBFacade:
         from app.models.user import User  # local import avoids circular imports
         user = User(**data)
         db.session.add(user)
-        self._commit()
+        self._commit("users")
         return user
 
     def get_user(self, user_id):
         from app.models.user import User
-        return User.query.get(user_id)
+        return self._get_cached("user", User, user_id)
 
     def get_user_by_email(self, email):
         from app.models.user import User
         return User.query.filter_by(email=email).first()
 
-    def get_users(self):
+    def get_users(self, limit=None, after=None):
+        return db.session.scalars(self.select_users(limit, after)).all()
+
+    def iter_users(self, limit=None, after=None):
+        return self._stream(self.select_users(limit, after))
+
+    def select_users(self, limit=None, after=None):
+        """The SELECT behind get_users()."""
         from app.models.user import User
-        return User.query.all()
+        return self._keyset_query(select(User), [User.id], limit, after)
+
+    def count_users(self):
+        from app.models.user import User
+        return self._count(User)
 
     def update_user(self, user_id, **data):
         user = self.get_user(user_id)
@@ -47,24 +214,52 @@ class HBnBFacade:
             return None
         for k, v in data.items():
             setattr(user, k, v)
-        self._commit()
+        self._commit("users", evict=[("user", user_id)])
         return user
 
     def delete_user(self, user_id):
+        from app.models.review import Review
         user = self.get_user(user_id)
         if not user:
             return False
+        # The user's reviews go with them (ORM cascade).
+        self._remove_review_ratings(Review.user_id == user_id)
         db.session.delete(user)
-        self._commit()
+        self._commit("users", "places", "reviews",
+                     evict=[("user", user_id), ("place", None), ("review", None)])
         return True
 
     # -------------------------
     # Places
     # -------------------------
+    PLACE_RELATIONS = ("amenities", "reviews", "owner")
+
+    def _place_load_options(self, include, single=False):
+        """Eager-load options for the requested Place relationships.
+
+        Lists use selectinload: one extra "WHERE id IN (...)" query per
+        relationship whatever the page size. A single place joins its
+        amenities (a small collection) into the main query; see
+        _join_amenities, which must then be applied to the query.
+        """
+        from app.models.place import Place
+        options = []
+        for name in include:
+            if name not in self.PLACE_RELATIONS:
+                raise ValueError(f"cannot include '{name}'")
+            attr = getattr(Place, name)
+            if name == "owner":
+                options.append(joinedload(attr))
+            elif single and name == "amenities":
+                options.append(contains_eager(attr))
+            else:
+                options.append(selectinload(attr))
+        return options
+
     def create_place(self, **data):
         from app.models.place import Place
 
-        allowed = {c.name for c in Place.__table__.columns}
+        allowed = {c.name for c in Place.__table__.columns} - set(self.PLACE_AGGREGATES)
         if "title" in data and "title" not in allowed and "name" in allowed:
             data["name"] = data.pop("title")
 
@@ -72,24 +267,161 @@ class HBnBFacade:
 
         place = Place(**filtered)
         db.session.add(place)
-        self._commit()
+        self._commit("places")
         return place
 
-    def get_place(self, place_id):
+    def get_place(self, place_id, include=()):
         from app.models.place import Place
-        return Place.query.get(place_id)
-
-    def get_places(self):
+        if not include:
+            return self._get_cached("place", Place, place_id)
+        query = Place.query.options(*self._place_load_options(include, single=True))
+        if "amenities" in include:
+            query = self._join_amenities(query)
+        # No LIMIT: it would cut the joined amenity rows to one.
+        return query.filter(Place.id == place_id).one_or_none()
+
+    @staticmethod
+    def _join_amenities(query):
+        """LEFT JOIN place_amenity and amenities one after the other.
+
+        joinedload renders "LEFT JOIN (place_amenity JOIN amenities)",
+        which SQLite materializes by scanning all of place_amenity; chained
+        joins look the place's rows up in the primary key instead.
+        """
+        from app.models.amenity import Amenity
+        from app.models.associations import place_amenity
+        from app.models.place import Place
+        return (query.outerjoin(place_amenity, place_amenity.c.place_id == Place.id)
+                .outerjoin(Amenity, Amenity.id == place_amenity.c.amenity_id))
+
+    # sort parameter -> (keyset columns, descending)
+    PLACE_SORTS = {
+        "id": (("id",), False),
+        "price": (("price", "id"), False),
+        "-price": (("price", "id"), True),
+        "rating": (("avg_rating", "id"), False),
+        "-rating": (("avg_rating", "id"), True),
+    }
+
+    # Columns derived from reviews; never written directly.
+    PLACE_AGGREGATES = ("review_count", "rating_count", "rating_sum", "avg_rating")
+
+    @staticmethod
+    def _has_amenity(place_id, amenity_id):
+        """EXISTS test for one place/amenity pair (a primary key lookup)."""
+        from app.models.associations import place_amenity
+        return (select(place_amenity.c.place_id)
+                .where(place_amenity.c.place_id == place_id,
+                       place_amenity.c.amenity_id == amenity_id)
+                .exists())
+
+    @classmethod
+    def _amenity_condition(cls, amenities):
+        """Condition on Place.id: the place has every amenity id given.
+
+        Intersects the amenities' place lists shortest first: the places of
+        the rarest amenity (an ix_place_amenity_amenity_id_place_id range)
+        are probed for the others. Up to AMENITY_IDS_MAX matches are then
+        filtered by id. A longer intersection is dense enough to read places
+        in index order and probe each one, which stops when a page is full.
+        """
+        from app.models.associations import place_amenity
+        from app.models.place import Place
+        wanted = sorted(set(amenities))
+        cap = cls.AMENITY_IDS_MAX + 1
+        sizes = {
+            amenity_id: db.session.scalar(select(func.count()).select_from(
+                select(place_amenity.c.place_id)
+                .where(place_amenity.c.amenity_id == amenity_id).limit(cap).subquery()
+            ))
+            for amenity_id in wanted
+        } if len(wanted) > 1 else {}
+        rarest = min(wanted, key=lambda amenity_id: sizes.get(amenity_id, 0))
+        driver = place_amenity.alias("rarest")
+        ids = db.session.scalars(
+            select(driver.c.place_id)
+            .where(driver.c.amenity_id == rarest,
+                   *(cls._has_amenity(driver.c.place_id, amenity_id)
+                     for amenity_id in wanted if amenity_id != rarest))
+            .limit(cap)
+        ).all()
+        if len(ids) < cap:
+            return Place.id.in_(ids)
+        return and_(*(cls._has_amenity(Place.id, amenity_id) for amenity_id in wanted))
+
+    @classmethod
+    def _filter_places(cls, query, min_price=None, max_price=None, min_rating=None,
+                       amenities=None):
+        """Apply the place filters; amenities keeps places that have every
+        one of the given amenity ids."""
+        from app.models.place import Place
+        if amenities:
+            query = query.filter(cls._amenity_condition(amenities))
+        if min_rating is not None:
+            query = query.filter(Place.avg_rating >= min_rating)
+        if min_price is not None:
+            query = query.filter(Place.price >= min_price)
+        if max_price is not None:
+            query = query.filter(Place.price <= max_price)
+        return query
+
+    def place_sort_key(self, place, sort="id"):
+        """Cursor values for a place under the given sort order."""
+        columns, _ = self.PLACE_SORTS[sort]
+        return [getattr(place, name) for name in columns]
+
+    def get_places(self, limit=None, after=None, min_price=None, max_price=None, sort="id",
+                   include=(), min_rating=None, amenities=None):
+        """Places in sort order ("id", "price", "rating", or descending with
+        a leading "-"), optionally restricted to a price range, a minimum
+        average rating or places having all of the amenity ids in amenities;
+        served by the (price, id) and (avg_rating, id) indexes.
+
+        include names relationships (amenities, reviews, owner) to eager
+        load so serialising them does not cost a query per place.
+        """
+        stmt = self.select_places(limit, after, min_price, max_price, sort, include, min_rating,
+                                  amenities)
+        return db.session.scalars(stmt).all()
+
+    def iter_places(self, limit=None, after=None, min_price=None, max_price=None, sort="id",
+                    include=(), min_rating=None, amenities=None):
+        """get_places() as a streaming iterator (see _stream)."""
+        return self._stream(self.select_places(limit, after, min_price, max_price, sort,
+                                               include, min_rating, amenities))
+
+    def select_places(self, limit=None, after=None, min_price=None, max_price=None, sort="id",
+                      include=(), min_rating=None, amenities=None):
+        """The SELECT behind get_places(), for running on another session
+        (the async read path in app/asgi.py)."""
         from app.models.place import Place
-        return Place.query.all()
+        if sort not in self.PLACE_SORTS:
+            raise ValueError(f"sort must be one of: {', '.join(self.PLACE_SORTS)}")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price must not exceed max_price")
+        names, descending = self.PLACE_SORTS[sort]
+        columns = [getattr(Place, name) for name in names]
+        stmt = self._filter_places(select(Place), min_price, max_price, min_rating, amenities)
+        stmt = stmt.options(*self._place_load_options(include))
+        return self._keyset_query(stmt, columns, limit, after, descending=descending)
+
+    def count_places(self, min_price=None, max_price=None, min_rating=None, amenities=None):
+        from app.models.place import Place
+        if min_price is None and max_price is None and min_rating is None and not amenities:
+            return self._count(Place)
+        return self._filter_places(Place.query, min_price, max_price, min_rating,
+                                   amenities).count()
 
     def update_place(self, place_id, **data):
+        for name in self.PLACE_AGGREGATES:
+            if name in data:
+                raise ValueError(f"{name} is derived from reviews and cannot be set")
         place = self.get_place(place_id)
         if not place:
             return None
         for k, v in data.items():
             setattr(place, k, v)
-        self._commit()
+        self._commit("places", evict=[("place", place_id)])
         return place
 
     def delete_place(self, place_id):
@@ -97,9 +429,202 @@ class HBnBFacade:
         if not place:
             return False
         db.session.delete(place)
-        self._commit()
+        self._commit("places", "reviews", evict=[("place", place_id), ("review", None)])
         return True
 
+    # -------------------------
+    # Places: spatial search
+    # -------------------------
+    @staticmethod
+    def _check_bbox(min_lat, min_lon, max_lat, max_lon):
+        if not (-90.0 <= min_lat <= max_lat <= 90.0):
+            raise ValueError("latitudes must satisfy -90 <= min_lat <= max_lat <= 90")
+        if not (-180.0 <= min_lon <= 180.0 and -180.0 <= max_lon <= 180.0):
+            raise ValueError("longitudes must be between -180 and 180")
+
+    def _places_in_bbox(self, min_lat, min_lon, max_lat, max_lon, **filters):
+        """(id, latitude, longitude) rows of the places inside the box; only
+        the ones kept after sorting and limiting are loaded as Place."""
+        from app.models.place import Place
+        query = self._filter_places(
+            db.session.query(Place.id, Place.latitude, Place.longitude), **filters)
+        ranges = cell_ranges(min_lat, min_lon, max_lat, max_lon)
+        if len(ranges) <= self.MAX_CELL_RANGES:
+            query = query.filter(or_(*(Place.geo_cell.between(lo, hi) for lo, hi in ranges)))
+        query = query.filter(Place.latitude.between(min_lat, max_lat))
+        if min_lon <= max_lon:
+            query = query.filter(Place.longitude.between(min_lon, max_lon))
+        else:
+            query = query.filter(or_(Place.longitude >= min_lon, Place.longitude <= max_lon))
+        return query.all()
+
+    @staticmethod
+    def _sorted_by_distance(rows, lat, lon, radius_km=None, limit=None):
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        results = []
+        for place_id, place_lat, place_lon in rows:
+            distance = haversine_km(lat, lon, place_lat, place_lon)
+            if radius_km is None or distance <= radius_km:
+                results.append((place_id, distance))
+        results.sort(key=lambda item: item[1])
+        return results[:limit] if limit is not None else results
+
+    def _load_by_distance(self, results, include):
+        """Turn (place_id, distance) pairs into (place, distance) pairs,
+        loading the places and their include relationships in one pass."""
+        from app.models.place import Place
+        if not results:
+            return []
+        places = {place.id: place for place in
+                  Place.query.options(*self._place_load_options(include))
+                  .filter(Place.id.in_([place_id for place_id, _ in results]))}
+        return [(places[place_id], distance) for place_id, distance in results
+                if place_id in places]
+
+    def find_places_in_bbox(self, min_lat, min_lon, max_lat, max_lon,
+                            lat=None, lon=None, limit=None, include=(), **filters):
+        """Places inside a bounding box as (place, distance_km) pairs.
+
+        Sorted by distance from (lat, lon), or from the box centre when no
+        point is given. min_lon > max_lon selects a box that crosses the
+        antimeridian. filters: min_price / max_price / min_rating / amenities.
+        """
+        self._check_bbox(min_lat, min_lon, max_lat, max_lon)
+        if lat is None or lon is None:
+            lat = (min_lat + max_lat) / 2
+            span = (max_lon - min_lon) % 360.0
+            lon = (min_lon + span / 2 + 180.0) % 360.0 - 180.0
+        rows = self._places_in_bbox(min_lat, min_lon, max_lat, max_lon, **filters)
+        return self._load_by_distance(self._sorted_by_distance(rows, lat, lon, limit=limit),
+                                      include)
+
+    def find_places_near(self, lat, lon, radius_km, limit=None, include=(), **filters):
+        """Places within radius_km of (lat, lon) as (place, distance_km), nearest first.
+
+        filters: min_price / max_price / min_rating / amenities.
+        """
+        if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+            raise ValueError("invalid coordinates")
+        if radius_km <= 0:
+            raise ValueError("radius_km must be positive")
+        rows = self._places_in_bbox(*bbox_around(lat, lon, radius_km), **filters)
+        results = self._sorted_by_distance(rows, lat, lon, radius_km=radius_km, limit=limit)
+        return self._load_by_distance(results, include)
+
+    # -------------------------
+    # Places: full-text search
+    # -------------------------
+    def _search_hits(self, table, key, match):
+        """(key, bm25, snippet) of the best SEARCH_CANDIDATES rows of table."""
+        fts = search.INDEXES[table][0]
+        keys = search.keys_table(table)
+        # bm25 has to score every match before ORDER BY rank can pick the
+        # best, so a word found in most rows would cost a scan of its whole
+        # posting list. Past SEARCH_WINDOW matches only the newest (highest
+        # key, see app.persistence.search) SEARCH_WINDOW are ranked.
+        floor = db.session.scalar(text(
+            f"SELECT rowid FROM {fts} WHERE {fts} MATCH :q "
+            f"ORDER BY rowid DESC LIMIT 1 OFFSET :window"
+        ), {"q": match, "window": self.SEARCH_WINDOW - 1})
+        # Ranking happens inside FTS5 (ORDER BY rank LIMIT), before the join.
+        return db.session.execute(text(
+            f"SELECT {table}.{key}, hits.rank, hits.snippet "
+            f"FROM (SELECT rowid, rank, {search.snippet_sql(fts)} AS snippet FROM {fts} "
+            f"      WHERE {fts} MATCH :q AND rowid >= :floor "
+            f"      ORDER BY rank LIMIT :k) AS hits "
+            f"JOIN {keys} ON {keys}.key = hits.rowid "
+            f"JOIN {table} ON {table}.id = {keys}.id"
+        ), {"q": match, "floor": floor or 0, "k": self.SEARCH_CANDIDATES}).all()
+
+    def search_places(self, q, limit=20):
+        """Places whose title, description or reviews match q, best first,
+        as (place, score, snippet) triples.
+
+        Every word of q must match. score is the bm25 relevance (higher is
+        better) of the place's best match: its own text, or one of its
+        reviews weighted by SEARCH_REVIEW_WEIGHT. snippet is an HTML-escaped
+        excerpt of that match with the words in <mark>.
+
+        Ranking is exact while a query matches at most SEARCH_WINDOW places
+        and SEARCH_WINDOW reviews; beyond that it covers the newest ones.
+        """
+        from app.models.place import Place
+        match = search.match_query(q)
+        best = {}
+        for table, key, weight in (("places", "id", 1.0),
+                                   ("reviews", "place_id", self.SEARCH_REVIEW_WEIGHT)):
+            for place_id, rank, snippet in self._search_hits(table, key, match):
+                score = -rank * weight  # bm25 ranks are negative, best lowest
+                if place_id not in best or score > best[place_id][0]:
+                    best[place_id] = (score, snippet)
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+        places = {place.id: place for place in
+                  Place.query.filter(Place.id.in_([place_id for place_id, _ in ranked]))}
+        return [(places[place_id], score, search.highlight(snippet))
+                for place_id, (score, snippet) in ranked if place_id in places]
+
+    # -------------------------
+    # Places: rating aggregates
+    # -------------------------
+    @staticmethod
+    def _adjust_ratings(place_id, reviews=0, ratings=0, rating_sum=0):
+        """Apply a delta to a place's review aggregates with one UPDATE.
+
+        Runs in the caller's transaction, so the aggregates commit or roll
+        back together with the review change, and the arithmetic happens in
+        SQL so concurrent writers cannot lose each other's updates.
+        """
+        from app.models.place import Place
+        if place_id is None or not (reviews or ratings or rating_sum):
+            return
+        new_count = Place.rating_count + ratings
+        new_sum = Place.rating_sum + rating_sum
+        db.session.execute(
+            update(Place)
+            .where(Place.id == place_id)
+            .values(
+                review_count=Place.review_count + reviews,
+                rating_count=new_count,
+                rating_sum=new_sum,
+                avg_rating=case((new_count > 0, new_sum * 1.0 / new_count), else_=0.0),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+
+    @staticmethod
+    def _rating_delta(rating, sign):
+        """(reviews, ratings, rating_sum) contributed by one review."""
+        if rating is None:
+            return sign, 0, 0
+        return sign, sign, sign * rating
+
+    def _remove_review_ratings(self, condition):
+        """Take the reviews matching condition out of their places' aggregates."""
+        from app.models.review import Review
+        rows = db.session.execute(
+            select(Review.place_id, func.count(), func.count(Review.rating),
+                   func.coalesce(func.sum(Review.rating), 0))
+            .where(condition)
+            .group_by(Review.place_id)
+        ).all()
+        for place_id, reviews, ratings, rating_sum in rows:
+            self._adjust_ratings(place_id, -reviews, -ratings, -rating_sum)
+
+    def recompute_place_ratings(self, place_id=None):
+        """Rebuild review aggregates from the reviews table.
+
+        Repairs drift left by writes that bypassed the facade (raw SQL,
+        imports). Recomputes one place, or every place when place_id is
+        None; returns the number of places updated.
+        """
+        from app.models.place import ratings_update
+        stmt = ratings_update(place_id)
+        result = db.session.execute(stmt.execution_options(synchronize_session=False))
+        self._commit("places", evict=[("place", place_id)])
+        db.session.expire_all()
+        return result.rowcount
+
     # -------------------------
     # Reviews
     # -------------------------
@@ -107,36 +632,61 @@ class HBnBFacade:
         from app.models.review import Review
         review = Review(**data)
         db.session.add(review)
-        self._commit()
+        db.session.flush()
+        self._adjust_ratings(review.place_id, *self._rating_delta(review.rating, 1))
+        self._commit("reviews", evict=[("place", review.place_id)])
         return review
 
     def get_review(self, review_id):
         from app.models.review import Review
-        return Review.query.get(review_id)
+        return self._get_cached("review", Review, review_id)
 
-    def get_reviews(self):
+    def get_reviews(self, limit=None, after=None):
+        return db.session.scalars(self.select_reviews(limit, after)).all()
+
+    def iter_reviews(self, limit=None, after=None, place_id=None):
+        return self._stream(self.select_reviews(limit, after, place_id))
+
+    def select_reviews(self, limit=None, after=None, place_id=None):
+        """The SELECT behind get_reviews() / get_reviews_by_place()."""
         from app.models.review import Review
-        return Review.query.all()
+        stmt = select(Review)
+        if place_id is not None:
+            stmt = stmt.filter_by(place_id=place_id)
+        return self._keyset_query(stmt, [Review.id], limit, after)
 
-    def get_reviews_by_place(self, place_id):
+    def count_reviews(self, place_id=None):
         from app.models.review import Review
-        return Review.query.filter_by(place_id=place_id).all()
+        if place_id is None:
+            return self._count(Review)
+        return Review.query.filter_by(place_id=place_id).count()
+
+    def get_reviews_by_place(self, place_id, limit=None, after=None):
+        return db.session.scalars(self.select_reviews(limit, after, place_id)).all()
 
     def update_review(self, review_id, **data):
         review = self.get_review(review_id)
         if not review:
             return None
+        old_place_id, old_rating = review.place_id, review.rating
         for k, v in data.items():
             setattr(review, k, v)
-        self._commit()
+        db.session.flush()
+        if (review.place_id, review.rating) != (old_place_id, old_rating):
+            self._adjust_ratings(old_place_id, *self._rating_delta(old_rating, -1))
+            self._adjust_ratings(review.place_id, *self._rating_delta(review.rating, 1))
+        self._commit("reviews", evict=[("review", review_id), ("place", old_place_id),
+                                       ("place", review.place_id)])
         return review
 
     def delete_review(self, review_id):
         review = self.get_review(review_id)
         if not review:
             return False
+        place_id = review.place_id
+        self._adjust_ratings(place_id, *self._rating_delta(review.rating, -1))
         db.session.delete(review)
-        self._commit()
+        self._commit("reviews", evict=[("review", review_id), ("place", place_id)])
         return True
 
     # -------------------------
@@ -146,16 +696,27 @@ class HBnBFacade:
         from app.models.amenity import Amenity
         amenity = Amenity(**data)
         db.session.add(amenity)
-        self._commit()
+        self._commit("amenities")
         return amenity
 
     def get_amenity(self, amenity_id):
         from app.models.amenity import Amenity
-        return Amenity.query.get(amenity_id)
+        return self._get_cached("amenity", Amenity, amenity_id)
 
-    def get_amenities(self):
+    def get_amenities(self, limit=None, after=None):
+        return db.session.scalars(self.select_amenities(limit, after)).all()
+
+    def iter_amenities(self, limit=None, after=None):
+        return self._stream(self.select_amenities(limit, after))
+
+    def select_amenities(self, limit=None, after=None):
+        """The SELECT behind get_amenities()."""
+        from app.models.amenity import Amenity
+        return self._keyset_query(select(Amenity), [Amenity.id], limit, after)
+
+    def count_amenities(self):
         from app.models.amenity import Amenity
-        return Amenity.query.all()
+        return self._count(Amenity)
 
     def update_amenity(self, amenity_id, **data):
         amenity = self.get_amenity(amenity_id)
@@ -163,7 +724,7 @@ class HBnBFacade:
             return None
         for k, v in data.items():
             setattr(amenity, k, v)
-        self._commit()
+        self._commit("amenities", evict=[("amenity", amenity_id)])
         return amenity
 
     def delete_amenity(self, amenity_id):
@@ -171,9 +732,149 @@ class HBnBFacade:
         if not amenity:
             return False
         db.session.delete(amenity)
-        self._commit()
+        self._commit("amenities", evict=[("amenity", amenity_id)])
         return True
 
+    # -------------------------
+    # Bulk create
+    # -------------------------
+    @staticmethod
+    def _validate_batch(items, make_row):
+        """Build a row per item with make_row(item); collect every error."""
+        rows, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("item must be an object")
+                row = make_row(item)
+            except ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+                continue
+            row["id"] = str(uuid.uuid4())
+            rows.append(row)
+        if errors:
+            raise BulkValidationError(errors)
+        return rows
+
+    @staticmethod
+    def _existing_ids(model, ids):
+        ids = {i for i in ids if isinstance(i, str)}
+        if not ids:
+            return set()
+        return set(db.session.scalars(select(model.id).where(model.id.in_(ids))))
+
+    @staticmethod
+    def _number(item, name, required=False, low=None, high=None):
+        value = item.get(name)
+        if value is None:
+            if required:
+                raise ValueError(f"{name} is required")
+            return None
+        if isinstance(value, bool) or not isinstance(value, Real):
+            raise ValueError(f"{name} must be a number")
+        if (low is not None and value < low) or (high is not None and value > high):
+            raise ValueError(f"{name} must be between {low} and {high}")
+        return float(value)
+
+    @staticmethod
+    def _text(item, name, max_length=None, required=True):
+        value = item.get(name)
+        if value is None and not required:
+            return None
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{name} is required")
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f"{name} must be at most {max_length} characters")
+        return value
+
+    def bulk_create_places(self, items, owner_id=None):
+        """Insert many places in one transaction with a single executemany.
+
+        Every item is validated first; if any is invalid nothing is written
+        and BulkValidationError lists the problems. owner_id is the default
+        for items that do not name an owner. Returns the inserted rows in
+        input order.
+        """
+        from app.models.place import Place
+        from app.models.user import User
+        owners = self._existing_ids(
+            User, [item.get("owner_id", owner_id) for item in items if isinstance(item, dict)]
+        )
+
+        def make_row(item):
+            row = {
+                "title": self._text(item, "title", max_length=100),
+                "description": self._text(item, "description", max_length=1024, required=False),
+                "price": self._number(item, "price", required=True, low=0),
+                "latitude": self._number(item, "latitude", low=-90, high=90),
+                "longitude": self._number(item, "longitude", low=-180, high=180),
+                "owner_id": item.get("owner_id", owner_id),
+            }
+            if row["owner_id"] not in owners:
+                raise ValueError("owner_id does not reference an existing user")
+            # Bulk inserts skip mapper events, so derive geo_cell here.
+            row["geo_cell"] = cell_for(row["latitude"], row["longitude"])
+            row.update(dict.fromkeys(self.PLACE_AGGREGATES, 0))
+            return row
+
+        rows = self._validate_batch(items, make_row)
+        if rows:
+            db.session.execute(insert(Place), rows)
+            self._commit("places")
+        return rows
+
+    def bulk_create_reviews(self, items, user_id=None):
+        """Insert many reviews in one transaction and update the reviewed
+        places' rating aggregates once per place. See bulk_create_places."""
+        from app.models.place import Place
+        from app.models.review import Review
+        from app.models.user import User
+        dicts = [item for item in items if isinstance(item, dict)]
+        places = self._existing_ids(Place, [item.get("place_id") for item in dicts])
+        users = self._existing_ids(User, [item.get("user_id", user_id) for item in dicts])
+
+        def make_row(item):
+            rating = item.get("rating")
+            if rating is not None and (isinstance(rating, bool) or not isinstance(rating, int)
+                                       or not 1 <= rating <= 5):
+                raise ValueError("rating must be an integer between 1 and 5")
+            row = {
+                "text": self._text(item, "text"),
+                "rating": rating,
+                "place_id": item.get("place_id"),
+                "user_id": item.get("user_id", user_id),
+            }
+            if row["place_id"] not in places:
+                raise ValueError("place_id does not reference an existing place")
+            if row["user_id"] not in users:
+                raise ValueError("user_id does not reference an existing user")
+            return row
+
+        rows = self._validate_batch(items, make_row)
+        if not rows:
+            return rows
+        db.session.execute(insert(Review), rows)
+        deltas = {}
+        for row in rows:
+            delta = deltas.setdefault(row["place_id"], [0, 0, 0])
+            for i, value in enumerate(self._rating_delta(row["rating"], 1)):
+                delta[i] += value
+        for place_id, delta in deltas.items():
+            self._adjust_ratings(place_id, *delta)
+        self._commit("reviews", evict=[("place", place_id) for place_id in deltas])
+        return rows
+
+    def bulk_create_amenities(self, items):
+        """Insert many amenities in one transaction. See bulk_create_places."""
+        from app.models.amenity import Amenity
+        rows = self._validate_batch(
+            items, lambda item: {"name": self._text(item, "name", max_length=128)}
+        )
+        if rows:
+            db.session.execute(insert(Amenity), rows)
+            self._commit("amenities")
+        return rows
+
     # -------------------------
     # Place <-> Amenities (Many-to-Many)
     # -------------------------
@@ -186,7 +887,7 @@ class HBnBFacade:
         # assuming Place.amenities relationship exists
         if amenity not in place.amenities:
             place.amenities.append(amenity)
-            self._commit()
+            self._commit("places", evict=[("place", place_id), ("amenity", amenity_id)])
         return place
 
     def remove_amenity_from_place(self, place_id, amenity_id):
@@ -197,6 +898,6 @@ class HBnBFacade:
 
         if amenity in place.amenities:
             place.amenities.remove(amenity)
-            self._commit()
+            self._commit("places", evict=[("place", place_id), ("amenity", amenity_id)])
         return place
 
@@ -0,0 +1,33 @@
+"""Per-collection version counters for cached HTTP responses.
+
+HBnBFacade bumps the collections a write touched once its transaction has
+committed; app.api.v1.http_cache folds the current versions into ETags. A
+response cached under an older version is never served again.
+
+The counters live in process memory. With several worker processes a
+write only bumps the counters of the worker that handled it, and writes
+that bypass this app's facade (the hbnb app, create_db.py import) bump
+none. That is why the response cache is opt-in (HTTP_CACHE): enable it
+only when one process serves and writes the database.
+"""
+
+import itertools
+import threading
+
+_lock = threading.Lock()
+_clock = itertools.count(1)
+_versions = {}
+
+
+def bump(*collections):
+    """Mark collections as changed."""
+    with _lock:
+        stamp = next(_clock)
+        for name in collections:
+            _versions[name] = stamp
+
+
+def current(*collections):
+    """Return the versions of collections, in the order given."""
+    with _lock:
+        return tuple(_versions.get(name, 0) for name in collections)
@@ -0,0 +1,7 @@
+import os
+
+from app.asgi import create_asgi_app
+
+# Read endpoints only (GET/HEAD of places, reviews, amenities); serve with
+# any ASGI server, e.g. `uvicorn asgi:application`, next to run.py.
+application = create_asgi_app(os.environ.get("HBNB_ENV", "default"))
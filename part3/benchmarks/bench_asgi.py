@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+"""Read throughput of the WSGI app against the async (ASGI) read path.
+
+Both serve GET /api/v1/places/?limit=20 (places with their amenities and
+reviews) from the same SQLite file. At each concurrency level C, C
+clients send requests back to back for SECONDS seconds:
+
+- wsgi: C client threads share WSGI_THREADS worker slots, as with a
+  threaded WSGI server; requests beyond that wait for a slot.
+- asgi: C coroutines on one event loop call app.asgi.AsyncReadApp.
+
+Both run in process, so socket and HTTP parsing costs are left out, and
+req/s is over the wall time including requests still in flight at the
+deadline. --latency-ms adds a simulated database round trip to every
+request (time.sleep in a WSGI slot, asyncio.sleep on the loop): the WSGI
+side can then have at most WSGI_THREADS requests waiting on the database,
+the async side any number. On a local SQLite file the work is CPU bound
+and both paths end up close; the gap appears when the database is slow
+relative to the serialisation work and spare cores are available.
+
+Usage: python -m benchmarks.bench_asgi [seconds] [--latency-ms N]
+Run from the part3 directory.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+import config
+from app.app import create_app
+from app.asgi import AsyncReadApp, call
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+PLACES = 2_000
+REVIEWS_PER_PLACE = 3
+CONCURRENCY = (1, 16, 64, 256)
+WSGI_THREADS = 16
+PATH, QUERY = "/api/v1/places/", "limit=20&sort=price"
+
+
+def make_app(path):
+    config.config["bench"] = type("BenchConfig", (config.ProductionConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "SQL_INSTRUMENTATION": False,
+        "HTTP_CACHE": False,
+        "PASSWORD_HASH_ROUNDS": 4,
+        "ASYNC_ENGINE_OPTIONS": {"pool_size": 32, "max_overflow": 0},
+    })
+    return create_app("bench")
+
+
+def seed(app):
+    facade = HBnBFacade()
+    with app.app_context():
+        owner = facade.create_user(email="owner@example.com", password_hash="x")
+        amenities = facade.bulk_create_amenities([{"name": f"Amenity {i}"} for i in range(20)])
+        places = facade.bulk_create_places(
+            [{"title": f"Place {i}", "price": float(i % 300)} for i in range(PLACES)],
+            owner_id=owner.id,
+        )
+        facade.bulk_create_reviews(
+            [{"text": "ok", "rating": 1 + i % 5, "place_id": p["id"]}
+             for p in places for i in range(REVIEWS_PER_PLACE)],
+            user_id=owner.id,
+        )
+        for i, place in enumerate(places[:500]):
+            facade.add_amenity_to_place(place["id"], amenities[i % 20]["id"])
+
+
+def report(name, concurrency, latencies, elapsed):
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(f"{name:<5} C={concurrency:<4} {len(latencies) / elapsed:8.0f} req/s  "
+          f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms")
+
+
+def run_wsgi(app, concurrency, seconds, latency):
+    client = app.test_client()
+    slots = threading.Semaphore(WSGI_THREADS)
+    started = time.perf_counter()
+    deadline = started + seconds
+    latencies, lock = [], threading.Lock()
+
+    def worker():
+        mine = []
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            with slots:
+                if latency:
+                    time.sleep(latency)
+                response = client.get(f"{PATH}?{QUERY}")
+            assert response.status_code == 200
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    report("wsgi", concurrency, latencies, time.perf_counter() - started)
+
+
+async def run_asgi(app, concurrency, seconds, latency):
+    started = time.perf_counter()
+    deadline = started + seconds
+    latencies = []
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if latency:
+                await asyncio.sleep(latency)
+            status, _, _ = await call(app, PATH, QUERY)
+            assert status == 200
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report("asgi", concurrency, latencies, time.perf_counter() - started)
+    await app.engine.dispose()  # connections belong to this event loop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("seconds", nargs="?", type=float, default=3.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="simulated database round trip per request")
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        app = make_app(os.path.join(data_dir, "bench.db"))
+        seed(app)
+        asgi_app = AsyncReadApp(app)
+        print(f"{PLACES} places, {WSGI_THREADS} WSGI threads, "
+              f"{args.seconds:g}s per run, latency {args.latency_ms:g} ms")
+        for concurrency in CONCURRENCY:
+            run_wsgi(app, concurrency, args.seconds, latency)
+            asyncio.run(run_asgi(asgi_app, concurrency, args.seconds, latency))
+        with app.app_context():
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
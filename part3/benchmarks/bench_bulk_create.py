@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""Compare one-by-one and bulk creation of places on a file-backed SQLite DB.
+
+Times N facade.create_place calls (one INSERT and commit each) against a
+single facade.bulk_create_places call, then the same through HTTP: N
+POST /places requests against POST /places/bulk in batches of
+BULK_MAX_ITEMS.
+
+Usage: python -m benchmarks.bench_bulk_create [places]
+Run from the part3 directory.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from flask_jwt_extended import create_access_token
+
+import config
+from app.app import create_app
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+
+def make_app(data_dir):
+    path = os.path.join(data_dir, "bench.db")
+    config.config["bench"] = type("BenchConfig", (config.TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "SQL_INSTRUMENTATION": False,
+    })
+    return create_app("bench")
+
+
+def items(n, tag):
+    return [{"title": f"{tag} {i}", "price": 50.0 + i % 200,
+             "latitude": 24.0 + (i % 1000) / 1000, "longitude": 46.0} for i in range(n)]
+
+
+def report(label, n, elapsed):
+    print(f"{label:<32} {elapsed:8.2f}s  {n / elapsed:10,.0f} places/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    data_dir = tempfile.mkdtemp()
+    try:
+        app = make_app(data_dir)
+        facade = HBnBFacade()
+        with app.app_context():
+            owner = facade.create_user(email="owner@example.com", password_hash="x")
+
+            start = time.perf_counter()
+            for item in items(n, "single"):
+                facade.create_place(owner_id=owner.id, **item)
+            report("facade.create_place x N", n, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            facade.bulk_create_places(items(n, "bulk"), owner_id=owner.id)
+            report("facade.bulk_create_places", n, time.perf_counter() - start)
+
+            client = app.test_client()
+            headers = {"Authorization": "Bearer " + create_access_token(identity=owner.id)}
+
+            start = time.perf_counter()
+            for item in items(n, "http"):
+                response = client.post("/api/v1/places/", json=dict(item, owner_id=owner.id),
+                                       headers=headers)
+                assert response.status_code == 201, response.data
+            report("POST /places x N", n, time.perf_counter() - start)
+
+            batch = app.config["BULK_MAX_ITEMS"]
+            payload = items(n, "http-bulk")
+            start = time.perf_counter()
+            for i in range(0, n, batch):
+                response = client.post("/api/v1/places/bulk", json=payload[i:i + batch],
+                                       headers=headers)
+                assert response.status_code == 201, response.data
+            report(f"POST /places/bulk ({batch}/request)", n, time.perf_counter() - start)
+
+            assert facade.count_places() == 4 * n
+            db.session.remove()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
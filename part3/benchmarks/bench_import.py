@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+"""Bulk import rate of app/services/bulk_io.py on a file-backed SQLite DB.
+
+Writes a synthetic dump (users, places and REVIEWS reviews, as CSV or
+NDJSON), imports it into a fresh database with the production SQLite
+profile and reports rows/s per commit and per table, then the total
+including the index builds and the place rating aggregates. Then exports
+it back.
+
+Usage: python -m benchmarks.bench_import [reviews] [csv|ndjson]
+Run from the part3 directory.
+"""
+
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import config
+from app.app import create_app
+from app.extensions import db
+from app.services import bulk_io
+
+USERS = 10_000
+PLACES = 50_000
+
+
+def write_dump(directory, reviews, fmt):
+    tables = {
+        "users": (["id", "email", "password_hash", "is_admin"],
+                  ((f"u{i}", f"user{i}@example.com", "x", 0) for i in range(USERS))),
+        "places": (["id", "title", "price", "latitude", "longitude", "owner_id"],
+                   ((f"p{i}", f"Place {i}", float(i % 500), -60 + i % 120, -170 + i % 340,
+                     f"u{i % USERS}") for i in range(PLACES))),
+        "reviews": (["id", "text", "rating", "user_id", "place_id"],
+                    ((f"r{i:09d}", "Lovely stay, would come again", 1 + i % 5,
+                      f"u{i % USERS}", f"p{i % PLACES}") for i in range(reviews))),
+    }
+    for name, (columns, rows) in tables.items():
+        with open(os.path.join(directory, f"{name}.{fmt}"), "w", newline="") as fp:
+            if fmt == "csv":
+                writer = csv.writer(fp)
+                writer.writerow(columns)
+                writer.writerows(rows)
+            else:
+                fp.writelines(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+
+def report(name, rows, seconds):
+    print(f"  {name:<14} {rows:>12,} rows  {seconds:8.1f}s  {rows / seconds:>10,.0f} rows/s")
+
+
+def main():
+    reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fmt = sys.argv[2] if len(sys.argv) > 2 else "csv"
+    data_dir = tempfile.mkdtemp()
+    try:
+        dump_dir = os.path.join(data_dir, "dump")
+        os.makedirs(dump_dir)
+        write_dump(dump_dir, reviews, fmt)
+        config.config["bench"] = type("BenchConfig", (config.ProductionConfig,), {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(data_dir, 'bench.db')}",
+            "SQLALCHEMY_READ_URI": None,
+            "SQL_INSTRUMENTATION": False,
+        })
+        app = create_app("bench")
+        with app.app_context():
+            print(f"import ({fmt})")
+            start = time.perf_counter()
+            counts = bulk_io.import_dump(dump_dir, progress=report)
+            elapsed = time.perf_counter() - start
+            total = sum(counts.values())
+            print(f"  total {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s, "
+                  "indexes and rating aggregates included)")
+
+            print(f"export ({fmt})")
+            start = time.perf_counter()
+            counts = bulk_io.export_dump(os.path.join(data_dir, "export"), fmt)
+            elapsed = time.perf_counter() - start
+            print(f"  total {sum(counts.values()):,} rows in {elapsed:.1f}s")
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Login throughput and its effect on other endpoints.
+
+REQUEST_WORKERS threads stand in for the server's request workers. A burst
+of POST /login calls is submitted together with cheap GET /amenities/
+probes, once with bcrypt inline on the request thread and once through the
+bounded hashing pool. Reports successful logins/s, 503s, and probe latency.
+
+Usage: python -m benchmarks.bench_login [logins] [rounds]
+Run from the part3 directory.
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from app.app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.extensions import password_hasher
+
+REQUEST_WORKERS = 8
+PROBE_EVERY = 4
+
+SETUPS = {
+    "inline": {"PASSWORD_HASH_WORKERS": 0},
+    "pool (2 workers, 4 pending)": {"PASSWORD_HASH_WORKERS": 2,
+                                    "PASSWORD_HASH_MAX_PENDING": 4,
+                                    "PASSWORD_HASH_QUEUE_TIMEOUT": 0.05},
+}
+
+
+def make_app(data_dir, rounds, overrides):
+    path = os.path.join(data_dir, "bench.db")
+    config.config["bench"] = type("BenchConfig", (config.TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "SQL_INSTRUMENTATION": False,
+        "HTTP_CACHE": False,
+        "PASSWORD_HASH_ROUNDS": rounds,
+        **overrides,
+    })
+    return create_app("bench")
+
+
+def run(label, data_dir, logins, rounds, overrides):
+    app = make_app(data_dir, rounds, overrides)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        user = User(email="bench@example.com")
+        user.set_password("password123")
+        db.session.add(user)
+        db.session.commit()
+    client = app.test_client()
+    credentials = {"email": "bench@example.com", "password": "password123"}
+
+    def login():
+        return client.post("/api/v1/login", json=credentials).status_code
+
+    def probe():
+        start = time.perf_counter()
+        client.get("/api/v1/amenities/")
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(REQUEST_WORKERS) as workers:
+        jobs = []
+        for i in range(logins):
+            jobs.append(("login", workers.submit(login)))
+            if i % PROBE_EVERY == 0:
+                jobs.append(("probe", workers.submit(probe)))
+        statuses = [f.result() for kind, f in jobs if kind == "login"]
+        probes = sorted(f.result() * 1000 for kind, f in jobs if kind == "probe")
+    elapsed = time.perf_counter() - start
+    password_hasher.shutdown()
+
+    ok = statuses.count(200)
+    busy = statuses.count(503)
+    p95 = probes[int(len(probes) * 0.95) - 1]
+    print(f"{label:<30} {ok / elapsed:8.1f} logins/s  503s: {busy:4d}  "
+          f"probe p50 {statistics.median(probes):7.1f} ms  p95 {p95:7.1f} ms")
+
+
+def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"{logins} logins at cost {rounds}, {REQUEST_WORKERS} request workers")
+    data_dir = tempfile.mkdtemp()
+    try:
+        for label, overrides in SETUPS.items():
+            run(label, data_dir, logins, rounds, overrides)
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""Concurrent reads and writes with the default and the production SQLite profile.
+
+Each run uses a fresh database file. WRITERS threads create amenities
+through the facade while READERS threads page through places, for
+SECONDS seconds. Reports operations/s and how many operations failed with
+"database is locked".
+
+Usage: python -m benchmarks.bench_sqlite_profile [seconds]
+Run from the part3 directory.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+
+import config
+from app.app import create_app
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+WRITERS = 4
+READERS = 8
+PLACES = 2_000
+
+PROFILES = {
+    "default": config.DevelopmentConfig,
+    "production": config.ProductionConfig,
+}
+
+
+def make_app(data_dir, name, base):
+    path = os.path.join(data_dir, f"{name}.db")
+    config.config["bench"] = type("BenchConfig", (base,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "DEBUG": False,
+        "SQL_INSTRUMENTATION": False,
+        "ENTITY_CACHE": False,
+        "PASSWORD_HASH_ROUNDS": 4,
+    })
+    return create_app("bench")
+
+
+def run(name, base, data_dir, seconds):
+    app = make_app(data_dir, name, base)
+    facade = HBnBFacade()
+    with app.app_context():
+        owner = facade.create_user(email="owner@example.com", password_hash="x")
+        facade.bulk_create_places(
+            [{"title": f"Place {i}", "price": float(i % 300)} for i in range(PLACES)],
+            owner_id=owner.id,
+        )
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def worker(kind):
+        done = locked = 0
+        with app.app_context():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                try:
+                    if kind == "writes":
+                        facade.create_amenity(name=f"{threading.get_ident()}-{i}")
+                    else:
+                        facade.get_places(limit=50, sort="price", max_price=100)
+                    done += 1
+                except OperationalError as e:
+                    if "locked" not in str(e):
+                        raise
+                    db.session.rollback()
+                    locked += 1
+                finally:
+                    db.session.remove()
+        with lock:
+            counts[kind] += done
+            counts["locked"] += locked
+
+    threads = [threading.Thread(target=worker, args=("writes",)) for _ in range(WRITERS)]
+    threads += [threading.Thread(target=worker, args=("reads",)) for _ in range(READERS)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    with app.app_context():
+        db.engine.dispose()
+
+    print(f"{name:<12} writes {counts['writes'] / seconds:8.0f}/s  "
+          f"reads {counts['reads'] / seconds:8.0f}/s  locked errors {counts['locked']}")
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    print(f"{WRITERS} writers, {READERS} readers, {seconds:g}s per profile")
+    data_dir = tempfile.mkdtemp()
+    try:
+        for name, base in PROFILES.items():
+            run(name, base, data_dir, seconds)
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""Peak memory of a JSON page against an NDJSON stream of all reviews.
+
+Loads N reviews, then reads them back through GET /api/v1/reviews/ once
+as a single JSON page (limit=N, API_MAX_PAGE_SIZE lifted) and once with
+?stream=1, consuming the streamed body chunk by chunk. Reports time and
+the tracemalloc peak of each; the streamed peak should stay the same as N
+grows.
+
+Usage: python -m benchmarks.bench_streaming [reviews]
+Run from the part3 directory.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import config
+from app.app import create_app
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+
+def make_app(data_dir, n):
+    path = os.path.join(data_dir, "bench.db")
+    config.config["bench"] = type("BenchConfig", (config.TestingConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "SQL_INSTRUMENTATION": False,
+        "HTTP_CACHE": False,
+        "API_MAX_PAGE_SIZE": n,
+    })
+    return create_app("bench")
+
+
+def seed(app, n):
+    facade = HBnBFacade()
+    with app.app_context():
+        owner = facade.create_user(email="owner@example.com", password_hash="x")
+        place = facade.create_place(title="Loft", price=80, owner_id=owner.id)
+        for i in range(0, n, 10_000):
+            facade.bulk_create_reviews(
+                [{"text": f"Review number {j} " + "x" * 80, "rating": 1 + j % 5,
+                  "place_id": place.id} for j in range(i, min(n, i + 10_000))],
+                user_id=owner.id,
+            )
+
+
+def measure(label, read):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {rows:>9,} rows  {elapsed:7.2f}s  peak {peak / 2**20:8.1f} MiB")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    data_dir = tempfile.mkdtemp()
+    try:
+        app = make_app(data_dir, n)
+        seed(app, n)
+        client = app.test_client()
+
+        def json_page():
+            return len(client.get(f"/api/v1/reviews/?limit={n}").get_json())
+
+        def ndjson_stream():
+            response = client.get("/api/v1/reviews/?stream=1", buffered=False)
+            rows = sum(chunk.count(b"\n") for chunk in response.response)
+            response.close()
+            return rows
+
+        measure("json", json_page)
+        measure("ndjson", ndjson_stream)
+        with app.app_context():
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+"""Synthetic HBnB dataset, written as a dump for app/services/bulk_io.py.
+
+A scale is a total row count: "1k", "10k", "100k", "1m" or a number. The
+rows are split in fixed proportions, about 5 reviews and 2.5 amenity
+links per place and one user per 10 places, with AMENITIES amenities.
+Generation is deterministic for a given scale and seed.
+
+Every user's password is PASSWORD (one hash, shared by all rows).
+
+Usage: python -m benchmarks.dataset SCALE DIR [--seed N] [--format csv|ndjson]
+Run from the part3 directory; load the result with `python create_db.py import DIR`.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+AMENITIES = 50
+PASSWORD = "bench-password"
+
+# Rows per place: itself, 5 reviews, 2.5 amenity links, 0.1 users.
+_ROWS_PER_PLACE = 8.6
+
+_WORDS = ("quiet", "sunny", "central", "cosy", "modern", "spacious", "charming",
+          "bright", "rustic", "seaside", "garden", "loft", "studio", "villa")
+_CITIES = ((48.85, 2.35), (40.71, -74.0), (35.68, 139.69), (-33.87, 151.21),
+           (51.51, -0.13), (24.71, 46.68), (-22.91, -43.17), (52.52, 13.40))
+
+
+def parse_scale(scale):
+    if isinstance(scale, str) and scale.lower() in SCALES:
+        return SCALES[scale.lower()]
+    rows = int(scale)
+    if rows < 100:
+        raise ValueError("scale must be at least 100 rows")
+    return rows
+
+
+def counts(scale):
+    """Rows per table for a scale."""
+    places = max(10, int(parse_scale(scale) / _ROWS_PER_PLACE))
+    return {
+        "users": max(2, places // 10),
+        "amenities": AMENITIES,
+        "places": places,
+        "reviews": places * 5,
+        "place_amenity": places * 5 // 2,
+    }
+
+
+def _tables(n, rng, password_hash):
+    users = [f"user-{i:07d}" for i in range(n["users"])]
+    amenities = [f"amenity-{i:03d}" for i in range(n["amenities"])]
+    places = [f"place-{i:08d}" for i in range(n["places"])]
+
+    def place_rows():
+        for i, place_id in enumerate(places):
+            lat, lon = rng.choice(_CITIES)
+            title = " ".join(rng.sample(_WORDS, 2)).capitalize() + f" {i}"
+            yield (place_id, title, f"A {rng.choice(_WORDS)} place to stay",
+                   round(rng.uniform(20, 500), 2), round(lat + rng.uniform(-0.5, 0.5), 5),
+                   round(lon + rng.uniform(-0.5, 0.5), 5), users[i % len(users)])
+
+    def review_rows():
+        for i in range(n["reviews"]):
+            yield (f"review-{i:09d}", f"{rng.choice(_WORDS).capitalize()} and clean",
+                   rng.randint(1, 5), rng.choice(users), places[i % len(places)])
+
+    def link_rows():
+        per_place = n["place_amenity"] / len(places)
+        for i, place_id in enumerate(places):
+            k = int(per_place * (i + 1)) - int(per_place * i)
+            for amenity_id in rng.sample(amenities, min(k, len(amenities))):
+                yield (place_id, amenity_id)
+
+    return {
+        "users": (("id", "email", "password_hash", "is_admin"),
+                  ((u, f"{u}@example.com", password_hash, i == 0)
+                   for i, u in enumerate(users))),
+        "amenities": (("id", "name"), ((a, f"Amenity {i}") for i, a in enumerate(amenities))),
+        "places": (("id", "title", "description", "price", "latitude", "longitude",
+                    "owner_id"), place_rows()),
+        "reviews": (("id", "text", "rating", "user_id", "place_id"), review_rows()),
+        "place_amenity": (("place_id", "amenity_id"), link_rows()),
+    }
+
+
+def write_dump(directory, scale, password_hash, seed=0, fmt="csv"):
+    """Write the dataset to directory/<table>.<fmt>; returns rows per table."""
+    n = counts(scale)
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    for name, (columns, rows) in _tables(n, rng, password_hash).items():
+        with open(os.path.join(directory, f"{name}.{fmt}"), "w", newline="",
+                  encoding="utf-8") as fp:
+            if fmt == "csv":
+                writer = csv.writer(fp)
+                writer.writerow(columns)
+                writer.writerows(rows)
+            else:
+                fp.writelines(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic HBnB dump.")
+    parser.add_argument("scale", help=f"{', '.join(SCALES)} or a row count")
+    parser.add_argument("directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+    args = parser.parse_args()
+
+    from hbnb_common.password_hasher import _hash
+    from config import Config
+    password_hash = _hash(PASSWORD, Config.PASSWORD_HASH_ROUNDS)
+    n = write_dump(args.directory, args.scale, password_hash, args.seed, args.format)
+    print(", ".join(f"{name} {rows:,}" for name, rows in n.items()))
+
+
+if __name__ == "__main__":
+    main()
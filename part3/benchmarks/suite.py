@@ -0,0 +1,448 @@
+#!/usr/bin/python3
+"""Endpoint benchmark suite: latency percentiles and throughput per route.
+
+    python -m benchmarks.suite run [--scale 10k] [--requests 200] [--concurrency 1]
+                                   [--http] [--only places] [--save]
+    python -m benchmarks.suite compare OLD.json NEW.json [--threshold 10]
+
+run builds a fresh SQLite database at the given scale (benchmarks/dataset.py,
+loaded with app/services/bulk_io.py) under the production config, then
+sends --requests requests to each scenario in SCENARIOS, which between
+them cover every /api/v1 route. Requests go through the Flask test
+client, or with --http through a local threaded server over real sockets.
+Reads run before writes; the delete scenarios remove what the create
+scenarios added.
+
+For each scenario it prints requests/s, p50/p95/p99 and max latency, and
+the number of unexpected statuses. --save writes the run, with the git
+commit, dataset and settings, to benchmarks/results/. compare prints the
+change between two saved runs, marks p95 or throughput regressions beyond
+--threshold percent, and exits 1 if there are any.
+
+Passwords are hashed with PASSWORD_HASH_ROUNDS = 4 so that the login
+scenario measures the request path, not bcrypt (see bench_login.py).
+
+Run from the part3 directory.
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import select
+
+import config
+from app.api.v1.pagination import encode_cursor
+from app.app import create_app
+from app.extensions import db
+from app.services import bulk_io
+from app.extensions import password_hasher
+from benchmarks import dataset
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+SAMPLE_IDS = 1_000
+BULK_ITEMS = 50
+
+
+# -------------------------
+# Scenarios
+# -------------------------
+class Context:
+    """Ids to aim requests at, plus what the write scenarios created."""
+
+    def __init__(self, ids, owner, token, seed):
+        self.ids = ids
+        self.owner = owner
+        self.token = token
+        self.rng = random.Random(seed)
+        self.created = {"reviews": [], "amenities": []}
+        self.counter = 0
+
+    def pick(self, kind):
+        return self.rng.choice(self.ids[kind])
+
+    def unique(self, prefix):
+        self.counter += 1
+        return f"{prefix}-{os.getpid()}-{self.counter}"
+
+    def city(self):
+        lat, lon = self.rng.choice(dataset._CITIES)
+        return lat + self.rng.uniform(-0.3, 0.3), lon + self.rng.uniform(-0.3, 0.3)
+
+
+def _bbox(c):
+    lat, lon = c.city()
+    return f"/api/v1/places/?limit=50&bbox={lon - 0.2},{lat - 0.2},{lon + 0.2},{lat + 0.2}"
+
+
+def _near(c):
+    lat, lon = c.city()
+    return f"/api/v1/places/?limit=50&lat={lat}&lon={lon}&radius_km=10"
+
+
+def _price_page(c):
+    low = c.rng.randrange(20, 450)
+    return f"/api/v1/places/?limit=20&sort=-rating&min_price={low}&max_price={low + 50}"
+
+
+def _cursor_page(c):
+    cursor = encode_cursor([round(c.rng.uniform(20, 500), 2), ""])
+    return f"/api/v1/places/?limit=20&sort=price&cursor={cursor}"
+
+
+def _new_place(c):
+    lat, lon = c.city()
+    return {"title": c.unique("Place"), "price": round(c.rng.uniform(20, 500), 2),
+            "latitude": lat, "longitude": lon, "owner_id": c.owner}
+
+
+def _new_review(c):
+    return {"text": c.unique("Review"), "rating": c.rng.randint(1, 5),
+            "place_id": c.pick("places")}
+
+
+# name -> (method, path(ctx), body(ctx) or None, expected status, needs a token)
+SCENARIOS = {
+    # Reads
+    "swagger": ("GET", lambda c: "/api/v1/swagger.json", None, 200, False),
+    "users.list": ("GET", lambda c: "/api/v1/users/?limit=50", None, 200, False),
+    "places.list": ("GET", lambda c: "/api/v1/places/?limit=20", None, 200, False),
+    "places.list.filtered": ("GET", _price_page, None, 200, False),
+    "places.list.cursor": ("GET", _cursor_page, None, 200, False),
+    "places.stream": ("GET", lambda c: "/api/v1/places/?stream=1&limit=500", None, 200, False),
+    "places.bbox": ("GET", _bbox, None, 200, False),
+    "places.near": ("GET", _near, None, 200, False),
+    "places.amenities": ("GET", lambda c: "/api/v1/places/?limit=20&sort=price&amenities="
+                         + ",".join(c.rng.sample(c.ids["amenities"], c.rng.randint(1, 2))),
+                         None, 200, False),
+    "places.search": ("GET", lambda c: "/api/v1/places/search?q="
+                      + "+".join(c.rng.sample(dataset._WORDS, c.rng.randint(1, 2))),
+                      None, 200, False),
+    "places.item": ("GET", lambda c: f"/api/v1/places/{c.pick('places')}", None, 200, False),
+    "reviews.list": ("GET", lambda c: "/api/v1/reviews/?limit=50", None, 200, False),
+    "reviews.by_place": ("GET", lambda c: f"/api/v1/reviews/?place_id={c.pick('places')}",
+                         None, 200, False),
+    "reviews.item": ("GET", lambda c: f"/api/v1/reviews/{c.pick('reviews')}", None, 200, False),
+    "amenities.list": ("GET", lambda c: "/api/v1/amenities/", None, 200, False),
+    "amenities.item": ("GET", lambda c: f"/api/v1/amenities/{c.pick('amenities')}",
+                       None, 200, False),
+    # Writes
+    "login": ("POST", lambda c: "/api/v1/login",
+              lambda c: {"email": f"{c.pick('users')}@example.com",
+                         "password": dataset.PASSWORD}, 200, False),
+    "users.create": ("POST", lambda c: "/api/v1/users/",
+                     lambda c: {"email": c.unique("user") + "@example.com",
+                                "password": "password123"}, 201, False),
+    "places.create": ("POST", lambda c: "/api/v1/places/", _new_place, 201, True),
+    "places.bulk": ("POST", lambda c: "/api/v1/places/bulk",
+                    lambda c: [_new_place(c) for _ in range(BULK_ITEMS)], 201, True),
+    "reviews.create": ("POST", lambda c: "/api/v1/reviews/", _new_review, 201, True),
+    "reviews.bulk": ("POST", lambda c: "/api/v1/reviews/bulk",
+                     lambda c: [_new_review(c) for _ in range(BULK_ITEMS)], 201, True),
+    "reviews.update": ("PUT", lambda c: f"/api/v1/reviews/{c.rng.choice(c.created['reviews'])}",
+                       lambda c: {"text": c.unique("Edited"), "rating": c.rng.randint(1, 5)},
+                       200, False),
+    "amenities.create": ("POST", lambda c: "/api/v1/amenities/",
+                         lambda c: {"name": c.unique("Amenity")}, 201, False),
+    "amenities.bulk": ("POST", lambda c: "/api/v1/amenities/bulk",
+                       lambda c: [{"name": c.unique("Amenity")} for _ in range(BULK_ITEMS)],
+                       201, False),
+    "amenities.update": ("PUT",
+                         lambda c: f"/api/v1/amenities/{c.rng.choice(c.created['amenities'])}",
+                         lambda c: {"name": c.unique("Renamed")}, 200, False),
+    "reviews.delete": ("DELETE", lambda c: f"/api/v1/reviews/{c.created['reviews'].pop()}",
+                       None, 200, False),
+    "amenities.delete": ("DELETE", lambda c: f"/api/v1/amenities/{c.created['amenities'].pop()}",
+                         None, 200, False),
+}
+
+# Scenarios whose responses carry an id to remember for update/delete.
+RECORDS = {"reviews.create": "reviews", "amenities.create": "amenities"}
+
+
+# -------------------------
+# Drivers
+# -------------------------
+class TestClientDriver:
+    """Requests through the Flask test client (no sockets)."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, body, headers):
+        response = self.client.open(path, method=method, json=body, headers=headers)
+        return response.status_code, response.get_data()
+
+    def close(self):
+        pass
+
+
+class HttpDriver:
+    """Requests over HTTP to a threaded werkzeug server on a free port."""
+
+    def __init__(self, app):
+        from werkzeug.serving import make_server
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)  # no line per request
+        self.server = make_server("127.0.0.1", 0, app, threaded=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.local = threading.local()
+
+    def request(self, method, path, body, headers):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = http.client.HTTPConnection("127.0.0.1",
+                                                               self.server.server_port)
+        payload = None
+        headers = dict(headers)
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, ConnectionError):
+            self.local.conn = None
+            conn.close()
+            raise
+        if response.getheader("Connection", "").lower() == "close" or response.version == 10:
+            self.local.conn = None
+            conn.close()
+        return response.status, data
+
+    def close(self):
+        self.server.shutdown()
+
+
+# -------------------------
+# Running
+# -------------------------
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def build_app(data_dir, scale, seed):
+    config.config["bench"] = type("SuiteConfig", (config.ProductionConfig,), {
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(data_dir, 'suite.db')}",
+        "PASSWORD_HASH_ROUNDS": 4,
+    })
+    try:
+        app = create_app("bench")
+    finally:
+        del config.config["bench"]
+    dump_dir = os.path.join(data_dir, "dump")
+    with app.app_context():
+        rows = dataset.write_dump(dump_dir, scale, password_hasher.hash(dataset.PASSWORD), seed)
+        bulk_io.import_dump(dump_dir)
+    shutil.rmtree(dump_dir)
+    return app, rows
+
+
+def sample_ids(app, seed):
+    """Up to SAMPLE_IDS ids per table, the admin's id and a token for it."""
+    from app.models.amenity import Amenity
+    from app.models.place import Place
+    from app.models.review import Review
+    from app.models.user import User
+    rng = random.Random(seed)
+    ids = {}
+    with app.app_context():
+        for kind, model in (("users", User), ("places", Place), ("reviews", Review),
+                            ("amenities", Amenity)):
+            all_ids = db.session.scalars(select(model.id)).all()
+            ids[kind] = rng.sample(all_ids, min(SAMPLE_IDS, len(all_ids)))
+        admin = db.session.scalar(select(User.id).where(User.is_admin).limit(1))
+        token = create_access_token(identity=admin, additional_claims={"is_admin": True})
+    return ids, admin, token
+
+
+def run_scenario(driver, ctx, name, requests, concurrency, warmup):
+    method, path, body, expected, needs_token = SCENARIOS[name]
+    headers = {"Authorization": f"Bearer {ctx.token}"} if needs_token else {}
+    jobs = [(method, path(ctx), body(ctx) if body else None)
+            for _ in range(warmup + requests)]
+    record = RECORDS.get(name)
+
+    def send(job):
+        start = time.perf_counter()
+        status, data = driver.request(*job, headers)
+        elapsed = time.perf_counter() - start
+        if record and status == expected:
+            ctx.created[record].append(json.loads(data)["id"])
+        return elapsed, status
+
+    for job in jobs[:warmup]:
+        send(job)
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = list(pool.map(send, jobs[warmup:]))
+    else:
+        results = [send(job) for job in jobs[warmup:]]
+    wall = time.perf_counter() - started
+
+    latencies = sorted(elapsed * 1000 for elapsed, _ in results)
+    return {
+        "requests": len(results),
+        "errors": sum(1 for _, status in results if status != expected),
+        "rps": len(results) / wall,
+        "mean_ms": sum(latencies) / len(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1],
+    }
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_row(name, r):
+    print(f"{name:<22} {r['rps']:>8.0f}/s  p50 {r['p50_ms']:7.2f}  p95 {r['p95_ms']:7.2f}  "
+          f"p99 {r['p99_ms']:7.2f}  max {r['max_ms']:7.2f} ms"
+          + (f"  {r['errors']} errors" if r["errors"] else ""))
+
+
+def run(args):
+    names = [name for name in SCENARIOS if not args.only or any(o in name for o in args.only)]
+    # Updates and deletes need the rows their create scenario adds.
+    for name in ("reviews.update", "reviews.delete", "amenities.update", "amenities.delete"):
+        create = name.split(".")[0] + ".create"
+        if name in names and create not in names:
+            names.insert(names.index(name), create)
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        started = time.perf_counter()
+        app, rows = build_app(data_dir, args.scale, args.seed)
+        print(f"dataset {args.scale}: " + ", ".join(f"{k} {v:,}" for k, v in rows.items())
+              + f" ({time.perf_counter() - started:.1f}s)")
+        ids, admin, token = sample_ids(app, args.seed)
+        ctx = Context(ids, admin, token, args.seed)
+        driver = HttpDriver(app) if args.http else TestClientDriver(app)
+        transport = "http" if args.http else "test client"
+        print(f"{args.requests} requests per scenario, concurrency {args.concurrency}, "
+              f"{transport}")
+        results = {}
+        try:
+            for name in names:
+                results[name] = run_scenario(driver, ctx, name, args.requests,
+                                             args.concurrency, args.warmup)
+                print_row(name, results[name])
+        finally:
+            driver.close()
+            with app.app_context():
+                db.engine.dispose()
+            read_engine = app.extensions.get("read_engine")
+            if read_engine is not None:
+                read_engine.dispose()
+    finally:
+        shutil.rmtree(data_dir)
+
+    if args.save:
+        commit = _git("rev-parse", "HEAD") or "unknown"
+        run_info = {
+            "commit": commit,
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "dataset": rows,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "transport": transport,
+            "results": results,
+        }
+        os.makedirs(args.results_dir, exist_ok=True)
+        path = os.path.join(args.results_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-"
+                                              f"{commit[:10]}-{args.scale}.json")
+        with open(path, "w") as fp:
+            json.dump(run_info, fp, indent=2)
+        print(f"saved {path}")
+    return 1 if any(r["errors"] for r in results.values()) else 0
+
+
+def _change(old, new):
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(args):
+    with open(args.old) as fp:
+        old = json.load(fp)
+    with open(args.new) as fp:
+        new = json.load(fp)
+    print(f"old {old['commit'][:10]}{'+' if old['dirty'] else ''} ({old['scale']})  ->  "
+          f"new {new['commit'][:10]}{'+' if new['dirty'] else ''} ({new['scale']})")
+    if (old["scale"], old["transport"]) != (new["scale"], new["transport"]):
+        print("warning: runs differ in scale or transport")
+    regressions = 0
+    for name, n in new["results"].items():
+        o = old["results"].get(name)
+        if o is None:
+            print(f"{name:<22} (new)")
+            continue
+        rps, p50, p95 = (_change(o["rps"], n["rps"]), _change(o["p50_ms"], n["p50_ms"]),
+                         _change(o["p95_ms"], n["p95_ms"]))
+        worse = p95 > args.threshold or rps < -args.threshold
+        regressions += worse
+        print(f"{name:<22} {n['rps']:>8.0f}/s ({rps:+6.1f}%)  p50 {n['p50_ms']:7.2f} "
+              f"({p50:+6.1f}%)  p95 {n['p95_ms']:7.2f} ({p95:+6.1f}%)"
+              + ("  REGRESSION" if worse else ""))
+    print(f"{regressions} regression(s) beyond {args.threshold:g}%")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HBnB endpoint benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark every endpoint")
+    run_parser.add_argument("--scale", default="10k",
+                            help=f"{', '.join(dataset.SCALES)} or a row count")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--requests", type=int, default=200)
+    run_parser.add_argument("--warmup", type=int, default=5)
+    run_parser.add_argument("--concurrency", type=int, default=1)
+    run_parser.add_argument("--http", action="store_true",
+                            help="go through a local HTTP server instead of the test client")
+    run_parser.add_argument("--only", nargs="+", help="scenarios whose name contains any of these")
+    run_parser.add_argument("--save", action="store_true")
+    run_parser.add_argument("--results-dir", default=RESULTS_DIR)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0,
+                                help="percent change counted as a regression")
+
+    args = parser.parse_args(argv)
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
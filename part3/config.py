@@ -4,6 +4,60 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = "jwt-secret-key"
 
+    # Pragmas run on every SQLite connection (hbnb_common/sqlite_profile.py);
+    # ProductionConfig turns on the tuned profile.
+    SQLITE_PRAGMAS = {}
+
+    # Engine for SELECTs of GET requests (app/persistence/routing.py): a
+    # replica URI, "readonly" for a mode=ro pool on the same SQLite file,
+    # or None to send everything to the primary.
+    SQLALCHEMY_READ_URI = None
+    SQLALCHEMY_READ_ENGINE_OPTIONS = {}
+
+    # Async read path (app/asgi.py): None reads the SQLALCHEMY_DATABASE_URI
+    # file through aiosqlite in read-only mode.
+    ASYNC_DATABASE_URI = None
+    ASYNC_ENGINE_OPTIONS = {}
+
+    # Keyset pagination on list endpoints (?limit=&cursor=)
+    API_PAGE_SIZE = 100
+    API_MAX_PAGE_SIZE = 1000
+
+    # Largest batch accepted by the POST .../bulk endpoints
+    BULK_MAX_ITEMS = 1000
+
+    # bcrypt pool (hbnb_common/password_hasher.py). Rounds: a cost factor
+    # or "auto" to calibrate to PASSWORD_HASH_TARGET_MS per hash. Stored
+    # hashes with another cost are upgraded at login.
+    PASSWORD_HASH_ROUNDS = 12
+    PASSWORD_HASH_TARGET_MS = 250
+    PASSWORD_HASH_EXECUTOR = "thread"   # or "process"
+    PASSWORD_HASH_WORKERS = None        # None = CPU count, 0 = inline
+    PASSWORD_HASH_MAX_PENDING = None    # None = 4 x workers
+    PASSWORD_HASH_QUEUE_TIMEOUT = 1.0   # seconds before answering 503
+
+    # Per-request SQL statement count/timing headers (app/instrumentation.py)
+    SQL_INSTRUMENTATION = True
+
+    # ETag / 304 handling and LRU of list responses (app/api/v1/http_cache.py).
+    # Opt-in: versions are per process, so writes by another worker, the
+    # hbnb app or create_db.py import leave stale ETags behind. Only enable
+    # it where one process is the only writer (TestingConfig does).
+    HTTP_CACHE = False
+    HTTP_CACHE_SIZE = 256
+
+    # Facade primary-key lookups (app/services/entity_cache.py). Policies
+    # override size/TTL per kind: user, place, review, amenity. Opt-in like
+    # HTTP_CACHE: the cache is per process and only sees this process's
+    # writes, so enable it only where one process is the only writer.
+    ENTITY_CACHE = False
+    ENTITY_CACHE_SIZE = 1024
+    ENTITY_CACHE_TTL = 30.0
+    ENTITY_CACHE_POLICIES = {
+        "amenity": {"ttl": 300.0},
+        "place": {"max_entries": 4096},
+    }
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -12,11 +66,44 @@ class DevelopmentConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    PASSWORD_HASH_ROUNDS = 4
+    HTTP_CACHE = True
+    ENTITY_CACHE = True
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+
+    # WAL lets readers run alongside the single writer; busy_timeout makes
+    # writers queue for the lock instead of failing with "database is locked".
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "connect_args": {"timeout": 5, "check_same_thread": False},
+    }
+    SQLALCHEMY_READ_URI = "readonly"
+    SQLALCHEMY_READ_ENGINE_OPTIONS = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "connect_args": {"check_same_thread": False},
+    }
 
 
 config = {
     "default": DevelopmentConfig,
     "development": DevelopmentConfig,
     "testing": TestingConfig,
+    "production": ProductionConfig,
 }
 
@@ -1,6 +1,27 @@
+"""Create the tables and seed a test user, or bulk import/export data.
+
+    python create_db.py                           # tables + test user
+    python create_db.py export DIR [--format ndjson] [--tables users places]
+    python create_db.py import DIR [--tables reviews] [--chunk-rows N]
+    python create_db.py reindex                   # rebuild the full-text index
+
+Every command first adds the columns a database created by an older
+version lacks (app/persistence/migrations.py).
+
+DIR holds one <table>.csv or <table>.ndjson per table; see
+app/services/bulk_io.py. A failed import resumes where it stopped when
+the same command is run again. HBNB_ENV picks the config, as for run.py.
+"""
+
+import argparse
+import os
+import time
+
 from app.app import create_app
 from app.extensions import db
 from app.models.user import User
+from app.persistence import migrations, search
+from app.services import bulk_io
 
 def seed_user():
     email = "test@example.com"
@@ -25,10 +46,50 @@ def seed_user():
     print("EMAIL:", email)
     print("PASSWORD:", password)
 
-if __name__ == "__main__":
-    app = create_app()
+def report(name, rows, seconds):
+    rate = rows / seconds if seconds else 0
+    print(f"  {name:<14} {rows:>12,} rows  {seconds:8.1f}s  {rate:>10,.0f} rows/s", flush=True)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create the database or bulk load it.")
+    commands = parser.add_subparsers(dest="command")
+    for name in ("import", "export"):
+        command = commands.add_parser(name, help=f"{name} a dump directory")
+        command.add_argument("directory")
+        command.add_argument("--tables", nargs="+", choices=bulk_io.TABLES,
+                             default=list(bulk_io.TABLES))
+        command.add_argument("--chunk-rows", type=int, default=bulk_io.CHUNK_ROWS)
+    commands.choices["export"].add_argument("--format", choices=bulk_io.FORMATS, default="csv")
+    commands.choices["import"].add_argument("--transaction-rows", type=int,
+                                            default=bulk_io.TRANSACTION_ROWS)
+    commands.add_parser("reindex", help="rebuild the full-text search index")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    app = create_app(os.environ.get("HBNB_ENV", "default"))
     with app.app_context():
         db.create_all()
-        seed_user()
-        print("DB tables created ✅")
+        with db.engine.begin() as conn:
+            for table, columns in migrations.upgrade(conn).items():
+                print(f"Added columns {', '.join(f'{table}.{c}' for c in columns)} ✅")
+        if args.command == "import":
+            counts = bulk_io.import_dump(args.directory, args.tables, progress=report,
+                                         chunk_rows=args.chunk_rows,
+                                         transaction_rows=args.transaction_rows)
+            print(f"Imported {sum(counts.values()):,} rows ✅")
+        elif args.command == "export":
+            counts = bulk_io.export_dump(args.directory, args.format, args.tables,
+                                         progress=report, chunk_rows=args.chunk_rows)
+            print(f"Exported {sum(counts.values()):,} rows ✅")
+        elif args.command == "reindex":
+            started = time.perf_counter()
+            with db.engine.begin() as conn:
+                search.rebuild(conn)
+            print(f"Search index rebuilt in {time.perf_counter() - started:.1f}s ✅")
+        else:
+            seed_user()
+            print("DB tables created ✅")
 
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,40 @@ from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from hbnb.extensions import db
 from hbnb.models.review import Review
-from hbnb.models.place import Place
+from hbnb.models.place import Place, adjust_ratings
 
 reviews_bp = Blueprint("reviews", __name__)
 
 
+def _parse_rating(value):
+    """Rating from the request body as an int from 1 to 5 ("5" is
+    accepted); ValueError for anything else, before it reaches the
+    aggregate arithmetic."""
+    if isinstance(value, bool):
+        raise ValueError("rating must be an integer")
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("rating must be an integer") from None
+    if isinstance(value, float) and value != rating:
+        raise ValueError("rating must be an integer")
+    if not 1 <= rating <= 5:
+        raise ValueError("rating must be between 1 and 5")
+    return rating
+
+
+def _stored_rating(review):
+    """A review's current rating as SUM() counts it in recompute_ratings().
+
+    Rows written before ratings were validated may hold any number, or
+    text that the INTEGER column could not convert, which SUM() reads as 0.
+    """
+    rating = review.rating
+    if isinstance(rating, (int, float)) and not isinstance(rating, bool):
+        return rating
+    return 0
+
+
 @reviews_bp.get("/reviews")
 def list_reviews():
     reviews = Review.query.all()
@@ -44,9 +73,14 @@ def create_review(place_id):
     rating = data.get("rating")
     if not text or rating is None:
         return {"error": "text and rating required"}, 400
+    try:
+        rating = _parse_rating(rating)
+    except ValueError as e:
+        return {"error": str(e)}, 400
 
     review = Review(text=text, rating=rating, place_id=place_id, user_id=user_id)
     db.session.add(review)
+    adjust_ratings(place_id, reviews=1, rating_sum=rating)
     db.session.commit()
     return review.to_dict(), 201
 
@@ -70,9 +104,16 @@ def update_review(review_id):
     data.pop("user_id", None)
     data.pop("place_id", None)
 
+    if "rating" in data:
+        try:
+            data["rating"] = _parse_rating(data["rating"])
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
     if "text" in data:
         review.text = data["text"]
     if "rating" in data:
+        adjust_ratings(review.place_id, rating_sum=data["rating"] - _stored_rating(review))
         review.rating = data["rating"]
 
     db.session.commit()
@@ -94,6 +135,7 @@ def delete_review(review_id):
     if not is_admin and review.user_id != user_id:
         return {"error": "forbidden"}, 403
 
+    adjust_ratings(review.place_id, reviews=-1, rating_sum=-_stored_rating(review))
     db.session.delete(review)
     db.session.commit()
     return {"message": "deleted"}, 200
@@ -1,14 +1,17 @@
 from flask import Flask
+from hbnb_common import sqlite_profile
 from hbnb.config import Config
-from hbnb.extensions import db, jwt, bcrypt
+from hbnb.extensions import db, jwt, bcrypt, password_hasher
 
-def create_app():
+def create_app(config_class=Config):
     app = Flask(__name__)
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     db.init_app(app)
+    sqlite_profile.init_app(app, db)
     jwt.init_app(app)
     bcrypt.init_app(app)
+    password_hasher.init_app(app)
 
     # Register API v1 routes
     from hbnb.api.v1.routes import api_v1
@@ -5,10 +5,23 @@ class Config:
     SQLALCHEMY_DATABASE_URI = "sqlite:///hbnb.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Pragmas run on every SQLite connection (see ProductionConfig)
+    SQLITE_PRAGMAS = {}
+
 
     # JWT
     JWT_SECRET_KEY = "jwt-secret-key"
 
+    # bcrypt pool (hbnb_common/password_hasher.py). Rounds: a cost factor
+    # or "auto" to calibrate to PASSWORD_HASH_TARGET_MS per hash. Stored
+    # hashes with another cost are upgraded at login.
+    PASSWORD_HASH_ROUNDS = 12
+    PASSWORD_HASH_TARGET_MS = 250
+    PASSWORD_HASH_EXECUTOR = "thread"   # or "process"
+    PASSWORD_HASH_WORKERS = None        # None = CPU count, 0 = inline
+    PASSWORD_HASH_MAX_PENDING = None    # None = 4 x workers
+    PASSWORD_HASH_QUEUE_TIMEOUT = 1.0   # seconds before answering 503
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -17,3 +30,26 @@ class DevelopmentConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    PASSWORD_HASH_ROUNDS = 4
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+
+    # WAL lets readers run alongside the single writer; busy_timeout makes
+    # writers queue for the lock instead of failing with "database is locked".
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 3600,
+        "connect_args": {"timeout": 5, "check_same_thread": False},
+    }
@@ -1,7 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
+from hbnb_common.password_hasher import PasswordHasher
 
 db = SQLAlchemy()
 jwt = JWTManager()
 bcrypt = Bcrypt()
+password_hasher = PasswordHasher()
@@ -1,4 +1,5 @@
 import uuid
+from sqlalchemy import case, func, select, update
 from hbnb.extensions import db
 
 class Place(db.Model):
@@ -10,10 +11,54 @@ class Place(db.Model):
     # owner of the place
     owner_id = db.Column(db.String(36), db.ForeignKey("users.id"), nullable=False)
 
+    # Review aggregates, kept up to date by the reviews blueprint
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    avg_rating = db.Column(db.Float, nullable=False, default=0.0, server_default="0", index=True)
+
     def to_dict(self):
         return {
             "id": self.id,
             "name": self.name,
-            "owner_id": self.owner_id
+            "owner_id": self.owner_id,
+            "review_count": self.review_count,
+            "avg_rating": self.avg_rating,
         }
 
+
+def adjust_ratings(place_id, reviews=0, rating_sum=0):
+    """Add a delta to a place's review aggregates in the current transaction."""
+    if not (reviews or rating_sum):
+        return
+    new_count = Place.review_count + reviews
+    new_sum = Place.rating_sum + rating_sum
+    db.session.execute(
+        update(Place)
+        .where(Place.id == place_id)
+        .values(
+            review_count=new_count,
+            rating_sum=new_sum,
+            avg_rating=case((new_count > 0, new_sum * 1.0 / new_count), else_=0.0),
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def recompute_ratings(place_id=None):
+    """Rebuild aggregates from the reviews table; returns places updated."""
+    from hbnb.models.review import Review
+
+    def per_place(expr):
+        return select(expr).where(Review.place_id == Place.id).correlate(Place).scalar_subquery()
+
+    stmt = update(Place).values(
+        review_count=per_place(func.count()),
+        rating_sum=per_place(func.coalesce(func.sum(Review.rating), 0)),
+        avg_rating=per_place(func.coalesce(func.avg(Review.rating), 0.0)),
+    )
+    if place_id is not None:
+        stmt = stmt.where(Place.id == place_id)
+    result = db.session.execute(stmt.execution_options(synchronize_session=False))
+    db.session.commit()
+    return result.rowcount
+
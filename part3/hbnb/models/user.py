@@ -1,4 +1,4 @@
-from hbnb.extensions import db, bcrypt
+from hbnb.extensions import db, password_hasher
 from hbnb.models.base_model import BaseModel
 
 
@@ -14,10 +14,15 @@ class User(BaseModel):
     is_admin = db.Column(db.Boolean, nullable=False, default=False)
 
     def set_password(self, password: str) -> None:
-        self.password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return bcrypt.check_password_hash(self.password_hash, password)
+        """Verify password, upgrading the stored hash if its cost is outdated
+        (the caller commits the change)."""
+        ok, new_hash = password_hasher.verify_and_update(password, self.password_hash)
+        if new_hash is not None:
+            self.password_hash = new_hash
+        return ok
 
     def to_dict(self):
         data = super().to_dict()
@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
 from hbnb.extensions import db
 from hbnb.repositories.base import BaseRepository
 
@@ -8,9 +9,45 @@ class SQLAlchemyRepository(BaseRepository):
     NOTE: No DB initialization is done here.
     """
 
+    @contextmanager
+    def unit_of_work(self) -> Iterator["SQLAlchemyRepository"]:
+        """Group writes (from any repository) into one commit.
+
+        Inside the block add/update/delete only flush. The outermost block
+        commits on exit or rolls back on error; nested blocks join it, and
+        an error escaping one makes the outermost exit roll back.
+        """
+        info = db.session.info
+        uow = info.get("unit_of_work")
+        if uow is not None:
+            try:
+                yield self
+            except BaseException:
+                uow["rollback_only"] = True
+                raise
+            return
+
+        uow = info["unit_of_work"] = {"rollback_only": False}
+        try:
+            yield self
+            if uow["rollback_only"]:
+                raise RuntimeError("unit of work rolled back: a nested unit of work failed")
+            del info["unit_of_work"]
+            db.session.commit()
+        except BaseException:
+            info.pop("unit_of_work", None)
+            db.session.rollback()
+            raise
+
+    def _commit(self) -> None:
+        if "unit_of_work" in db.session.info:
+            db.session.flush()
+        else:
+            db.session.commit()
+
     def add(self, obj: Any) -> Any:
         db.session.add(obj)
-        db.session.commit()
+        self._commit()
         return obj
 
     def get(self, model: Any, obj_id: str) -> Optional[Any]:
@@ -20,8 +57,8 @@ class SQLAlchemyRepository(BaseRepository):
         return model.query.all()
 
     def update(self) -> None:
-        db.session.commit()
+        self._commit()
 
     def delete(self, obj: Any) -> None:
         db.session.delete(obj)
-        db.session.commit()
+        self._commit()
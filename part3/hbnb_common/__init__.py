@@ -0,0 +1,2 @@
+"""Helpers shared by the two Flask apps of part3: app (flask-restx API)
+and the standalone hbnb package. Neither app imports the other."""
@@ -0,0 +1,174 @@
+"""bcrypt hashing and verification off the request thread.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call), so
+running it inline lets a burst of logins occupy every request worker.
+PasswordHasher runs it on a small dedicated pool instead:
+
+- thread pool by default (bcrypt releases the GIL while hashing), or a
+  process pool with PASSWORD_HASH_EXECUTOR = "process";
+- at most workers + max_pending jobs are admitted; a caller that cannot
+  get a slot within queue_timeout gets PasswordHasherBusy (HTTP 503)
+  instead of queueing without bound;
+- the cost factor comes from PASSWORD_HASH_ROUNDS, or is calibrated at
+  start-up with "auto" so one hash takes about PASSWORD_HASH_TARGET_MS;
+- verify_and_update() rehashes a password whose stored cost differs from
+  the current one, so changing the cost upgrades users as they log in.
+
+Hashes are ordinary $2b$ bcrypt strings, compatible with Flask-Bcrypt
+(including BCRYPT_HANDLE_LONG_PASSWORDS).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+from werkzeug.exceptions import ServiceUnavailable
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 16
+
+
+class PasswordHasherBusy(ServiceUnavailable):
+    """Too many hashing jobs are queued; the client should retry."""
+
+    description = "Server busy, please retry shortly."
+
+    def get_headers(self, environ=None, scope=None):
+        return super().get_headers(environ, scope) + [("Retry-After", "1")]
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def _verify(password, hashed):
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:  # not a bcrypt hash
+        return False
+
+
+def calibrate(target_ms=250, min_rounds=10, max_rounds=MAX_ROUNDS):
+    """Largest cost factor whose hash takes at most target_ms here.
+
+    Each extra round doubles the work, so one timing at a cheap cost is
+    enough to extrapolate. Never returns less than min_rounds.
+    """
+    probe = 8
+    start = time.perf_counter()
+    _hash(b"calibration", probe)
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 1e-3)
+    rounds = probe
+    while rounds < max_rounds and elapsed_ms * 2 ** (rounds + 1 - probe) <= target_ms:
+        rounds += 1
+    while rounds > min_rounds and elapsed_ms * 2 ** (rounds - probe) > target_ms:
+        rounds -= 1
+    return max(min_rounds, min(rounds, max_rounds))
+
+
+def cost_of(hashed):
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12), or None."""
+    parts = hashed.split("$") if isinstance(hashed, str) else ()
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """Bounded bcrypt worker pool; configure with init_app(app).
+
+    workers=0 hashes inline on the calling thread (no pool, no limit).
+    """
+
+    def __init__(self, rounds=12, workers=None, max_pending=None, queue_timeout=1.0,
+                 executor="thread", handle_long_passwords=False):
+        self._lock = threading.Lock()
+        self._executor = None
+        self.configure(rounds, workers, max_pending, queue_timeout, executor,
+                       handle_long_passwords)
+
+    def configure(self, rounds=12, workers=None, max_pending=None, queue_timeout=1.0,
+                  executor="thread", handle_long_passwords=False):
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
+        if not MIN_ROUNDS <= rounds <= MAX_ROUNDS:
+            raise ValueError(f"rounds must be between {MIN_ROUNDS} and {MAX_ROUNDS}")
+        self.shutdown()
+        self.rounds = rounds
+        self.workers = (os.cpu_count() or 2) if workers is None else workers
+        self.max_pending = 4 * self.workers if max_pending is None else max_pending
+        self.queue_timeout = queue_timeout
+        self.executor_kind = executor
+        self.handle_long_passwords = handle_long_passwords
+        self._slots = threading.BoundedSemaphore(max(1, self.workers + self.max_pending))
+
+    def init_app(self, app):
+        rounds = app.config.get("PASSWORD_HASH_ROUNDS", 12)
+        if rounds == "auto":
+            rounds = calibrate(app.config.get("PASSWORD_HASH_TARGET_MS", 250))
+        self.configure(
+            rounds=rounds,
+            workers=app.config.get("PASSWORD_HASH_WORKERS"),
+            max_pending=app.config.get("PASSWORD_HASH_MAX_PENDING"),
+            queue_timeout=app.config.get("PASSWORD_HASH_QUEUE_TIMEOUT", 1.0),
+            executor=app.config.get("PASSWORD_HASH_EXECUTOR", "thread"),
+            handle_long_passwords=app.config.get("BCRYPT_HANDLE_LONG_PASSWORDS", False),
+        )
+        app.extensions["password_hasher"] = self
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                cls = ProcessPoolExecutor if self.executor_kind == "process" else ThreadPoolExecutor
+                self._executor = cls(max_workers=self.workers)
+            return self._executor
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        # configure() may swap in a new semaphore while this job runs: release
+        # the one that was acquired.
+        slots = self._slots
+        if not slots.acquire(timeout=self.queue_timeout):
+            raise PasswordHasherBusy()
+        try:
+            return self._pool().submit(fn, *args).result()
+        finally:
+            slots.release()
+
+    def _encode(self, password):
+        if not password:
+            raise ValueError("Password must be non-empty.")
+        password = password.encode("utf-8") if isinstance(password, str) else password
+        if self.handle_long_passwords:
+            password = hashlib.sha256(password).hexdigest().encode("utf-8")
+        return password
+
+    def hash(self, password):
+        return self._run(_hash, self._encode(password), self.rounds)
+
+    def verify(self, password, hashed):
+        if not password or not hashed:
+            return False
+        return self._run(_verify, self._encode(password), hashed.encode("utf-8"))
+
+    def needs_rehash(self, hashed):
+        return cost_of(hashed) != self.rounds
+
+    def verify_and_update(self, password, hashed):
+        """Return (matches, new_hash); new_hash is None unless a rehash was due."""
+        if not self.verify(password, hashed):
+            return False, None
+        if self.needs_rehash(hashed):
+            return True, self.hash(password)
+        return True, None
+
@@ -0,0 +1,60 @@
+"""SQLite engine profile: connection pragmas applied from config.
+
+SQLITE_PRAGMAS maps pragma names to values, e.g.
+
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",     # readers no longer block the writer
+        "synchronous": "NORMAL",   # fsync at checkpoints, safe with WAL
+        "cache_size": -64000,      # page cache in KiB (negative) or pages
+        "mmap_size": 268435456,    # read through a 256 MiB memory map
+        "busy_timeout": 5000,      # wait up to 5 s for a lock, not fail
+        "temp_store": "MEMORY",
+    }
+
+They are issued on every new DBAPI connection, so pooled connections all
+get them. Non-SQLite engines are left alone; pool sizing goes in the usual
+SQLALCHEMY_ENGINE_OPTIONS.
+"""
+
+from sqlalchemy import event
+
+# journal_mode must come first: synchronous=NORMAL is only safe under WAL.
+_ORDER = ("journal_mode",)
+
+
+def _statements(pragmas):
+    names = sorted(pragmas, key=lambda name: (name not in _ORDER, name))
+    for name in names:
+        if not name.replace("_", "").isalnum():
+            raise ValueError(f"invalid pragma name: {name!r}")
+        value = pragmas[name]
+        if not isinstance(value, (int, str)) or (
+            isinstance(value, str) and not value.replace("_", "").isalnum()
+        ):
+            raise ValueError(f"invalid value for pragma {name}: {value!r}")
+        yield f"PRAGMA {name} = {value}"
+
+
+def apply_pragmas(engine, pragmas):
+    """Run the pragmas on each new connection of engine (SQLite only)."""
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+    statements = list(_statements(pragmas))
+    in_memory = engine.url.database in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                if in_memory and "journal_mode" in statement:
+                    continue  # in-memory databases cannot use WAL
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def init_app(app, db):
+    """Apply app.config["SQLITE_PRAGMAS"] to db's engine for app."""
+    with app.app_context():
+        apply_pragmas(db.engine, app.config.get("SQLITE_PRAGMAS"))
@@ -0,0 +1,52 @@
+"""Rebuild the per-place review aggregates (review_count, avg_rating, ...).
+
+Run after importing reviews or editing them outside the API, or to add
+the aggregate columns to a database created before they existed:
+
+    python recompute_ratings.py             # every place
+    python recompute_ratings.py <place_id>  # one place
+    python recompute_ratings.py --hbnb [<place_id>]   # the hbnb app's database
+"""
+
+import sys
+
+
+def recompute_app(place_id=None):
+    from app.app import create_app
+    from app.extensions import db
+    from app.persistence import migrations
+    from app.services.hbnb_facade import HBnBFacade
+
+    app = create_app()
+    with app.app_context():
+        with db.engine.begin() as conn:
+            migrations.upgrade(conn)
+        return HBnBFacade().recompute_place_ratings(place_id)
+
+
+def recompute_hbnb(place_id=None):
+    from app.persistence import migrations
+    from hbnb.app import create_app
+    from hbnb.extensions import db
+    from hbnb.models.place import recompute_ratings
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as conn:
+            migrations.add_missing_columns(conn, db.metadata)
+        return recompute_ratings(place_id)
+
+
+def main(argv):
+    args = argv[1:]
+    recompute = recompute_app
+    if args and args[0] == "--hbnb":
+        recompute = recompute_hbnb
+        args = args[1:]
+    updated = recompute(args[0] if args else None)
+    print(f"Recomputed ratings for {updated} place(s) ✅")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
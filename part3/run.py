@@ -1,7 +1,9 @@
+import os
+
 from app.app import create_app
-from config import DevelopmentConfig
 
-app = create_app()
+# HBNB_ENV=production selects the tuned SQLite profile (see config.py)
+app = create_app(os.environ.get("HBNB_ENV", "default"))
 
 if __name__ == "__main__":
     app.run()
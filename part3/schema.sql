@@ -26,9 +26,19 @@ CREATE TABLE places (
   latitude REAL,
   longitude REAL,
   owner_id TEXT NOT NULL,
+  geo_cell INTEGER,
+  review_count INTEGER NOT NULL DEFAULT 0,
+  rating_count INTEGER NOT NULL DEFAULT 0,
+  rating_sum INTEGER NOT NULL DEFAULT 0,
+  avg_rating REAL NOT NULL DEFAULT 0,
   FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+CREATE INDEX ix_places_price_id ON places (price, id);
+CREATE INDEX ix_places_latitude ON places (latitude);
+CREATE INDEX ix_places_geo_cell ON places (geo_cell);
+CREATE INDEX ix_places_avg_rating_id ON places (avg_rating, id);
+
 CREATE TABLE reviews (
   id TEXT PRIMARY KEY,
   text TEXT NOT NULL,
@@ -39,6 +49,8 @@ CREATE TABLE reviews (
   FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE
 );
 
+CREATE INDEX ix_reviews_place_id_id ON reviews (place_id, id);
+
 CREATE TABLE place_amenity (
   place_id TEXT NOT NULL,
   amenity_id TEXT NOT NULL,
@@ -46,3 +58,5 @@ CREATE TABLE place_amenity (
   FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
   FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
 );
+
+CREATE INDEX ix_place_amenity_amenity_id_place_id ON place_amenity (amenity_id, place_id);
@@ -0,0 +1,32 @@
+"""Test helper: fail when a block of code runs too many SQL statements."""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def assert_max_queries(testcase, engine, maximum):
+    """Assert at most `maximum` statements are executed on engine.
+
+        with assert_max_queries(self, db.engine, 3):
+            self.client.get("/api/v1/places/")
+
+    Yields the list of statements so a test can inspect them; the failure
+    message lists every statement that ran.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    testcase.assertLessEqual(
+        len(statements), maximum,
+        f"{len(statements)} queries executed, expected at most {maximum}:\n"
+        + "\n".join(statements),
+    )
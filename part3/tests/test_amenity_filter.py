@@ -0,0 +1,99 @@
+import unittest
+from unittest import mock
+
+from sqlalchemy import inspect
+
+import app
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestAmenityFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        self.wifi = self.facade.create_amenity(name="Wifi").id
+        self.parking = self.facade.create_amenity(name="Parking").id
+        self.pool = self.facade.create_amenity(name="Pool").id
+        # title -> (price, latitude, amenities)
+        self.places = {}
+        for title, price, lat, amenities in (
+            ("a", 50, 24.1, (self.wifi, self.parking)),
+            ("b", 150, 24.1, (self.wifi, self.parking, self.pool)),
+            ("c", 100, 24.1, (self.wifi,)),
+            ("d", 80, 30.0, (self.wifi, self.parking)),
+            ("e", 60, 24.1, ()),
+        ):
+            place = self.facade.create_place(title=title, price=price, latitude=lat,
+                                             longitude=46.0, owner_id=owner.id)
+            for amenity_id in amenities:
+                self.facade.add_amenity_to_place(place.id, amenity_id)
+            self.places[title] = place.id
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def titles(self, places):
+        return [place.title for place in places]
+
+    def test_places_with_all_amenities(self):
+        both = [self.wifi, self.parking]
+        self.assertEqual(self.titles(self.facade.get_places(amenities=both)),
+                         sorted(["a", "b", "d"], key=lambda t: self.places[t]))
+        self.assertEqual(self.titles(self.facade.get_places(amenities=[self.pool, self.wifi,
+                                                                       self.pool])), ["b"])
+        self.assertEqual(self.facade.get_places(amenities=[self.wifi, "missing"]), [])
+        self.assertEqual(self.facade.count_places(amenities=both), 3)
+
+    def test_dense_results_probe_each_place(self):
+        expected = self.titles(self.facade.get_places(sort="price",
+                                                      amenities=[self.wifi, self.parking]))
+        with mock.patch.object(HBnBFacade, "AMENITY_IDS_MAX", 1):
+            self.assertEqual(self.titles(self.facade.get_places(
+                sort="price", amenities=[self.wifi, self.parking])), expected)
+            self.assertEqual(self.facade.count_places(amenities=[self.wifi]), 4)
+        self.assertEqual(expected, ["a", "d", "b"])
+
+    def test_combines_with_price_rating_and_geo_filters(self):
+        both = [self.wifi, self.parking]
+        self.assertEqual(self.titles(self.facade.get_places(sort="-price", max_price=100,
+                                                            amenities=both)), ["d", "a"])
+        self.assertEqual(self.facade.get_places(min_rating=1, amenities=both), [])
+        near = self.facade.find_places_near(24.1, 46.0, 50, amenities=both)
+        self.assertEqual(sorted(place.title for place, _ in near), ["a", "b"])
+        in_box = self.facade.find_places_in_bbox(24, 45, 25, 47, min_price=100,
+                                                 amenities=both)
+        self.assertEqual([place.title for place, _ in in_box], ["b"])
+
+    def test_endpoint(self):
+        query = f"amenities={self.wifi},{self.parking}&sort=price&limit=2&count=1"
+        response = self.client.get(f"/api/v1/places/?{query}")
+        self.assertEqual([p["title"] for p in response.get_json()], ["a", "d"])
+        self.assertEqual(response.headers["X-Total-Count"], "3")
+        cursor = response.headers["X-Next-Cursor"]
+        response = self.client.get(f"/api/v1/places/?{query}&cursor={cursor}")
+        self.assertEqual([p["title"] for p in response.get_json()], ["b"])
+
+        response = self.client.get(f"/api/v1/places/?amenities={self.pool}"
+                                   "&lat=24.1&lon=46&radius_km=10")
+        self.assertEqual([p["title"] for p in response.get_json()], ["b"])
+        self.assertEqual(len(self.client.get("/api/v1/places/?amenities=").get_json()), 5)
+
+    def test_reverse_index(self):
+        indexes = {i["name"]: i["column_names"]
+                   for i in inspect(db.engine).get_indexes("place_amenity")}
+        self.assertEqual(indexes["ix_place_amenity_amenity_id_place_id"],
+                         ["amenity_id", "place_id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
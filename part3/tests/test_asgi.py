@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import config
+from app.asgi import AsyncReadApp, call
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+from app.app import create_app
+
+
+class TestAsyncReadApp(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        path = os.path.join(self.data_dir, "hbnb.db")
+        config.config["asgi-test"] = type("AsgiTest", (config.TestingConfig,), {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+            "HTTP_CACHE": False,
+        })
+        try:
+            self.flask_app = create_app("asgi-test")
+        finally:
+            del config.config["asgi-test"]
+        self.client = self.flask_app.test_client()
+        facade = HBnBFacade()
+        with self.flask_app.app_context():
+            owner = facade.create_user(email="owner@example.com", password_hash="x")
+            wifi = facade.create_amenity(name="Wifi")
+            pool = facade.create_amenity(name="Pool")
+            self.places = []
+            for i, price in enumerate((120, 80, 200)):
+                place = facade.create_place(title=f"Place {i}", price=price, owner_id=owner.id)
+                self.places.append(place.id)
+            facade.add_amenity_to_place(self.places[0], wifi.id)
+            facade.add_amenity_to_place(self.places[0], pool.id)
+            self.review_id = facade.create_review(text="Great", rating=5, user_id=owner.id,
+                                                  place_id=self.places[0]).id
+        self.app = AsyncReadApp(self.flask_app)
+
+    def tearDown(self):
+        asyncio.run(self.app.engine.dispose())
+        with self.flask_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.data_dir)
+
+    def get(self, path, query_string="", method="GET"):
+        return asyncio.run(call(self.app, path, query_string, method))
+
+    def assert_same_as_wsgi(self, path, query_string=""):
+        status, headers, body = self.get(path, query_string)
+        expected = self.client.get(f"{path}?{query_string}")
+        self.assertEqual(status, expected.status_code)
+        self.assertEqual(json.loads(body), expected.get_json())
+        return headers
+
+    def test_lists_match_wsgi(self):
+        self.assert_same_as_wsgi("/api/v1/places/", "sort=-price&max_price=150")
+        self.assert_same_as_wsgi("/api/v1/reviews/", f"place_id={self.places[0]}")
+        self.assert_same_as_wsgi("/api/v1/amenities/")
+
+    def test_items_match_wsgi(self):
+        self.assert_same_as_wsgi(f"/api/v1/places/{self.places[0]}")
+        self.assert_same_as_wsgi(f"/api/v1/places/{self.places[1]}")  # no amenities
+        self.assert_same_as_wsgi(f"/api/v1/reviews/{self.review_id}")
+        status, _, body = self.get("/api/v1/places/missing")
+        self.assertEqual((status, json.loads(body)), (404, {"message": "Place not found"}))
+
+    def test_cursor_pages_through_places(self):
+        seen = []
+        query = "sort=price&limit=2&count=1"
+        while True:
+            status, headers, body = self.get("/api/v1/places/", query)
+            self.assertEqual(status, 200)
+            self.assertEqual(headers["x-total-count"], "3")
+            seen += [p["price"] for p in json.loads(body)]
+            if "x-next-cursor" not in headers:
+                break
+            query = f"sort=price&limit=2&count=1&cursor={headers['x-next-cursor']}"
+        self.assertEqual(seen, [80, 120, 200])
+
+    def test_errors(self):
+        self.assertEqual(self.get("/api/v1/places/", "sort=name")[0], 400)
+        self.assertEqual(self.get("/api/v1/places/", "cursor=!!")[0], 400)
+        self.assertEqual(self.get("/api/v1/places/", "bbox=0,0,1,1")[0], 400)
+        self.assertEqual(self.get("/api/v1/places/", "amenities=a,b")[0], 400)
+        self.assertEqual(self.get("/api/v1/users/")[0], 404)
+        status, headers, _ = self.get("/api/v1/places/", method="POST")
+        self.assertEqual(status, 405)
+        self.assertEqual(headers["allow"], "GET, HEAD")
+
+    def test_sees_writes_made_through_wsgi_app(self):
+        with self.flask_app.app_context():
+            HBnBFacade().update_place(self.places[1], price=90)
+        _, _, body = self.get(f"/api/v1/places/{self.places[1]}")
+        self.assertEqual(json.loads(body)["price"], 90)
+
+    def test_concurrent_requests(self):
+        async def many():
+            return await asyncio.gather(*(call(self.app, "/api/v1/places/") for _ in range(50)))
+        results = asyncio.run(many())
+        self.assertEqual({status for status, _, _ in results}, {200})
+        self.assertEqual(len({body for _, _, body in results}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
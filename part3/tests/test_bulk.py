@@ -0,0 +1,119 @@
+import unittest
+
+from flask_jwt_extended import create_access_token
+
+import app
+from app.extensions import db
+from app.models.place import Place
+from app.services.hbnb_facade import BulkValidationError, HBnBFacade
+from query_counter import assert_max_queries
+
+create_app = app.create_app
+
+
+class TestBulkCreate(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        self.owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        self.guest = self.facade.create_user(email="guest@example.com", password_hash="x")
+        self.headers = {"Authorization": "Bearer " + create_access_token(identity=self.owner.id)}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_places_in_one_statement(self):
+        items = [{"title": f"Place {i}", "price": 10 + i, "latitude": 24.7, "longitude": 46.7}
+                 for i in range(200)]
+        with assert_max_queries(self, db.engine, 3):
+            rows = self.facade.bulk_create_places(items, owner_id=self.owner.id)
+        self.assertEqual([r["title"] for r in rows], [i["title"] for i in items])
+        self.assertEqual(Place.query.count(), 200)
+        place = db.session.get(Place, rows[0]["id"])
+        self.assertEqual(place.owner_id, self.owner.id)
+        # geo_cell is filled in even though mapper events do not run
+        self.assertEqual(len(self.facade.find_places_near(24.7, 46.7, 1)), 200)
+
+    def test_invalid_batch_writes_nothing(self):
+        items = [
+            {"title": "ok", "price": 10},
+            {"title": "", "price": 10},
+            {"title": "x", "price": -1},
+            {"title": "y", "price": 5, "owner_id": "nobody"},
+        ]
+        with self.assertRaises(BulkValidationError) as ctx:
+            self.facade.bulk_create_places(items, owner_id=self.owner.id)
+        self.assertEqual([e["index"] for e in ctx.exception.errors], [1, 2, 3])
+        self.assertEqual(Place.query.count(), 0)
+
+    def test_reviews_update_aggregates_once_per_place(self):
+        place = self.facade.create_place(title="Loft", price=80, owner_id=self.owner.id)
+        items = [{"text": "ok", "rating": r, "place_id": place.id} for r in (5, 4, 3)]
+        items.append({"text": "no rating", "place_id": place.id})
+        rows = self.facade.bulk_create_reviews(items, user_id=self.guest.id)
+        self.assertEqual(len(rows), 4)
+        db.session.refresh(place)
+        self.assertEqual(place.review_count, 4)
+        self.assertAlmostEqual(place.avg_rating, 4.0)
+
+    def test_places_endpoint(self):
+        response = self.client.post("/api/v1/places/bulk", headers=self.headers,
+                                    json=[{"title": "A", "price": 1}, {"title": "B", "price": 2}])
+        self.assertEqual(response.status_code, 201)
+        body = response.get_json()
+        self.assertEqual([p["title"] for p in body], ["A", "B"])
+        self.assertEqual(body[0]["owner_id"], self.owner.id)
+        self.assertEqual(body[0]["review_count"], 0)
+
+        response = self.client.post("/api/v1/places/bulk", headers=self.headers,
+                                    json=[{"title": "C", "price": "cheap"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["errors"],
+                         [{"index": 0, "error": "price must be a number"}])
+
+    def test_endpoint_limits(self):
+        self.app.config["BULK_MAX_ITEMS"] = 2
+        response = self.client.post("/api/v1/amenities/bulk", json=[{"name": "a"}] * 3)
+        self.assertEqual(response.status_code, 413)
+        response = self.client.post("/api/v1/amenities/bulk", json={"name": "a"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/api/v1/amenities/bulk", json=[{"name": "Wi-Fi"}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.facade.count_amenities(), 1)
+
+    def test_only_admins_create_for_another_user(self):
+        place = self.facade.create_place(title="Loft", price=80, owner_id=self.owner.id)
+        items = [{"title": "A", "price": 1, "owner_id": self.owner.id},
+                 {"title": "B", "price": 1, "owner_id": self.guest.id}]
+        response = self.client.post("/api/v1/places/bulk", headers=self.headers, json=items)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual([e["index"] for e in response.get_json()["errors"]], [1])
+        reviews = [{"text": "mine", "rating": 5, "place_id": place.id,
+                    "user_id": self.guest.id}]
+        response = self.client.post("/api/v1/reviews/bulk", headers=self.headers, json=reviews)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Place.query.count(), 1)
+        self.assertEqual(self.facade.count_reviews(), 0)
+
+        admin = {"Authorization": "Bearer " + create_access_token(
+            identity=self.owner.id, additional_claims={"is_admin": True})}
+        response = self.client.post("/api/v1/places/bulk", headers=admin, json=items)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()[1]["owner_id"], self.guest.id)
+        response = self.client.post("/api/v1/reviews/bulk", headers=admin, json=reviews)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()[0]["user_id"], self.guest.id)
+
+    def test_reviews_endpoint_requires_token(self):
+        response = self.client.post("/api/v1/reviews/bulk", json=[{"text": "x"}])
+        self.assertEqual(response.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
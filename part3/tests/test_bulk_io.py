@@ -0,0 +1,135 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+
+import app
+from app.extensions import db
+from app.models.place import Place
+from app.models.review import Review
+from app.services import bulk_io
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestBulkImportExport(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.data_dir = tempfile.mkdtemp()
+        self.facade = HBnBFacade()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        shutil.rmtree(self.data_dir)
+
+    def seed(self):
+        owner = self.facade.create_user(email="owner@example.com", password_hash="x",
+                                        is_admin=True)
+        wifi = self.facade.create_amenity(name="Wifi")
+        place = self.facade.create_place(title="Loft", description="Bright, \"quiet\"\nflat",
+                                         price=80.5, latitude=48.85, longitude=2.35,
+                                         owner_id=owner.id)
+        self.facade.add_amenity_to_place(place.id, wifi.id)
+        for rating in (4, 5, None):
+            self.facade.create_review(text="Nice", rating=rating, user_id=owner.id,
+                                      place_id=place.id)
+        return place.id
+
+    def write(self, name, lines):
+        path = os.path.join(self.data_dir, name)
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(lines) + "\n")
+        return path
+
+    def round_trip(self, fmt):
+        place_id = self.seed()
+        before = self.facade.get_place(place_id).to_dict()
+        counts = bulk_io.export_dump(self.data_dir, fmt)
+        self.assertEqual(counts, {"users": 1, "amenities": 1, "places": 1,
+                                  "reviews": 3, "place_amenity": 1})
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+
+        self.assertEqual(bulk_io.import_dump(self.data_dir), counts)
+        place = db.session.get(Place, place_id)
+        self.assertEqual(place.to_dict(), before)
+        self.assertEqual(place.rating_count, 2)
+        self.assertIsNotNone(place.geo_cell)
+        self.assertEqual([a.name for a in place.amenities], ["Wifi"])
+        self.assertTrue(place.owner.is_admin)
+        # The full-text index is rebuilt after the import.
+        self.assertEqual([p.id for p, _, _ in self.facade.search_places("quiet")],
+                         [place_id])
+
+    def test_csv_round_trip(self):
+        self.round_trip("csv")
+
+    def test_ndjson_round_trip(self):
+        self.round_trip("ndjson")
+
+    def test_indexes_are_rebuilt(self):
+        indexes = {i["name"] for i in inspect(db.engine).get_indexes("places")}
+        path = self.write("places.ndjson", [])
+        bulk_io.import_table("places", path)
+        self.assertEqual({i["name"] for i in inspect(db.engine).get_indexes("places")}, indexes)
+
+    def test_missing_ids_are_generated(self):
+        path = self.write("amenities.csv", ["name", "Pool", "Sauna"])
+        self.assertEqual(bulk_io.import_table("amenities", path), 2)
+        self.assertEqual(len({a.id for a in self.facade.get_amenities()}), 2)
+
+    def test_failed_import_resumes_after_last_commit(self):
+        owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        place = self.facade.create_place(title="Loft", price=80, owner_id=owner.id)
+        rows = [json.dumps({"id": f"r{i}", "text": "ok", "rating": 3,
+                            "user_id": owner.id, "place_id": place.id}) for i in range(10)]
+        rows[7] = rows[7].replace('"rating": 3', '"rating": "bad"')
+        path = self.write("reviews.ndjson", rows)
+
+        with self.assertRaises(ValueError):
+            bulk_io.import_table("reviews", path, chunk_rows=2, transaction_rows=4)
+        db.session.remove()
+        self.assertEqual(Review.query.count(), 4)
+        # The committed rows keep their indexes and search triggers.
+        self.assertIn("ix_reviews_place_id_id",
+                      {i["name"] for i in inspect(db.engine).get_indexes("reviews")})
+        self.facade.update_review("r0", text="Sunny")
+        self.assertEqual([p.id for p, _, _ in self.facade.search_places("sunny")], [place.id])
+
+        rows[7] = rows[7].replace('"rating": "bad"', '"rating": 3')
+        self.write("reviews.ndjson", rows)
+        self.assertEqual(bulk_io.import_table("reviews", path, chunk_rows=2,
+                                              transaction_rows=4), 6)
+        self.assertEqual(sorted(r.id for r in Review.query), [f"r{i}" for i in range(10)])
+        self.assertIn("ix_reviews_place_id_id",
+                      {i["name"] for i in inspect(db.engine).get_indexes("reviews")})
+        # A finished import leaves no checkpoint: importing again starts over.
+        with self.assertRaises(IntegrityError):
+            bulk_io.import_table("reviews", path)
+
+    def test_short_csv_row_names_its_line(self):
+        path = self.write("amenities.csv", ["id,name", "a1,Pool", "a2"])
+        with self.assertRaisesRegex(ValueError, r"amenities\.csv:3: expected 2 columns"):
+            bulk_io.import_table("amenities", path)
+        self.assertEqual(self.facade.get_amenities(), [])
+
+    def test_rejects_unknown_table_and_format(self):
+        with self.assertRaises(ValueError):
+            bulk_io.import_table("secrets", self.write("secrets.csv", ["id"]))
+        with self.assertRaises(ValueError):
+            bulk_io.export_table("users", os.path.join(self.data_dir, "users.xml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
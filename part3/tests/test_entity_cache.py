@@ -0,0 +1,125 @@
+import unittest
+from unittest import mock
+
+import app
+import config
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.services.entity_cache import EntityCache, entity_cache
+from app.services.hbnb_facade import HBnBFacade
+from query_counter import assert_max_queries
+
+create_app = app.create_app
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def test_lru_bound_and_stats(self):
+        cache = EntityCache(max_entries=2, ttl=60)
+        for i in range(3):
+            cache.put("place", i, {"id": i}, cache.token("place"))
+        self.assertIsNone(cache.get("place", 0))
+        self.assertEqual(cache.get("place", 2), {"id": 2})
+        self.assertEqual(cache.stats()["place"],
+                         {"hits": 1, "misses": 1, "evictions": 1, "size": 2})
+
+    def test_ttl_and_policies(self):
+        cache = EntityCache(ttl=10, policies={"amenity": {"ttl": 100}, "user": {"max_entries": 0}})
+        with mock.patch("app.services.entity_cache.time.monotonic", return_value=0):
+            cache.put("place", "p", {}, cache.token("place"))
+            cache.put("amenity", "a", {}, cache.token("amenity"))
+            cache.put("user", "u", {}, cache.token("user"))
+        with mock.patch("app.services.entity_cache.time.monotonic", return_value=50):
+            self.assertIsNone(cache.get("place", "p"))
+            self.assertEqual(cache.get("amenity", "a"), {})
+            self.assertIsNone(cache.get("user", "u"))
+
+    def test_put_after_invalidation_is_dropped(self):
+        cache = EntityCache()
+        token = cache.token("place")
+        cache.invalidate("place", "p")
+        cache.put("place", "p", {"price": 1}, token)
+        self.assertIsNone(cache.get("place", "p"))
+
+
+class TestFacadeEntityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        owner = User(email="owner@example.com", password_hash="x")
+        db.session.add(owner)
+        db.session.commit()
+        self.place = self.facade.create_place(title="Loft", price=80, owner_id=owner.id)
+        self.place_id = self.place.id
+        db.session.remove()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_second_session_is_served_from_cache(self):
+        self.facade.get_place(self.place_id)
+        db.session.remove()
+        with assert_max_queries(self, db.engine, 0):
+            place = self.facade.get_place(self.place_id)
+            self.assertEqual(place.title, "Loft")
+        self.assertEqual(entity_cache.stats()["place"]["hits"], 1)
+        # The rebuilt instance is a normal persistent object.
+        self.assertEqual(place.owner.email, "owner@example.com")
+
+    def test_update_invalidates(self):
+        self.facade.get_place(self.place_id)
+        db.session.remove()
+        self.facade.update_place(self.place_id, price=120)
+        db.session.remove()
+        self.assertEqual(self.facade.get_place(self.place_id).price, 120)
+
+    def test_review_write_invalidates_place_aggregates(self):
+        self.facade.get_place(self.place_id)
+        db.session.remove()
+        user = self.facade.create_user(email="guest@example.com", password_hash="x")
+        self.facade.create_review(text="ok", rating=4, user_id=user.id, place_id=self.place_id)
+        db.session.remove()
+        self.assertEqual(self.facade.get_place(self.place_id).review_count, 1)
+
+    def test_delete_invalidates(self):
+        amenity = self.facade.create_amenity(name="Wi-Fi")
+        amenity_id = amenity.id
+        db.session.remove()
+        self.facade.get_amenity(amenity_id)
+        self.facade.delete_amenity(amenity_id)
+        db.session.remove()
+        self.assertIsNone(self.facade.get_amenity(amenity_id))
+
+
+class TestDefaultConfig(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(config.DevelopmentConfig, "SQLALCHEMY_DATABASE_URI", "sqlite://"):
+            self.app = create_app("default")
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_cache_is_off_and_writes_around_the_facade_are_seen(self):
+        self.assertNotIn("entity_cache", self.app.extensions)
+        amenity_id = self.facade.create_amenity(name="Wifi").id
+        self.assertEqual(self.facade.get_amenity(amenity_id).name, "Wifi")
+        db.session.execute(Amenity.__table__.update().values(name="Wi-Fi"))
+        db.session.commit()
+        db.session.remove()
+        self.assertEqual(self.facade.get_amenity(amenity_id).name, "Wi-Fi")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+import app
+from app.extensions import db
+from app.models.geo import bbox_around, cell_for, cell_ranges, haversine_km
+from app.models.place import Place
+from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+CITIES = {
+    "riyadh": (24.7136, 46.6753),
+    "diriyah": (24.7343, 46.5753),
+    "jeddah": (21.4858, 39.1925),
+    "dubai": (25.2048, 55.2708),
+    "suva": (-18.1248, 178.4501),
+    "apia": (-13.8333, -171.7500),
+}
+
+
+class TestGeoHelpers(unittest.TestCase):
+
+    def test_haversine(self):
+        km = haversine_km(*CITIES["riyadh"], *CITIES["jeddah"])
+        self.assertAlmostEqual(km, 848, delta=5)
+
+    def test_cells_cover_bbox(self):
+        lat, lon = CITIES["dubai"]
+        cell = cell_for(lat, lon)
+        ranges = cell_ranges(lat - 1, lon - 1, lat + 1, lon + 1)
+        self.assertTrue(any(lo <= cell <= hi for lo, hi in ranges))
+
+    def test_bbox_around_wraps_antimeridian(self):
+        min_lat, min_lon, max_lat, max_lon = bbox_around(-16.0, 179.5, 300)
+        self.assertGreater(min_lon, max_lon)
+
+
+class TestSpatialSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        owner = User(email="owner@example.com")
+        owner.set_password("secret")
+        db.session.add(owner)
+        for name, (lat, lon) in CITIES.items():
+            db.session.add(Place(title=name, price=100.0, latitude=lat,
+                                 longitude=lon, owner=owner))
+        db.session.commit()
+        self.facade = HBnBFacade()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def titles(self, results):
+        return [place.title for place, _ in results]
+
+    def test_radius_search_sorted_by_distance(self):
+        results = self.facade.find_places_near(*CITIES["riyadh"], radius_km=50)
+        self.assertEqual(self.titles(results), ["riyadh", "diriyah"])
+        self.assertEqual(results[0][1], 0.0)
+
+    def test_geo_cell_follows_updates(self):
+        place = Place.query.filter_by(title="jeddah").one()
+        place.latitude, place.longitude = CITIES["riyadh"]
+        db.session.commit()
+        results = self.facade.find_places_near(*CITIES["riyadh"], radius_km=1)
+        self.assertEqual(sorted(self.titles(results)), ["jeddah", "riyadh"])
+
+    def test_bbox_across_antimeridian(self):
+        results = self.facade.find_places_in_bbox(-20.0, 170.0, -10.0, -170.0)
+        self.assertEqual(sorted(self.titles(results)), ["apia", "suva"])
+
+    def test_api_radius_and_bbox(self):
+        response = self.client.get("/api/v1/places/?lat=24.7136&lon=46.6753&radius_km=1000&limit=2")
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual([p["title"] for p in body], ["riyadh", "diriyah"])
+        self.assertIn("distance_km", body[0])
+
+        response = self.client.get("/api/v1/places/?bbox=39,20,47,25")
+        self.assertEqual(sorted(p["title"] for p in response.get_json()),
+                         ["diriyah", "jeddah", "riyadh"])
+
+    def test_api_rejects_bad_parameters(self):
+        self.assertEqual(self.client.get("/api/v1/places/?radius_km=5").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/places/?bbox=1,2,3").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/places/?bbox=0,95,1,96").status_code, 400)
+        for limit in (0, -1):
+            response = self.client.get(f"/api/v1/places/?bbox=39,20,47,25&limit={limit}")
+            self.assertEqual(response.status_code, 400, limit)
+        with self.assertRaises(ValueError):
+            self.facade.find_places_near(*CITIES["riyadh"], radius_km=50, limit=-1)
+
+    def test_api_limit_defaults_to_page_size_and_is_capped(self):
+        self.app.config.update(API_PAGE_SIZE=2, API_MAX_PAGE_SIZE=3)
+        response = self.client.get("/api/v1/places/?lat=24.7136&lon=46.6753&radius_km=20000")
+        self.assertEqual(len(response.get_json()), 2)
+        response = self.client.get("/api/v1/places/?lat=24.7136&lon=46.6753"
+                                   "&radius_km=20000&limit=50")
+        self.assertEqual(len(response.get_json()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
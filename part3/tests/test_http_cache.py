@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+
+from sqlalchemy import text
+
+import app
+import config
+from app.extensions import db
+from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        self.owner = User(email="owner@example.com", password_hash="x")
+        db.session.add(self.owner)
+        db.session.commit()
+        self.place = self.facade.create_place(title="Loft", price=80, owner_id=self.owner.id)
+        self.facade.create_amenity(name="Wi-Fi")
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_not_modified_skips_database(self):
+        first = self.client.get("/api/v1/places/")
+        etag = first.headers["ETag"]
+        self.assertEqual(first.headers["Cache-Control"], "no-cache")
+
+        second = self.client.get("/api/v1/places/", headers={"If-None-Match": etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+        self.assertEqual(second.headers["ETag"], etag)
+        self.assertEqual(second.headers["X-DB-Queries"], "0")
+
+    def test_cached_body_served_from_memory(self):
+        first = self.client.get("/api/v1/amenities/?count=1")
+        again = self.client.get("/api/v1/amenities/?count=1")
+        self.assertEqual(again.get_json(), first.get_json())
+        self.assertEqual(again.headers["X-Total-Count"], "1")
+        self.assertEqual(again.headers["X-DB-Queries"], "0")
+        self.assertNotEqual(
+            self.client.get("/api/v1/amenities/").headers["ETag"], first.headers["ETag"]
+        )
+
+    def test_writes_change_etag(self):
+        etag = self.client.get("/api/v1/places/").headers["ETag"]
+        self.facade.update_place(self.place.id, price=95)
+        response = self.client.get("/api/v1/places/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.get_json()[0]["price"], 95)
+
+    def test_dependent_collections(self):
+        places = self.client.get("/api/v1/places/").headers["ETag"]
+        amenities = self.client.get("/api/v1/amenities/").headers["ETag"]
+        reviews = self.client.get("/api/v1/reviews/").headers["ETag"]
+
+        self.facade.create_review(text="Nice", rating=5, user_id=self.owner.id,
+                                  place_id=self.place.id)
+
+        self.assertEqual(self.client.get("/api/v1/amenities/",
+                                         headers={"If-None-Match": amenities}).status_code, 304)
+        self.assertEqual(self.client.get("/api/v1/reviews/",
+                                         headers={"If-None-Match": reviews}).status_code, 200)
+        response = self.client.get("/api/v1/places/", headers={"If-None-Match": places})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()[0]["review_count"], 1)
+
+    def test_lru_is_bounded(self):
+        cache = self.app.extensions["http_cache"]
+        cache.max_entries = 2
+        for limit in (1, 2, 3):
+            self.client.get(f"/api/v1/amenities/?limit={limit}")
+        self.assertEqual(len(cache), 2)
+
+
+class TestDefaultConfig(unittest.TestCase):
+    """The default config leaves the cache off: other processes (the hbnb
+    app, create_db.py import) write to the same database."""
+
+    def setUp(self):
+        with mock.patch.object(config.DevelopmentConfig, "SQLALCHEMY_DATABASE_URI", "sqlite://"):
+            self.app = create_app("default")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_writes_around_the_facade_are_seen(self):
+        self.assertNotIn("http_cache", self.app.extensions)
+        first = self.client.get("/api/v1/amenities/")
+        self.assertNotIn("ETag", first.headers)
+        db.session.execute(text("INSERT INTO amenities (id, name) VALUES ('a1', 'Sauna')"))
+        db.session.commit()
+        second = self.client.get("/api/v1/amenities/")
+        self.assertEqual([a["name"] for a in second.get_json()], ["Sauna"])
+
+
+if __name__ == "__main__":
+    unittest.main()
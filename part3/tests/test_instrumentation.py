@@ -0,0 +1,64 @@
+import unittest
+
+import app
+from app.extensions import db
+from app.models.place import Place
+from app.models.user import User
+
+create_app = app.create_app
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        owner = User(email="owner@example.com", password_hash="x")
+        db.session.add(Place(title="Loft", price=80, owner=owner))
+        db.session.commit()
+        db.session.remove()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_headers_report_queries(self):
+        response = self.client.get("/api/v1/places/")
+        self.assertEqual(response.status_code, 200)
+        count = int(response.headers["X-DB-Queries"])
+        self.assertGreaterEqual(count, 1)
+        timing = response.headers["Server-Timing"]
+        self.assertIn(f'desc="{count} queries"', timing)
+        self.assertIn("app;dur=", timing)
+        self.assertIn("X-DB-Queries", response.headers["Access-Control-Expose-Headers"])
+
+    def test_aggregator_collects_per_endpoint(self):
+        stats = self.app.extensions["sql_stats"]
+        stats.reset()
+        for _ in range(3):
+            self.client.get("/api/v1/places/")
+        summary = stats.snapshot()
+        entry = next(v for k, v in summary.items() if k and "place" in k.lower())
+        self.assertEqual(entry["requests"], 3)
+        self.assertGreaterEqual(entry["queries"], 3)
+        self.assertIn("SELECT", entry["slowest_statement"])
+        self.assertAlmostEqual(entry["avg_queries"], entry["queries"] / 3)
+
+    def test_can_be_disabled(self):
+        from config import TestingConfig
+        TestingConfig.SQL_INSTRUMENTATION = False
+        try:
+            other = create_app("testing")
+        finally:
+            TestingConfig.SQL_INSTRUMENTATION = True
+        self.assertNotIn("sql_stats", other.extensions)
+        with other.app_context():
+            response = other.test_client().get("/api/v1/places/")
+            self.assertNotIn("X-DB-Queries", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
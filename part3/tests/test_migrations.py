@@ -0,0 +1,71 @@
+import unittest
+
+from sqlalchemy import inspect, text
+
+import app
+from app.extensions import db
+from app.models.geo import cell_for
+from app.persistence import migrations
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestSchemaUpgrade(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        self.place_id = self.facade.create_place(title="Loft", price=80, latitude=48.85,
+                                                 longitude=2.35, owner_id=owner.id).id
+        self.facade.create_place(title="Nowhere", price=10, owner_id=owner.id)
+        db.session.remove()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def drop_column(self, table, column, indexes=()):
+        with db.engine.begin() as conn:
+            for index in indexes:
+                conn.exec_driver_sql(f"DROP INDEX {index}")
+            conn.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {column}")
+
+    def test_adds_and_backfills_geo_cell(self):
+        self.drop_column("places", "geo_cell", ["ix_places_geo_cell"])
+        with db.engine.begin() as conn:
+            self.assertEqual(migrations.upgrade(conn), {"places": ["geo_cell"]})
+        indexes = {i["name"] for i in inspect(db.engine).get_indexes("places")}
+        self.assertIn("ix_places_geo_cell", indexes)
+        cells = dict(db.session.execute(text("SELECT title, geo_cell FROM places")).all())
+        self.assertEqual(cells, {"Loft": cell_for(48.85, 2.35), "Nowhere": None})
+        self.assertEqual(len(self.facade.find_places_near(48.85, 2.35, 1)), 1)
+
+    def test_adds_and_backfills_rating_aggregates(self):
+        guest = self.facade.create_user(email="guest@example.com", password_hash="x")
+        for rating in (4, 5, None):
+            self.facade.create_review(text="ok", rating=rating, user_id=guest.id,
+                                      place_id=self.place_id)
+        db.session.remove()
+        self.drop_column("places", "avg_rating", ["ix_places_avg_rating_id"])
+        for column in ("review_count", "rating_count", "rating_sum"):
+            self.drop_column("places", column)
+        with db.engine.begin() as conn:
+            self.assertEqual(sorted(migrations.upgrade(conn)["places"]),
+                             ["avg_rating", "rating_count", "rating_sum", "review_count"])
+        place = self.facade.get_place(self.place_id)
+        self.assertEqual((place.review_count, place.rating_count), (3, 2))
+        self.assertAlmostEqual(place.avg_rating, 4.5)
+        self.assertEqual(self.facade.get_places(sort="-rating")[0].id, self.place_id)
+
+    def test_up_to_date_database_is_left_alone(self):
+        with db.engine.begin() as conn:
+            self.assertEqual(migrations.upgrade(conn), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+import app
+from app.api.v1.pagination import encode_cursor
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+
+create_app = app.create_app
+
+
+class TestKeysetPagination(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            for i in range(7):
+                db.session.add(Amenity(name=f"amenity-{i}"))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_walks_every_row_once(self):
+        seen, cursor, pages = [], None, 0
+        while True:
+            url = "/api/v1/amenities/?limit=3" + (f"&cursor={cursor}" if cursor else "")
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen += [a["id"] for a in response.get_json()]
+            pages += 1
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            self.assertIn('rel="next"', response.headers["Link"])
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(seen, sorted(seen))
+
+    def test_total_count_is_opt_in(self):
+        response = self.client.get("/api/v1/amenities/?limit=2")
+        self.assertNotIn("X-Total-Count", response.headers)
+        response = self.client.get("/api/v1/amenities/?limit=2&count=1")
+        self.assertEqual(response.headers["X-Total-Count"], "7")
+
+    def test_bad_cursor_and_limit(self):
+        self.assertEqual(self.client.get("/api/v1/places/?cursor=%%%").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/reviews/?limit=0").status_code, 400)
+
+    def test_cursor_values_must_be_sort_key_scalars(self):
+        for values in ([{"a": 1}], [[1]], [True], ["a", "b"]):
+            for path in ("/api/v1/amenities/", "/api/v1/places/"):
+                response = self.client.get(f"{path}?cursor={encode_cursor(values)}")
+                self.assertEqual(response.status_code, 400, (path, values))
+                self.assertIn("invalid cursor", response.get_json()["message"])
+        self.assertEqual(self.client.get("/api/v1/places/?stream=1&cursor="
+                                         + encode_cursor([{"a": 1}])).status_code, 400)
+        self.assertEqual(self.client.get(f"/api/v1/amenities/?cursor={encode_cursor(['z'])}")
+                         .status_code, 200)
+
+    def test_other_list_endpoints_paginate(self):
+        for path in ("/api/v1/users/", "/api/v1/places/", "/api/v1/reviews/"):
+            response = self.client.get(path + "?limit=5&count=1")
+            self.assertEqual(response.status_code, 200, path)
+            self.assertEqual(response.get_json(), [])
+            self.assertEqual(response.headers["X-Total-Count"], "0")
+
+
+class TestPriceFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(email="owner@example.com", password_hash="x")
+            db.session.add(owner)
+            for price in (30, 80, 80, 120, 45, 200, 60):
+                db.session.add(Place(title=f"p{price}", price=price, owner=owner))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def prices(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [p["price"] for p in response.get_json()], response.headers
+
+    def test_range_filter_and_count(self):
+        prices, headers = self.prices("/api/v1/places/?min_price=45&max_price=100&sort=price&count=1")
+        self.assertEqual(prices, [45, 60, 80, 80])
+        self.assertEqual(headers["X-Total-Count"], "4")
+
+    def test_price_sorted_pages_with_ties(self):
+        collected, cursor = [], None
+        while True:
+            url = "/api/v1/places/?sort=-price&limit=2&max_price=150"
+            prices, headers = self.prices(url + (f"&cursor={cursor}" if cursor else ""))
+            collected += prices
+            cursor = headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        self.assertEqual(collected, [120, 80, 80, 60, 45, 30])
+
+    def test_invalid_filters(self):
+        self.assertEqual(self.client.get("/api/v1/places/?sort=title").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/places/?max_price=cheap").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/places/?min_price=10&max_price=5").status_code, 400)
+        # a cursor from another sort order does not match the key
+        first = self.client.get("/api/v1/places/?limit=1")
+        cursor = first.headers["X-Next-Cursor"]
+        self.assertEqual(self.client.get(f"/api/v1/places/?sort=price&cursor={cursor}").status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import threading
+import unittest
+from unittest import mock
+
+import bcrypt
+
+import app
+from app.extensions import db, password_hasher
+from app.models.user import User
+from hbnb_common.password_hasher import PasswordHasher, PasswordHasherBusy, calibrate, cost_of
+
+create_app = app.create_app
+
+
+class TestPasswordHasher(unittest.TestCase):
+
+    def test_hash_and_verify(self):
+        hasher = PasswordHasher(rounds=4, workers=2)
+        try:
+            hashed = hasher.hash("s3cret")
+            self.assertEqual(cost_of(hashed), 4)
+            self.assertTrue(hasher.verify("s3cret", hashed))
+            self.assertFalse(hasher.verify("wrong", hashed))
+            self.assertFalse(hasher.verify("s3cret", "not-a-hash"))
+        finally:
+            hasher.shutdown()
+
+    def test_inline_mode(self):
+        hasher = PasswordHasher(rounds=4, workers=0)
+        self.assertTrue(hasher.verify("pw", hasher.hash("pw")))
+        self.assertIsNone(hasher._executor)
+
+    def test_rehash_when_cost_changes(self):
+        hasher = PasswordHasher(rounds=5, workers=0)
+        old = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=4)).decode()
+        self.assertTrue(hasher.needs_rehash(old))
+        ok, new = hasher.verify_and_update("pw", old)
+        self.assertTrue(ok)
+        self.assertEqual(cost_of(new), 5)
+        self.assertEqual(hasher.verify_and_update("pw", new), (True, None))
+        self.assertEqual(hasher.verify_and_update("bad", old), (False, None))
+
+    def test_busy_when_queue_is_full(self):
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=0, queue_timeout=0.01)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=hasher._run, args=(block,))
+        worker.start()
+        started.wait(5)
+        try:
+            with self.assertRaises(PasswordHasherBusy):
+                hasher.hash("pw")
+        finally:
+            release.set()
+            worker.join()
+            hasher.shutdown()
+
+    def test_reconfigure_while_a_job_runs(self):
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=0, queue_timeout=0.01)
+        release = threading.Event()
+        started = threading.Event()
+        errors = []
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        def job():
+            try:
+                hasher._run(block)
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=job)
+        worker.start()
+        started.wait(5)
+        # Swap the semaphore while the job holds a slot (shutdown() would
+        # otherwise wait for the job first).
+        with mock.patch.object(hasher, "shutdown"):
+            hasher.configure(rounds=4, workers=1, max_pending=0, queue_timeout=0.01)
+        release.set()
+        worker.join()
+        try:
+            self.assertEqual(errors, [])
+            # The new semaphore still has its one slot, and only one.
+            self.assertTrue(hasher._slots.acquire(blocking=False))
+            self.assertFalse(hasher._slots.acquire(blocking=False))
+            hasher._slots.release()
+        finally:
+            hasher.shutdown()
+
+    def test_calibrate_stays_in_bounds(self):
+        self.assertEqual(calibrate(target_ms=0.0001, min_rounds=6), 6)
+        self.assertLessEqual(calibrate(target_ms=10 ** 9), 16)
+
+
+class TestLogin(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        user = User(email="a@example.com")
+        # Stored with an older cost than the configured one (4).
+        user.password_hash = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode()
+        db.session.add(user)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_login_upgrades_hash(self):
+        response = self.client.post("/api/v1/login", json={"email": "a@example.com",
+                                                           "password": "pw"})
+        self.assertEqual(response.status_code, 200)
+        db.session.expire_all()
+        self.assertEqual(cost_of(User.query.first().password_hash), 4)
+        response = self.client.post("/api/v1/login", json={"email": "a@example.com",
+                                                           "password": "nope"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_login_returns_503_when_busy(self):
+        password_hasher.configure(rounds=4, workers=1, max_pending=0, queue_timeout=0)
+        password_hasher._slots.acquire()
+        try:
+            response = self.client.post("/api/v1/login", json={"email": "a@example.com",
+                                                               "password": "pw"})
+        finally:
+            password_hasher._slots.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+import app
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from query_counter import assert_max_queries
+
+create_app = app.create_app
+
+
+class TestPlaceQueryCounts(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        owner = User(email="owner@example.com", password_hash="x")
+        guest = User(email="guest@example.com", password_hash="x")
+        wifi, pool = Amenity(name="Wi-Fi"), Amenity(name="Pool")
+        db.session.add_all([owner, guest, wifi, pool])
+        for i in range(25):
+            place = Place(title=f"Place {i}", price=50 + i, latitude=24.0 + i / 100,
+                          longitude=46.0, owner=owner, amenities=[wifi, pool])
+            db.session.add(place)
+            db.session.add(Review(text="Nice", rating=4, user=guest, place=place))
+        db.session.commit()
+        self.place_id = place.id
+        db.session.remove()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_list_does_not_query_per_place(self):
+        with assert_max_queries(self, db.engine, 3):
+            response = self.client.get("/api/v1/places/")
+        body = response.get_json()
+        self.assertEqual(len(body), 25)
+        self.assertEqual(len(body[0]["amenities"]), 2)
+        self.assertEqual(len(body[0]["reviews"]), 1)
+
+    def test_spatial_search_does_not_query_per_place(self):
+        with assert_max_queries(self, db.engine, 4):
+            response = self.client.get("/api/v1/places/?lat=24.1&lon=46&radius_km=100")
+        self.assertEqual(len(response.get_json()), 25)
+
+    def test_detail_query_count(self):
+        with assert_max_queries(self, db.engine, 2):
+            response = self.client.get(f"/api/v1/places/{self.place_id}")
+        body = response.get_json()
+        self.assertEqual(sorted(a["name"] for a in body["amenities"]), ["Pool", "Wi-Fi"])
+        self.assertEqual(len(body["reviews"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
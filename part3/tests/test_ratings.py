@@ -0,0 +1,223 @@
+import unittest
+from unittest import mock
+
+import app
+from app.extensions import db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestRatingAggregates(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        self.owner = User(email="owner@example.com", password_hash="x")
+        self.guest = User(email="guest@example.com", password_hash="x")
+        self.loft = Place(title="Loft", price=80, owner=self.owner)
+        self.cabin = Place(title="Cabin", price=60, owner=self.owner)
+        db.session.add_all([self.owner, self.guest, self.loft, self.cabin])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _review(self, place, rating):
+        return self.facade.create_review(text="ok", rating=rating,
+                                         user_id=self.guest.id, place_id=place.id)
+
+    def assertAggregates(self, place, reviews, avg):
+        db.session.refresh(place)
+        self.assertEqual(place.review_count, reviews)
+        self.assertAlmostEqual(place.avg_rating, avg)
+
+    def test_create_update_delete(self):
+        first = self._review(self.loft, 4)
+        self._review(self.loft, 5)
+        self.assertAggregates(self.loft, 2, 4.5)
+
+        self.facade.update_review(first.id, rating=2)
+        self.assertAggregates(self.loft, 2, 3.5)
+
+        self.facade.update_review(first.id, place_id=self.cabin.id)
+        self.assertAggregates(self.loft, 1, 5.0)
+        self.assertAggregates(self.cabin, 1, 2.0)
+
+        self.facade.delete_review(first.id)
+        self.assertAggregates(self.cabin, 0, 0.0)
+
+    def test_unrated_review_counts_but_does_not_move_average(self):
+        self._review(self.loft, 4)
+        self._review(self.loft, None)
+        self.assertAggregates(self.loft, 2, 4.0)
+
+    def test_deleting_user_removes_their_ratings(self):
+        self._review(self.loft, 3)
+        self.facade.delete_user(self.guest.id)
+        self.assertAggregates(self.loft, 0, 0.0)
+
+    def test_recompute_repairs_drift(self):
+        db.session.add(Review(text="raw", rating=1, user_id=self.guest.id, place_id=self.loft.id))
+        db.session.commit()
+        self.assertAggregates(self.loft, 0, 0.0)
+        self.assertEqual(self.facade.recompute_place_ratings(), 2)
+        self.assertAggregates(self.loft, 1, 1.0)
+        self.assertAggregates(self.cabin, 0, 0.0)
+
+    def test_aggregates_cannot_be_written_directly(self):
+        with self.assertRaises(ValueError):
+            self.facade.update_place(self.loft.id, avg_rating=5)
+
+    def test_sort_and_filter_by_rating(self):
+        self._review(self.loft, 5)
+        self._review(self.cabin, 3)
+        response = self.client.get("/api/v1/places/?sort=-rating")
+        self.assertEqual([p["title"] for p in response.get_json()], ["Loft", "Cabin"])
+        self.assertEqual(response.get_json()[0]["avg_rating"], 5.0)
+
+        response = self.client.get("/api/v1/places/?min_rating=4&count=1")
+        self.assertEqual([p["title"] for p in response.get_json()], ["Loft"])
+        self.assertEqual(response.headers["X-Total-Count"], "1")
+
+    def test_rating_pages_follow_cursor(self):
+        for i in range(3):
+            self.facade.create_place(title=f"Extra {i}", price=10, owner_id=self.owner.id)
+        self._review(self.loft, 5)
+        titles, url = [], "/api/v1/places/?sort=-rating&limit=2"
+        while url:
+            response = self.client.get(url)
+            titles += [p["title"] for p in response.get_json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            url = f"/api/v1/places/?sort=-rating&limit=2&cursor={cursor}" if cursor else None
+        self.assertEqual(len(titles), 5)
+        self.assertEqual(titles[0], "Loft")
+
+
+class TestHbnbRatingAggregates(unittest.TestCase):
+    """The same aggregates on the hbnb app, kept by its reviews blueprint."""
+
+    def setUp(self):
+        from flask_jwt_extended import create_access_token
+        from hbnb.config import TestingConfig
+        from hbnb.app import create_app as create_hbnb_app
+        from hbnb.extensions import db as hbnb_db
+        from hbnb.models.place import Place as HbnbPlace
+        from hbnb.models.user import User as HbnbUser
+        self.app = create_hbnb_app(TestingConfig)
+        self.client = self.app.test_client()
+        self.db = hbnb_db
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.db.create_all()
+        owner = HbnbUser(email="owner@example.com", password_hash="x")
+        guest = HbnbUser(email="guest@example.com", password_hash="x")
+        self.db.session.add_all([owner, guest])
+        self.db.session.flush()
+        self.place = HbnbPlace(name="Loft", owner_id=owner.id)
+        self.db.session.add(self.place)
+        self.db.session.commit()
+        self.place_id = self.place.id
+        self.guest_id = guest.id
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity=guest.id)}"}
+
+    def tearDown(self):
+        self.db.session.remove()
+        self.db.drop_all()
+        self.ctx.pop()
+
+    def assertAggregates(self, reviews, avg):
+        self.db.session.refresh(self.place)
+        self.assertEqual(self.place.review_count, reviews)
+        self.assertAlmostEqual(self.place.avg_rating, avg)
+
+    def test_create_update_delete(self):
+        response = self.client.post(f"/api/v1/places/{self.place_id}/reviews",
+                                    json={"text": "ok", "rating": "4"}, headers=self.headers)
+        self.assertEqual(response.status_code, 201)
+        review_id = response.get_json()["id"]
+        self.assertEqual(response.get_json()["rating"], 4)
+        self.assertAggregates(1, 4.0)
+
+        response = self.client.put(f"/api/v1/reviews/{review_id}", json={"rating": "5"},
+                                   headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertAggregates(1, 5.0)
+
+        response = self.client.delete(f"/api/v1/reviews/{review_id}", headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertAggregates(0, 0.0)
+
+    def test_invalid_rating_is_rejected(self):
+        response = self.client.post(f"/api/v1/places/{self.place_id}/reviews",
+                                    json={"text": "ok", "rating": 3}, headers=self.headers)
+        review_id = response.get_json()["id"]
+        for rating in ("five", True, 4.5, None, [1], 0, 6, "-1"):
+            response = self.client.put(f"/api/v1/reviews/{review_id}", json={"rating": rating},
+                                       headers=self.headers)
+            self.assertEqual(response.status_code, 400, rating)
+        for rating in ("x", 0, 10):
+            response = self.client.post(f"/api/v1/places/{self.place_id}/reviews",
+                                        json={"text": "ok", "rating": rating},
+                                        headers=self.headers)
+            self.assertEqual(response.status_code, 400, rating)
+        self.assertAggregates(1, 3.0)
+
+    def test_legacy_rating_is_replaced_by_its_summed_value(self):
+        from hbnb.models.place import recompute_ratings
+        from hbnb.models.review import Review as HbnbReview
+        for rating in ("great", 9):
+            review = HbnbReview(text="old", rating=rating, user_id=self.guest_id,
+                                place_id=self.place_id)
+            self.db.session.add(review)
+            self.db.session.commit()
+            recompute_ratings(self.place_id)
+            response = self.client.put(f"/api/v1/reviews/{review.id}", json={"rating": 2},
+                                       headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertAggregates(1, 2.0)
+            response = self.client.delete(f"/api/v1/reviews/{review.id}",
+                                          headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertAggregates(0, 0.0)
+
+    def test_recompute_adds_missing_aggregate_columns(self):
+        from hbnb.models.review import Review as HbnbReview
+        self.db.session.add(HbnbReview(text="raw", rating=4, user_id=self.place.owner_id,
+                                       place_id=self.place_id))
+        self.db.session.commit()
+        self.db.session.remove()
+        with self.db.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_places_avg_rating")
+            for column in ("avg_rating", "rating_sum", "review_count"):
+                conn.exec_driver_sql(f"ALTER TABLE places DROP COLUMN {column}")
+        with mock.patch("hbnb.app.create_app", return_value=self.app):
+            import recompute_ratings as script
+            self.assertEqual(script.recompute_hbnb(), 1)
+        self.place = self.db.session.get(type(self.place), self.place_id)
+        self.assertAggregates(1, 4.0)
+
+    def test_recompute_repairs_drift(self):
+        from hbnb.models.place import recompute_ratings
+        from hbnb.models.review import Review as HbnbReview
+        self.db.session.add(HbnbReview(text="raw", rating=2, user_id=self.place.owner_id,
+                                       place_id=self.place_id))
+        self.db.session.commit()
+        self.assertAggregates(0, 0.0)
+        with mock.patch("hbnb.app.create_app", return_value=self.app):
+            import recompute_ratings as script
+            self.assertEqual(script.recompute_hbnb(self.place_id), 1)
+        self.assertAggregates(1, 2.0)
+        self.assertEqual(recompute_ratings(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+import app
+import config
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+from query_counter import assert_max_queries
+
+create_app = app.create_app
+
+
+class TestReadWriteRouting(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        path = os.path.join(self.data_dir, "hbnb.db")
+        config.config["routing-test"] = type("RoutingTest", (config.TestingConfig,), {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+            "SQLALCHEMY_READ_URI": "readonly",
+            "HTTP_CACHE": False,
+            "ENTITY_CACHE": False,
+        })
+        try:
+            self.app = create_app("routing-test")
+        finally:
+            del config.config["routing-test"]
+        self.client = self.app.test_client()
+        self.read_engine = self.app.extensions["read_engine"]
+        self.facade = HBnBFacade()
+        with self.app.app_context():
+            self.primary = db.engine
+            owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+            self.owner_id = owner.id
+            self.place_id = self.facade.create_place(title="Loft", price=80,
+                                                     owner_id=owner.id).id
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        self.read_engine.dispose()
+        shutil.rmtree(self.data_dir)
+
+    def test_get_requests_read_from_read_engine(self):
+        with assert_max_queries(self, self.primary, 0):
+            response = self.client.get(f"/api/v1/places/{self.place_id}")
+        self.assertEqual(response.get_json()["title"], "Loft")
+        with assert_max_queries(self, self.primary, 0):
+            self.assertEqual(len(self.client.get("/api/v1/places/").get_json()), 1)
+
+    def test_read_engine_is_read_only(self):
+        with self.read_engine.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute(text("DELETE FROM places"))
+
+    def test_writes_go_to_primary_and_pin_the_request(self):
+        with self.app.test_request_context("/", method="GET"):
+            with assert_max_queries(self, self.primary, 0) as statements:
+                self.facade.get_place(self.place_id)
+            self.assertEqual(statements, [])
+            self.facade.update_place(self.place_id, price=99)
+            with assert_max_queries(self, self.read_engine, 0):
+                self.assertEqual(self.facade.get_place(self.place_id).price, 99)
+            db.session.remove()
+
+    def test_write_requests_stay_on_primary(self):
+        with self.app.test_request_context("/", method="POST"):
+            with assert_max_queries(self, self.read_engine, 0):
+                self.facade.get_place(self.place_id)
+            db.session.remove()
+
+    def test_without_request_everything_uses_primary(self):
+        with self.app.app_context():
+            with assert_max_queries(self, self.read_engine, 0):
+                self.assertEqual(self.facade.count_places(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
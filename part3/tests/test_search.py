@@ -0,0 +1,123 @@
+import unittest
+from unittest import mock
+
+import app
+from app.extensions import db
+from app.persistence import search
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestFullTextSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        self.owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        # Filler rows, so that bm25 sees the searched words as rare.
+        for i in range(10):
+            place = self.facade.create_place(title=f"Room {i}", description="A room",
+                                             price=50, owner_id=self.owner.id)
+            self.facade.create_review(text="Fine", rating=3, user_id=self.owner.id,
+                                      place_id=place.id)
+        self.loft = self.facade.create_place(title="Sunny loft", description="Top floor",
+                                             price=80, owner_id=self.owner.id)
+        self.cabin = self.facade.create_place(title="Cabin", description="Sunny garden",
+                                              price=60, owner_id=self.owner.id)
+        self.barn = self.facade.create_place(title="Barn", price=40, owner_id=self.owner.id)
+        self.review = self.facade.create_review(text="Sunny & <quiet>, very clean",
+                                                rating=5, user_id=self.owner.id,
+                                                place_id=self.barn.id)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def ids(self, q, **kwargs):
+        return [place.id for place, _, _ in self.facade.search_places(q, **kwargs)]
+
+    def test_ranks_title_then_description_then_reviews(self):
+        self.assertEqual(self.ids("sunny"), [self.loft.id, self.cabin.id, self.barn.id])
+        self.assertEqual(self.ids("sunny", limit=2), [self.loft.id, self.cabin.id])
+
+    def test_all_words_must_match_and_words_are_stemmed(self):
+        self.assertEqual(self.ids("sunny garden"), [self.cabin.id])
+        self.assertEqual(self.ids("cleaning"), [self.barn.id])
+        self.assertEqual(self.ids("gard*"), [self.cabin.id])
+        self.assertEqual(self.ids("sunny snow"), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        for q in ('"sunny', "sunny AND", "NEAR(sunny", "title:sunny", "-sunny"):
+            self.facade.search_places(q)  # no FTS5 syntax error
+        with self.assertRaises(ValueError):
+            self.facade.search_places(" *&! ")
+
+    def test_snippet_is_escaped_and_highlighted(self):
+        [(place, score, snippet)] = self.facade.search_places("quiet")
+        self.assertEqual(place.id, self.barn.id)
+        self.assertGreater(score, 0)
+        self.assertEqual(snippet, "Sunny &amp; &lt;<mark>quiet</mark>&gt;, very clean")
+
+    def test_index_follows_writes(self):
+        self.facade.update_place(self.loft.id, title="Shady loft")
+        self.assertEqual(self.ids("sunny"), [self.cabin.id, self.barn.id])
+        self.assertEqual(self.ids("shady"), [self.loft.id])
+        self.facade.update_review(self.review.id, text="Dark")
+        self.assertEqual(self.ids("sunny"), [self.cabin.id])
+        self.facade.delete_place(self.cabin.id)
+        self.assertEqual(self.ids("sunny"), [])
+        self.facade.bulk_create_places([{"title": "Sunny villa", "price": 90}],
+                                       owner_id=self.owner.id)
+        self.assertEqual(len(self.ids("sunny")), 1)
+
+    def test_window_ranks_newest_matches_only(self):
+        with mock.patch.object(HBnBFacade, "SEARCH_WINDOW", 1):  # per index
+            self.assertEqual(self.ids("sunny"), [self.cabin.id, self.barn.id])
+
+    def test_create_indexes_existing_rows(self):
+        with db.engine.begin() as conn:
+            search.drop(conn)
+        db.create_all()
+        self.assertEqual(self.ids("sunny"), [self.loft.id, self.cabin.id, self.barn.id])
+
+    def test_renumbered_rowids_keep_hits_on_their_rows(self):
+        # What VACUUM may do to a table without an INTEGER PRIMARY KEY.
+        with db.engine.begin() as conn:
+            for table in ("places", "reviews"):
+                conn.exec_driver_sql(f"UPDATE {table} SET rowid = 1000 - rowid")
+        self.assertEqual(self.ids("sunny"), [self.loft.id, self.cabin.id, self.barn.id])
+        self.assertEqual(self.ids("quiet"), [self.barn.id])
+        self.facade.delete_place(self.cabin.id)
+        self.assertEqual(self.ids("sunny"), [self.loft.id, self.barn.id])
+
+    def test_create_replaces_rowid_keyed_index(self):
+        with db.engine.begin() as conn:
+            search.drop(conn)
+            conn.exec_driver_sql("CREATE VIRTUAL TABLE places_fts USING fts5(title, description, "
+                                 "content='places', content_rowid='rowid')")
+        db.create_all()
+        self.assertEqual(self.ids("sunny"), [self.loft.id, self.cabin.id, self.barn.id])
+
+    def test_endpoint(self):
+        response = self.client.get("/api/v1/places/search?q=Sunny+garden")
+        self.assertEqual(response.status_code, 200)
+        [item] = response.get_json()
+        self.assertEqual(item["id"], self.cabin.id)
+        self.assertEqual(item["title"], "Cabin")
+        self.assertEqual(item["snippet"], "<mark>Sunny</mark> <mark>garden</mark>")
+        self.assertNotIn("reviews", item)
+
+        self.assertEqual(len(self.client.get("/api/v1/places/search?q=sunny&limit=1")
+                             .get_json()), 1)
+        for query in ("", "?q=", "?q=sunny&limit=0"):
+            response = self.client.get(f"/api/v1/places/search{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
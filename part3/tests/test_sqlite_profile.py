@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, text
+
+import app
+import config
+from app.extensions import db
+from hbnb_common.sqlite_profile import apply_pragmas
+
+create_app = app.create_app
+
+
+class TestSqliteProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_production_profile_applied_on_connect(self):
+        path = os.path.join(self.data_dir, "hbnb.db")
+        config.config["profile-test"] = type("ProfileTest", (config.ProductionConfig,), {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+            "PASSWORD_HASH_ROUNDS": 4,
+        })
+        try:
+            flask_app = create_app("profile-test")
+        finally:
+            del config.config["profile-test"]
+        with flask_app.app_context():
+            with db.engine.connect() as conn:
+                pragma = lambda name: conn.execute(text(f"PRAGMA {name}")).scalar()
+                self.assertEqual(pragma("journal_mode"), "wal")
+                self.assertEqual(pragma("synchronous"), 1)  # NORMAL
+                self.assertEqual(pragma("busy_timeout"), 5000)
+                self.assertEqual(pragma("cache_size"), -64000)
+                self.assertEqual(pragma("temp_store"), 2)  # MEMORY
+            self.assertEqual(db.engine.pool.size(), 10)
+            db.engine.dispose()
+
+    def test_in_memory_database_skips_wal(self):
+        engine = create_engine("sqlite://")
+        apply_pragmas(engine, {"journal_mode": "WAL", "busy_timeout": 250})
+        with engine.connect() as conn:
+            self.assertEqual(conn.execute(text("PRAGMA busy_timeout")).scalar(), 250)
+            self.assertEqual(conn.execute(text("PRAGMA journal_mode")).scalar(), "memory")
+
+    def test_rejects_unsafe_values(self):
+        engine = create_engine("sqlite://")
+        with self.assertRaises(ValueError):
+            apply_pragmas(engine, {"journal_mode": "WAL; DROP TABLE users"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import json
+import unittest
+from unittest import mock
+
+import app
+from app.extensions import db
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+def ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+class TestNdjsonStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        self.facade = HBnBFacade()
+        with self.app.app_context():
+            owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+            wifi = self.facade.create_amenity(name="Wifi")
+            self.place_ids = []
+            for i in range(12):
+                place = self.facade.create_place(title=f"Place {i}", price=10 * i,
+                                                 owner_id=owner.id)
+                self.place_ids.append(place.id)
+                self.facade.create_review(text=f"Review {i}", rating=1 + i % 5,
+                                          user_id=owner.id, place_id=place.id)
+            self.facade.add_amenity_to_place(self.place_ids[0], wifi.id)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_stream_matches_json_list(self):
+        for path in ("/api/v1/places/?sort=-price", "/api/v1/reviews/",
+                     "/api/v1/amenities/", "/api/v1/users/"):
+            expected = self.client.get(path).get_json()
+            response = self.client.get(path, headers={"Accept": "application/x-ndjson"})
+            self.assertEqual(response.status_code, 200, path)
+            self.assertEqual(response.mimetype, "application/x-ndjson")
+            self.assertTrue(response.is_streamed)
+            self.assertEqual(ndjson(response), expected, path)
+
+    def test_stream_query_parameter(self):
+        response = self.client.get("/api/v1/reviews/?stream=1")
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertEqual(len(ndjson(response)), 12)
+        self.assertEqual(self.client.get("/api/v1/reviews/").mimetype, "application/json")
+
+    def test_stream_is_not_capped_by_page_size(self):
+        self.app.config["API_MAX_PAGE_SIZE"] = 5
+        self.assertEqual(len(self.client.get("/api/v1/places/").get_json()), 5)
+        self.assertEqual(len(ndjson(self.client.get("/api/v1/places/?stream=1"))), 12)
+
+    def test_stream_honours_filters_limit_and_cursor(self):
+        rows = ndjson(self.client.get("/api/v1/places/?stream=1&sort=price&min_price=30&limit=4"))
+        self.assertEqual([p["price"] for p in rows], [30, 40, 50, 60])
+        cursor = self.client.get("/api/v1/places/?sort=price&limit=4").headers["X-Next-Cursor"]
+        rows = ndjson(self.client.get(f"/api/v1/places/?stream=1&sort=price&cursor={cursor}"))
+        self.assertEqual([p["price"] for p in rows], [10 * i for i in range(4, 12)])
+
+    def test_stream_errors_are_plain_400s(self):
+        self.assertEqual(self.client.get("/api/v1/places/?stream=1&sort=name").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/reviews/?stream=1&limit=0").status_code, 400)
+
+    def test_streamed_places_carry_relationships(self):
+        rows = ndjson(self.client.get("/api/v1/places/?stream=1"))
+        by_id = {p["id"]: p for p in rows}
+        self.assertEqual([a["name"] for a in by_id[self.place_ids[0]]["amenities"]], ["Wifi"])
+        self.assertTrue(all(len(p["reviews"]) == 1 for p in rows))
+
+    def test_streamed_response_is_tagged_but_not_cached(self):
+        response = self.client.get("/api/v1/amenities/?stream=1")
+        self.assertEqual(len(ndjson(response)), 1)
+        self.assertEqual(len(self.app.extensions["http_cache"]), 0)
+        again = self.client.get("/api/v1/amenities/?stream=1",
+                                headers={"If-None-Match": response.headers["ETag"]})
+        self.assertEqual(again.status_code, 304)
+
+    @mock.patch.object(HBnBFacade, "STREAM_BATCH_SIZE", 5)
+    def test_iterator_fetches_in_batches(self):
+        with self.app.app_context():
+            reviews = self.facade.iter_reviews()
+            first = next(reviews)
+            # One batch is buffered; the rest is still behind the cursor.
+            self.assertEqual(len(db.session.identity_map), 5)
+            self.assertEqual(1 + sum(1 for _ in reviews), 12)
+            self.assertTrue(first.text.startswith("Review"))
+
+
+if __name__ == "__main__":
+    unittest.main()
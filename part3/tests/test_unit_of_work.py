@@ -0,0 +1,118 @@
+import unittest
+from unittest import mock
+
+from sqlalchemy import event
+
+import app
+from app.extensions import db
+from app.models.place import Place
+from app.services import versions
+from app.services.hbnb_facade import HBnBFacade
+
+create_app = app.create_app
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.facade = HBnBFacade()
+        self.owner = self.facade.create_user(email="owner@example.com", password_hash="x")
+        self.amenities = [self.facade.create_amenity(name=f"A{i}") for i in range(10)]
+        self.commits = 0
+        event.listen(db.session, "after_commit", self._count_commit)
+
+    def tearDown(self):
+        event.remove(db.session, "after_commit", self._count_commit)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count_commit(self, session):
+        self.commits += 1
+
+    def test_single_commit(self):
+        with self.facade.unit_of_work():
+            place = self.facade.create_place(title="Loft", price=80, owner_id=self.owner.id)
+            for amenity in self.amenities:
+                self.facade.add_amenity_to_place(place.id, amenity.id)
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        db.session.expire_all()
+        self.assertEqual(len(db.session.get(Place, place.id).amenities), 10)
+
+    def test_error_rolls_back_everything(self):
+        before = versions.current("places")
+        with self.assertRaises(KeyError):
+            with self.facade.unit_of_work():
+                self.facade.create_place(title="Loft", price=80, owner_id=self.owner.id)
+                raise KeyError("boom")
+        self.assertEqual(self.commits, 0)
+        self.assertEqual(self.facade.count_places(), 0)
+        self.assertEqual(versions.current("places"), before)
+
+    def test_nested_units_join_the_outer_one(self):
+        with self.facade.unit_of_work():
+            with self.facade.unit_of_work():
+                self.facade.create_place(title="A", price=1, owner_id=self.owner.id)
+            self.assertEqual(self.commits, 0)
+            self.facade.create_place(title="B", price=2, owner_id=self.owner.id)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self.facade.count_places(), 2)
+
+    def test_swallowed_nested_failure_dooms_outer_unit(self):
+        with self.assertRaises(RuntimeError):
+            with self.facade.unit_of_work():
+                self.facade.create_place(title="A", price=1, owner_id=self.owner.id)
+                try:
+                    with self.facade.unit_of_work():
+                        raise ValueError("bad")
+                except ValueError:
+                    pass
+        self.assertEqual(self.facade.count_places(), 0)
+        # The session is usable again afterwards.
+        self.facade.create_place(title="B", price=1, owner_id=self.owner.id)
+        self.assertEqual(self.facade.count_places(), 1)
+
+
+class TestRepositoryUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        from hbnb.config import Config
+        with mock.patch.object(Config, "SQLALCHEMY_DATABASE_URI", "sqlite://"):
+            from hbnb.app import create_app as create_hbnb_app
+            self.app = create_hbnb_app()
+        from hbnb.extensions import db as hbnb_db
+        self.db = hbnb_db
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.db.create_all()
+
+    def tearDown(self):
+        self.db.session.remove()
+        self.db.drop_all()
+        self.ctx.pop()
+
+    def test_add_and_delete_share_one_commit(self):
+        from hbnb.models.user import User
+        from hbnb.repositories.user_repository import UserRepository
+        repo = UserRepository()
+        with self.assertRaises(RuntimeError):
+            with repo.unit_of_work():
+                repo.add(User(email="a@example.com", password_hash="x"))
+                raise RuntimeError("abort")
+        self.assertEqual(repo.get_all(User), [])
+
+        with repo.unit_of_work():
+            keep = repo.add(User(email="b@example.com", password_hash="x"))
+            gone = repo.add(User(email="c@example.com", password_hash="x"))
+            repo.delete(gone)
+        keep_email = keep.email
+        self.db.session.remove()
+        self.assertEqual([u.email for u in repo.get_all(User)], [keep_email])
+
+
+if __name__ == "__main__":
+    unittest.main()
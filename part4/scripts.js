@@ -44,25 +44,43 @@ async function loginUser(email, password) {
   return token;
 }
 
-async function fetchPlaces(token) {
-  const url = `${API_BASE_URL}/places/`;
+async function fetchPlaces(token, maxPrice = null, signal = undefined) {
   const headers = { "Content-Type": "application/json" };
   if (token) headers.Authorization = `Bearer ${token}`;
 
-  const response = await fetch(url, {
-    method: "GET",
-    headers
-  });
+  // Filtering happens on the server so only matching places are sent.
+  // The list endpoint is paginated: follow X-Next-Cursor until the last page.
+  const places = [];
+  let cursor = null;
+  do {
+    const params = new URLSearchParams();
+    if (maxPrice !== null) {
+      params.set("max_price", String(maxPrice));
+      params.set("sort", "price");
+    }
+    if (cursor) params.set("cursor", cursor);
+    const query = params.toString();
+    const url = `${API_BASE_URL}/places/${query ? `?${query}` : ""}`;
+
+    const response = await fetch(url, {
+      method: "GET",
+      headers,
+      signal
+    });
 
-  let data = [];
-  try { data = await response.json(); } catch (e) {}
+    let data = [];
+    try { data = await response.json(); } catch (e) {}
 
-  if (!response.ok) {
-    const msg = (data && (data.message || data.error)) || response.statusText || "Failed to fetch places";
-    throw new Error(msg);
-  }
+    if (!response.ok) {
+      const msg = (data && (data.message || data.error)) || response.statusText || "Failed to fetch places";
+      throw new Error(msg);
+    }
 
-  return Array.isArray(data) ? data : [];
+    if (Array.isArray(data)) places.push(...data);
+    cursor = response.headers.get("X-Next-Cursor");
+  } while (cursor);
+
+  return places;
 }
 
 async function submitReview(token, placeId, text, rating) {
@@ -137,7 +155,6 @@ function renderPlaces(places) {
   for (const place of places) {
     const card = document.createElement("article");
     card.className = "place-card";
-    card.dataset.price = String(place.price ?? "");
 
     const title = place.title || place.name || "Untitled";
     const price = place.price ?? 0;
@@ -210,17 +227,35 @@ function renderReviews(reviews) {
   }
 }
 
-function applyPriceFilter(maxPrice) {
-  const listEl = document.getElementById("places-list");
-  if (!listEl) return;
+function selectedMaxPrice() {
+  const priceFilterEl = document.getElementById("price-filter");
+  if (!priceFilterEl || priceFilterEl.value === "all") return null;
+  return Number(priceFilterEl.value);
+}
 
-  const cards = listEl.querySelectorAll(".place-card");
-  for (const card of cards) {
-    const priceRaw = card.dataset.price;
-    const price = Number(priceRaw);
-    const show = maxPrice === null || (Number.isFinite(price) && price <= maxPrice);
-    card.style.display = show ? "" : "none";
-  }
+// The places request in flight. A new one aborts it, so a slow response
+// for an older filter can never replace the list of a newer one.
+let placesRequest = null;
+
+function loadPlaces(token) {
+  const placesListEl = document.getElementById("places-list");
+  if (!placesListEl) return Promise.resolve();
+
+  if (placesRequest) placesRequest.abort();
+  const request = new AbortController();
+  placesRequest = request;
+
+  return fetchPlaces(token, selectedMaxPrice(), request.signal)
+    .then((places) => {
+      if (!request.signal.aborted) renderPlaces(places);
+    })
+    .catch((err) => {
+      if (request.signal.aborted) return;
+      placesListEl.innerHTML = "";
+      const msg = document.createElement("p");
+      msg.textContent = err.message;
+      placesListEl.appendChild(msg);
+    });
 }
 
 document.addEventListener("DOMContentLoaded", () => {
@@ -256,28 +291,12 @@ document.addEventListener("DOMContentLoaded", () => {
   const placesListEl = document.getElementById("places-list");
 
   if (placesListEl) {
-    const token = getCookie("token");
-    fetchPlaces(token)
-      .then((places) => {
-        renderPlaces(places);
-        if (priceFilterEl) {
-          const val = priceFilterEl.value;
-          applyPriceFilter(val === "all" ? null : Number(val));
-        }
-      })
-      .catch((err) => {
-        placesListEl.innerHTML = "";
-        const msg = document.createElement("p");
-        msg.textContent = err.message;
-        placesListEl.appendChild(msg);
-      });
+    loadPlaces(getCookie("token"));
   }
 
-  if (priceFilterEl) {
-    priceFilterEl.addEventListener("change", (event) => {
-      const value = event.target.value;
-      const maxPrice = value === "all" ? null : Number(value);
-      applyPriceFilter(maxPrice);
+  if (priceFilterEl && placesListEl) {
+    priceFilterEl.addEventListener("change", () => {
+      loadPlaces(getCookie("token"));
     });
   }
 